@@ -15,6 +15,7 @@ import re
 import sys
 from builtins import range
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 
@@ -30,6 +31,10 @@ from awsbatch.utils import (
 )
 
 AWS_BATCH_JOB_STATUS = ["SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING", "SUCCEEDED", "FAILED"]
+# Maximum number of jobs that can be retrieved with a single describe_jobs call
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+# Maximum number of describe_jobs calls submitted concurrently
+DESCRIBE_JOBS_MAX_WORKERS = 10
 
 
 def _get_parser():
@@ -282,6 +287,8 @@ class AWSBstatCommand:
         self.output = Output(mapping=mapping)
         self.boto3_factory = boto3_factory
         self.batch_client = boto3_factory.get_client("batch")
+        # Jobs already described by the command, by job id
+        self.__described_jobs = {}
 
     def run(self, job_status, expand_children, job_queue=None, job_ids=None, show_details=False):
         """Print list of jobs, by filtering by queue or by ids."""
@@ -410,16 +417,41 @@ class AWSBstatCommand:
 
         describe_jobs API call has a hard limit on the number of job that can be
         retrieved with a single call. In case job_ids has more than 100 items, this function
-        distributes the describe_jobs call across multiple requests.
+        distributes the describe_jobs call across multiple concurrent requests.
+        Duplicated ids and jobs already described by the command are not described again.
 
         :param job_ids: list of ids for the jobs to describe.
         :return: list of described jobs.
         """
-        jobs = []
-        for index in range(0, len(job_ids), 100):
-            jobs_chunk = job_ids[index : index + 100]  # noqa: E203
-            jobs.extend(self.batch_client.describe_jobs(jobs=jobs_chunk)["jobs"])
-        return jobs
+        ids_to_describe = [job_id for job_id in OrderedDict.fromkeys(job_ids) if job_id not in self.__described_jobs]
+        chunks = [
+            ids_to_describe[index : index + DESCRIBE_JOBS_CHUNK_SIZE]  # noqa: E203
+            for index in range(0, len(ids_to_describe), DESCRIBE_JOBS_CHUNK_SIZE)
+        ]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), DESCRIBE_JOBS_MAX_WORKERS)) as executor:
+                # map returns the results in the order of the chunks
+                described_chunks = list(executor.map(self.__describe_jobs, chunks))
+        else:
+            described_chunks = [self.__describe_jobs(chunk) for chunk in chunks]
+
+        jobs = OrderedDict(
+            (job_id, self.__described_jobs[job_id]) for job_id in job_ids if job_id in self.__described_jobs
+        )
+        for described_jobs in described_chunks:
+            for job in described_jobs:
+                self.__described_jobs[job["jobId"]] = job
+                jobs.setdefault(job["jobId"], job)
+        return list(jobs.values())
+
+    def __describe_jobs(self, job_ids):
+        """
+        Describe the given jobs with a single describe_jobs call.
+
+        :param job_ids: list of at most 100 ids for the jobs to describe.
+        :return: list of described jobs.
+        """
+        return self.batch_client.describe_jobs(jobs=job_ids)["jobs"]
 
     def __add_jobs(self, jobs, details=False):
         """
@@ -446,3 +446,41 @@ class TestOutput:
         awsbstat.main(["-c", "cluster"] + args)
 
         assert capsys.readouterr().out == read_text(test_datadir / expected)
+
+
+@pytest.mark.usefixtures("convert_to_date_mock")
+def test_expanded_children_of_large_array_job(mocker, capsys):
+    parent_job_id = "3286a19c-68a9-47c9-8000-427d23ffc7ca"
+    array_size = 1050
+    described_job_ids = []
+
+    def _describe_jobs(jobs):
+        assert len(jobs) <= 100
+        described_job_ids.extend(jobs)
+        described_jobs = []
+        for job_id in jobs:
+            job = {"jobId": job_id, "jobName": "array-job", "createdAt": 1541000000000, "status": "SUCCEEDED"}
+            if job_id == parent_job_id:
+                job["arrayProperties"] = {"size": array_size}
+            described_jobs.append(job)
+        # describe_jobs does not preserve the order of the requested jobs
+        return {"jobs": list(reversed(described_jobs))}
+
+    boto3_factory = mocker.MagicMock()
+    boto3_factory.get_client.return_value.describe_jobs.side_effect = _describe_jobs
+
+    # the parent is requested twice and one of its children is requested explicitly
+    awsbstat.AWSBstatCommand(mocker.MagicMock(), boto3_factory).run(
+        job_status=DEFAULT_JOB_STATUS,
+        expand_children=True,
+        job_ids=[parent_job_id, parent_job_id, "{0}:1".format(parent_job_id)],
+    )
+
+    # every job is described only once, in chunks of at most 100 jobs
+    expected_job_ids = [parent_job_id] + ["{0}:{1}".format(parent_job_id, index) for index in range(array_size)]
+    assert sorted(described_job_ids) == sorted(expected_job_ids)
+    assert boto3_factory.get_client.return_value.describe_jobs.call_count == 12
+    # the parent is shown once, together with all its children
+    output_job_ids = [line.split()[0] for line in capsys.readouterr().out.splitlines()[2:]]
+    assert set(output_job_ids) == set(expected_job_ids)
+    assert output_job_ids.count(parent_job_id) == 1
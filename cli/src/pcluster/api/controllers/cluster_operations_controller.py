@@ -35,6 +35,7 @@ from pcluster.api.models import (
     Change,
     CloudFormationStackStatus,
     ClusterConfigurationStructure,
+    ClusterDescription,
     ClusterInfoSummary,
     ClusterStatus,
     CreateClusterBadRequestExceptionResponseContent,
@@ -42,6 +43,7 @@ from pcluster.api.models import (
     CreateClusterResponseContent,
     DeleteClusterResponseContent,
     DescribeClusterResponseContent,
+    DescribeClustersResponseContent,
     EC2Instance,
     Failure,
     InstanceState,
@@ -211,19 +213,73 @@ def describe_cluster(cluster_name, region=None):
     """
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
-    cfn_stack = cluster.stack
+    snapshot = cluster.describe_snapshot(include_creation_failure=_is_create_failed(cluster.stack))
+    return _snapshot_to_cluster_description(cluster_name, snapshot, DescribeClusterResponseContent)
 
-    fleet_status = cluster.compute_fleet_status
+
+@configure_aws_region()
+@convert_errors()
+def describe_clusters(region=None, cluster_names=None, next_token=None):
+    """
+    Get detailed information about multiple existing clusters at once.
+
+    :param region: AWS Region that the operation corresponds to.
+    :type region: str
+    :param cluster_names: Names of the clusters to describe. (Defaults to all clusters, paginated.)
+    :type cluster_names: List[str]
+    :param next_token: Token to use for paginated requests. It cannot be used together with clusterNames.
+    :type next_token: str
+
+    :rtype: DescribeClustersResponseContent
+    """
+    if cluster_names:
+        if next_token:
+            raise BadRequestException("nextToken cannot be used together with clusterNames.")
+        stacks = AWSApi.instance().cfn.describe_pcluster_stacks(stack_names=cluster_names)
+    else:
+        # All the clusters are described one page at a time, to bound the duration of the request
+        stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
+
+    clusters, incompatible_cluster_names = [], []
+    for stack in stacks:
+        cluster = Cluster(stack["StackName"], stack=ClusterStack(stack))
+        if check_cluster_version(cluster):
+            clusters.append(cluster)
+        else:
+            incompatible_cluster_names.append(cluster.name)
+    snapshots = Cluster.describe_snapshots(clusters, include_creation_failure=_is_create_failed)
+
+    found_cluster_names = {stack["StackName"] for stack in stacks}
+    return DescribeClustersResponseContent(
+        clusters=[
+            _snapshot_to_cluster_description(cluster.name, snapshot, ClusterDescription)
+            for cluster, snapshot in zip(clusters, snapshots)
+        ],
+        not_found_cluster_names=[name for name in cluster_names or [] if name not in found_cluster_names],
+        incompatible_cluster_names=incompatible_cluster_names,
+        next_token=next_token,
+    )
+
+
+def _is_create_failed(cfn_stack):
+    return cloud_formation_status_to_cluster_status(cfn_stack.status) == ClusterStatus.CREATE_FAILED
+
+
+def _snapshot_to_cluster_description(cluster_name, snapshot, description_class):
+    """Build the description of a cluster, i.e. a DescribeClusterResponseContent or a ClusterDescription."""
+    cfn_stack = snapshot.stack
+    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
+
+    fleet_status = snapshot.get("compute_fleet_status")
 
     config_url = "NOT_AVAILABLE"
     try:
-        config_url = cluster.config_presigned_url
+        config_url = snapshot.get("config_presigned_url")
     except ClusterActionError as e:
         # Do not fail request when S3 bucket is not available
         LOGGER.error(e)
 
-    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
-    response = DescribeClusterResponseContent(
+    description = description_class(
         creation_time=to_utc_datetime(cfn_stack.creation_time),
         version=cfn_stack.version,
         cluster_configuration=ClusterConfigurationStructure(url=config_url),
@@ -235,13 +291,13 @@ def describe_cluster(cluster_name, region=None):
         last_updated_time=to_utc_datetime(cfn_stack.last_updated_time),
         region=os.environ.get("AWS_DEFAULT_REGION"),
         cluster_status=cluster_status,
-        scheduler=Scheduler(type=cluster.stack.scheduler, metadata=cluster.get_plugin_metadata()),
-        failures=_get_creation_failures(cluster_status, cfn_stack),
+        scheduler=Scheduler(type=cfn_stack.scheduler, metadata=snapshot.get("plugin_metadata")),
+        failures=_get_creation_failures(cluster_status, snapshot),
     )
 
     try:
-        head_node = cluster.head_node_instance
-        response.head_node = EC2Instance(
+        head_node = snapshot.get("head_node_instance")
+        description.head_node = EC2Instance(
             instance_id=head_node.id,
             launch_time=to_utc_datetime(head_node.launch_time),
             public_ip_address=head_node.public_ip,
@@ -253,7 +309,7 @@ def describe_cluster(cluster_name, region=None):
         # This should not be treated as a failure cause head node might not be running in some cases
         LOGGER.info(e)
 
-    return response
+    return description
 
 
 @configure_aws_region()
@@ -447,9 +503,9 @@ def _create_message(failure_reason, action_needed):
     return message or "Error during update"
 
 
-def _get_creation_failures(cluster_status, cfn_stack):
+def _get_creation_failures(cluster_status, snapshot):
     """Get a list of Failure objects containing failure code and reason when cluster creation failed."""
     if cluster_status != ClusterStatus.CREATE_FAILED:
         return None
-    failure_code, failure_reason = cfn_stack.get_cluster_creation_failure()
+    failure_code, failure_reason = snapshot.get("creation_failure")
     return [Failure(failure_code=failure_code, failure_reason=failure_reason)]
@@ -24,7 +24,7 @@ from pcluster.api.errors import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, Cache
+from pcluster.aws.common import AWSClientError, Boto3ClientPool, Cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -91,11 +91,19 @@ class ParallelClusterFlaskApp:
         self.app.add_error_handler(AWSClientError, self._handle_aws_client_error)
         self.app.add_error_handler(Exception, self._handle_unexpected_exception)
 
+        # boto3 clients and cached results of data that does not change are reused across requests
+        self.client_pool = Boto3ClientPool()
+
         @self.flask_app.before_request
         def _clear_cache():
-            # Cache is meant to be reused only within a single request
-            Cache.clear_all()
+            # Request scoped results are meant to be reused only within a single request
+            Cache.clear_request_scoped()
             AWSApi.reset()
+            self.client_pool.activate()
+
+        @self.flask_app.teardown_request
+        def _deactivate_client_pool(_exception):  # pylint: disable=unused-variable
+            Boto3ClientPool.deactivate()
 
         @self.flask_app.before_request
         def _log_request():  # pylint: disable=unused-variable
@@ -125,6 +133,7 @@ class ParallelClusterFlaskApp:
                 response.status_code,
                 data,
             )
+            LOGGER.debug("Cache statistics: %s", Cache.stats())
             return response
 
     @staticmethod
@@ -0,0 +1,161 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=R0801
+
+
+from typing import List
+
+from pcluster.api import util
+from pcluster.api.models.base_model_ import Model
+from pcluster.api.models.cluster_description import ClusterDescription
+
+
+class DescribeClustersResponseContent(Model):
+    """NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+
+    Do not edit the class manually.
+    """
+
+    def __init__(self, next_token=None, clusters=None, not_found_cluster_names=None, incompatible_cluster_names=None):
+        """DescribeClustersResponseContent - a model defined in OpenAPI
+
+        :param next_token: The next_token of this DescribeClustersResponseContent.
+        :type next_token: str
+        :param clusters: The clusters of this DescribeClustersResponseContent.
+        :type clusters: List[ClusterDescription]
+        :param not_found_cluster_names: The not_found_cluster_names of this DescribeClustersResponseContent.
+        :type not_found_cluster_names: List[str]
+        :param incompatible_cluster_names: The incompatible_cluster_names of this DescribeClustersResponseContent.
+        :type incompatible_cluster_names: List[str]
+        """
+        self.openapi_types = {
+            "next_token": str,
+            "clusters": List[ClusterDescription],
+            "not_found_cluster_names": List[str],
+            "incompatible_cluster_names": List[str],
+        }
+
+        self.attribute_map = {
+            "next_token": "nextToken",
+            "clusters": "clusters",
+            "not_found_cluster_names": "notFoundClusterNames",
+            "incompatible_cluster_names": "incompatibleClusterNames",
+        }
+
+        self._next_token = next_token
+        self._clusters = clusters
+        self._not_found_cluster_names = not_found_cluster_names
+        self._incompatible_cluster_names = incompatible_cluster_names
+
+    @classmethod
+    def from_dict(cls, dikt) -> "DescribeClustersResponseContent":
+        """Returns the dict as a model
+
+        :param dikt: A dict.
+        :type: dict
+        :return: The DescribeClustersResponseContent of this DescribeClustersResponseContent.
+        :rtype: DescribeClustersResponseContent
+        """
+        return util.deserialize_model(dikt, cls)
+
+    @property
+    def next_token(self):
+        """Gets the next_token of this DescribeClustersResponseContent.
+
+        Token to use for paginated requests.
+
+        :return: The next_token of this DescribeClustersResponseContent.
+        :rtype: str
+        """
+        return self._next_token
+
+    @next_token.setter
+    def next_token(self, next_token):
+        """Sets the next_token of this DescribeClustersResponseContent.
+
+        Token to use for paginated requests.
+
+        :param next_token: The next_token of this DescribeClustersResponseContent.
+        :type next_token: str
+        """
+
+        self._next_token = next_token
+
+    @property
+    def clusters(self):
+        """Gets the clusters of this DescribeClustersResponseContent.
+
+
+        :return: The clusters of this DescribeClustersResponseContent.
+        :rtype: List[ClusterDescription]
+        """
+        return self._clusters
+
+    @clusters.setter
+    def clusters(self, clusters):
+        """Sets the clusters of this DescribeClustersResponseContent.
+
+
+        :param clusters: The clusters of this DescribeClustersResponseContent.
+        :type clusters: List[ClusterDescription]
+        """
+        if clusters is None:
+            raise ValueError("Invalid value for `clusters`, must not be `None`")
+
+        self._clusters = clusters
+
+    @property
+    def not_found_cluster_names(self):
+        """Gets the not_found_cluster_names of this DescribeClustersResponseContent.
+
+        Names of the requested clusters that do not exist.
+
+        :return: The not_found_cluster_names of this DescribeClustersResponseContent.
+        :rtype: List[str]
+        """
+        return self._not_found_cluster_names
+
+    @not_found_cluster_names.setter
+    def not_found_cluster_names(self, not_found_cluster_names):
+        """Sets the not_found_cluster_names of this DescribeClustersResponseContent.
+
+        Names of the requested clusters that do not exist.
+
+        :param not_found_cluster_names: The not_found_cluster_names of this DescribeClustersResponseContent.
+        :type not_found_cluster_names: List[str]
+        """
+        if not_found_cluster_names is None:
+            raise ValueError("Invalid value for `not_found_cluster_names`, must not be `None`")
+
+        self._not_found_cluster_names = not_found_cluster_names
+
+    @property
+    def incompatible_cluster_names(self):
+        """Gets the incompatible_cluster_names of this DescribeClustersResponseContent.
+
+        Names of the clusters that belong to an incompatible ParallelCluster major version, which are not described.
+
+        :return: The incompatible_cluster_names of this DescribeClustersResponseContent.
+        :rtype: List[str]
+        """
+        return self._incompatible_cluster_names
+
+    @incompatible_cluster_names.setter
+    def incompatible_cluster_names(self, incompatible_cluster_names):
+        """Sets the incompatible_cluster_names of this DescribeClustersResponseContent.
+
+        Names of the clusters that belong to an incompatible ParallelCluster major version, which are not described.
+
+        :param incompatible_cluster_names: The incompatible_cluster_names of this DescribeClustersResponseContent.
+        :type incompatible_cluster_names: List[str]
+        """
+        if incompatible_cluster_names is None:
+            raise ValueError("Invalid value for `incompatible_cluster_names`, must not be `None`")
+
+        self._incompatible_cluster_names = incompatible_cluster_names
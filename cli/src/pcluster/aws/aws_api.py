@@ -21,6 +21,7 @@ from pcluster.aws.imagebuilder import ImageBuilderClient
 from pcluster.aws.kms import KmsClient
 from pcluster.aws.logs import LogsClient
 from pcluster.aws.resource_groups import ResourceGroupsClient
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
 from pcluster.aws.route53 import Route53Client
 from pcluster.aws.s3 import S3Client
 from pcluster.aws.s3_resource import S3Resource
@@ -61,6 +62,7 @@ class AWSApi:
         self._secretsmanager = None
         self._ssm = None
         self._resource_groups = None
+        self._resource_groups_tagging = None
 
     @property
     def cfn(self):
@@ -181,6 +183,13 @@ class AWSApi:
             self._resource_groups = ResourceGroupsClient()
         return self._resource_groups
 
+    @property
+    def resource_groups_tagging(self):
+        """Resource Groups Tagging API client."""
+        if not self._resource_groups_tagging:
+            self._resource_groups_tagging = ResourceGroupsTaggingClient()
+        return self._resource_groups_tagging
+
     @staticmethod
     def instance():
         """Return the singleton AWSApi instance."""
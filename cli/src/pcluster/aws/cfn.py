@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import json
 import logging
 
@@ -20,12 +21,23 @@ from pcluster.utils import remove_none_values
 
 LOGGER = logging.getLogger(__name__)
 
+# Minimum number of stacks returned in a page by the stack listing, unless there are no more stacks
+LIST_STACKS_PAGE_SIZE = 50
+# Maximum number of DescribeStacks pages scanned in a single listing request when the Tagging API is not available
+LIST_STACKS_MAX_SCANNED_PAGES = 10
+# Maximum number of stacks found through the Tagging API that are described concurrently
+LIST_STACKS_DESCRIBE_MAX_WORKERS = 10
+# Prefixes of the listing tokens, telling if the token comes from the Tagging API or from DescribeStacks
+TAGGING_API_TOKEN_PREFIX = "tagging:"
+DESCRIBE_STACKS_TOKEN_PREFIX = "stacks:"
+
 
 class CfnClient(Boto3Client):
     """Implement CFN Boto3 client."""
 
     def __init__(self):
         super().__init__("cloudformation")
+        self._tagging_api_available = True
 
     @AWSExceptionHandler.handle_client_exception
     def create_stack(
@@ -149,9 +161,37 @@ class CfnClient(Boto3Client):
     @AWSExceptionHandler.handle_client_exception
     def list_pcluster_stacks(self, next_token=None):
         """List existing pcluster cluster stacks."""
-        stacks, result_token = self._list_parentless_stacks_with_tag(PCLUSTER_VERSION_TAG, next_token)
         # Only return stacks without image-id tag, which means they are cluster stacks.
-        return [stack for stack in stacks if StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None], result_token
+        return self._list_parentless_stacks_with_tag(
+            PCLUSTER_VERSION_TAG, next_token, stack_filter=self._is_cluster_stack
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_pcluster_stacks(self, stack_names=None):
+        """
+        Return all the existing pcluster cluster stacks or, if stack names are given, only the ones with those names.
+
+        Stacks are retrieved with a single sweep through DescribeStacks pages,
+        which is stopped as soon as all the requested stacks have been found.
+        """
+        pending_stack_names = set(stack_names) if stack_names is not None else None
+        stacks = []
+        if pending_stack_names == set():
+            return stacks
+        for stack in self._paginate_results(self._client.describe_stacks):
+            if pending_stack_names is not None and stack["StackName"] not in pending_stack_names:
+                continue
+            if self._is_listed_stack(stack, PCLUSTER_VERSION_TAG, self._is_cluster_stack):
+                stacks.append(stack)
+                if pending_stack_names is not None:
+                    pending_stack_names.remove(stack["StackName"])
+                    if not pending_stack_names:
+                        break
+        return stacks
+
+    @staticmethod
+    def _is_cluster_stack(stack):
+        return StackInfo(stack).get_tag(PCLUSTER_IMAGE_ID_TAG) is None
 
     def describe_stack_resource(self, stack_name: str, logic_resource_id: str):
         """Get stack resource information."""
@@ -173,14 +213,125 @@ class CfnClient(Boto3Client):
         """List existing imagebuilder stacks."""
         return self._list_parentless_stacks_with_tag(PCLUSTER_IMAGE_ID_TAG, next_token)
 
-    def _list_parentless_stacks_with_tag(self, tag, next_token=None):
-        describe_stacks_kwargs = {}
-        if next_token:
-            describe_stacks_kwargs["NextToken"] = next_token
+    def _list_parentless_stacks_with_tag(self, tag, next_token=None, stack_filter=None):
+        """
+        Return a page of root stacks having the given tag and the token to retrieve the next page.
+
+        Stacks are discovered with the Resource Groups Tagging API, which filters them server side,
+        so that the cost of the listing depends on the number of ParallelCluster stacks only.
+        If the Tagging API cannot be used (e.g. tag:GetResources permission is missing) all the stacks are scanned.
+        In both cases pages are filled up to LIST_STACKS_PAGE_SIZE stacks, so that empty pages are not returned
+        when other stacks are available.
+        The returned token is prefixed with its source, so that the next page is retrieved in the same way.
+        The Tagging API is eventually consistent, so a stack created a few moments before may not be listed yet.
+        """
+        token_prefix, next_token = self._split_list_token(next_token)
+        if token_prefix == TAGGING_API_TOKEN_PREFIX or (token_prefix is None and self._tagging_api_available):
+            try:
+                resources, next_tagging_token = self._get_stacks_with_tag(tag, next_token)
+            except AWSClientError as e:
+                if token_prefix == TAGGING_API_TOKEN_PREFIX:
+                    # The listing cannot be continued by scanning the stacks from a Tagging API token
+                    raise
+                LOGGER.info("Unable to list stacks through Resource Groups Tagging API, scanning all stacks: %s", e)
+                self._tagging_api_available = False
+            else:
+                stack_list, next_tagging_token = self._describe_tagged_stacks(
+                    tag, resources, next_tagging_token, stack_filter
+                )
+                return stack_list, self._join_list_token(TAGGING_API_TOKEN_PREFIX, next_tagging_token)
+        stack_list, next_token = self._scan_stacks_with_tag(tag, next_token, stack_filter)
+        return stack_list, self._join_list_token(DESCRIBE_STACKS_TOKEN_PREFIX, next_token)
+
+    @staticmethod
+    def _split_list_token(next_token):
+        """
+        Return the source prefix and the original token of the given listing token.
+
+        Tokens without prefix were returned by previous versions, which always scanned the stacks.
+        """
+        if not next_token:
+            return None, None
+        for token_prefix in (TAGGING_API_TOKEN_PREFIX, DESCRIBE_STACKS_TOKEN_PREFIX):
+            if next_token.startswith(token_prefix):
+                return token_prefix, next_token[len(token_prefix) :]  # noqa: E203
+        return DESCRIBE_STACKS_TOKEN_PREFIX, next_token
+
+    @staticmethod
+    def _join_list_token(token_prefix, next_token):
+        return f"{token_prefix}{next_token}" if next_token else None
+
+    @staticmethod
+    def _get_stacks_with_tag(tag, next_token):
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+
+        return AWSApi.instance().resource_groups_tagging.get_resources_with_tag("cloudformation:stack", tag, next_token)
 
-        result = self._client.describe_stacks(**describe_stacks_kwargs)
+    @staticmethod
+    def _is_listed_stack(stack, tag, stack_filter):
+        return (
+            stack.get("ParentId") is None
+            and stack.get("StackStatus") != "DELETE_COMPLETE"
+            and StackInfo(stack).get_tag(tag)
+            and (not stack_filter or stack_filter(stack))
+        )
+
+    @staticmethod
+    def _is_listed_tagged_resource(resource, stack_filter):
+        """Tell if a stack found through the Tagging API can be listed, by looking only at its tags."""
+        # Nested stacks are tagged by CloudFormation as the other resources of their parent stack
+        is_nested_stack = any(tag["Key"] == "aws:cloudformation:stack-id" for tag in resource.get("Tags", []))
+        return not is_nested_stack and (not stack_filter or stack_filter(resource))
+
+    def _describe_tagged_stacks(self, tag, resources, next_token, stack_filter):
+        stack_list = []
+        while True:
+            stack_arns = [
+                resource["ResourceARN"]
+                for resource in resources
+                if self._is_listed_tagged_resource(resource, stack_filter)
+            ]
+            if stack_arns:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(LIST_STACKS_DESCRIBE_MAX_WORKERS, len(stack_arns))
+                ) as executor:
+                    # map returns the stacks in the order of the ARNs
+                    stacks = list(executor.map(self._describe_tagged_stack, stack_arns))
+                stack_list.extend(
+                    stack for stack in stacks if stack and self._is_listed_stack(stack, tag, stack_filter)
+                )
+            if not next_token or len(stack_list) >= LIST_STACKS_PAGE_SIZE:
+                return stack_list, next_token
+            resources, next_token = self._get_stacks_with_tag(tag, next_token)
+
+    @AWSExceptionHandler.handle_client_exception
+    def _describe_tagged_stack(self, stack_arn):
+        """
+        Describe the given stack, return None if it does not exist anymore.
+
+        Throttled requests are retried by the boto3 client only, so that the listing is not slowed down by the
+        additional retries of describe_stack.
+        """
+        try:
+            return self._client.describe_stacks(StackName=stack_arn).get("Stacks")[0]
+        except ClientError as e:
+            if e.response["Error"]["Code"] == AWSClientError.ErrorCode.VALIDATION_ERROR.value:
+                # The stack has been deleted after being listed
+                return None
+            raise
+
+    def _scan_stacks_with_tag(self, tag, next_token, stack_filter):
         stack_list = []
-        for stack in result.get("Stacks", []):
-            if stack.get("ParentId") is None and StackInfo(stack).get_tag(tag):
-                stack_list.append(stack)
-        return stack_list, result.get("NextToken")
+        for _ in range(LIST_STACKS_MAX_SCANNED_PAGES):
+            describe_stacks_kwargs = {}
+            if next_token:
+                describe_stacks_kwargs["NextToken"] = next_token
+
+            result = self._client.describe_stacks(**describe_stacks_kwargs)
+            stack_list.extend(
+                stack for stack in result.get("Stacks", []) if self._is_listed_stack(stack, tag, stack_filter)
+            )
+            next_token = result.get("NextToken")
+            if not next_token or len(stack_list) >= LIST_STACKS_PAGE_SIZE:
+                break
+        return stack_list, next_token
@@ -9,11 +9,16 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import functools
+import hashlib
+import json
 import logging
 import os
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from typing import Dict
 
@@ -21,8 +26,13 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
+from pcluster.aws.persistent_cache import PersistentCache
+
 LOGGER = logging.getLogger(__name__)
 
+# The default boto3 session is not thread safe, so clients and resources are created one at a time
+_BOTO3_SESSION_LOCK = threading.Lock()
+
 
 class AWSClientError(Exception):
     """Error during execution of some AWS calls."""
@@ -127,6 +137,44 @@ class AWSExceptionHandler:
         return wrapper
 
 
+class AWSUsageCounter:
+    """
+    Count the AWS calls and the cache hits of the code running in the current execution context.
+
+    The active counter is bound to a context variable, so calls performed concurrently
+    by other threads or asyncio tasks are not counted.
+    """
+
+    _current = contextvars.ContextVar("aws_usage_counter", default=None)
+
+    def __init__(self):
+        self.aws_calls = 0
+        self.cache_hits = 0
+
+    @contextmanager
+    def track(self):
+        """Count the calls performed in the current execution context while the context manager is active."""
+        token = AWSUsageCounter._current.set(self)
+        try:
+            yield self
+        finally:
+            AWSUsageCounter._current.reset(token)
+
+    @staticmethod
+    def add_aws_call():
+        """Record an AWS call in the active counter, if any."""
+        counter = AWSUsageCounter._current.get()
+        if counter:
+            counter.aws_calls += 1
+
+    @staticmethod
+    def add_cache_hit():
+        """Record a cache hit in the active counter, if any."""
+        counter = AWSUsageCounter._current.get()
+        if counter:
+            counter.cache_hits += 1
+
+
 def _log_boto3_calls(params, **kwargs):
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
@@ -134,16 +182,84 @@ def _log_boto3_calls(params, **kwargs):
     LOGGER.info(
         "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
     )
+    AWSUsageCounter.add_aws_call()
+
+
+def _session_identity():
+    """
+    Return a tuple (region, credentials fingerprint) identifying the region and the credentials used by boto3 clients.
+
+    The default boto3 session is used, as done by boto3.client, so credentials are resolved only once.
+    """
+    with _BOTO3_SESSION_LOCK:
+        if boto3.DEFAULT_SESSION is None:
+            boto3.setup_default_session()
+        session = boto3.DEFAULT_SESSION
+    credentials = session.get_credentials()
+    access_key = credentials.access_key if credentials else None
+    return session.region_name, hashlib.sha256(str(access_key).encode()).hexdigest()
+
+
+class Boto3ClientPool:
+    """
+    Pool of boto3 clients reused across the requests served by the same process.
+
+    Creating a boto3 client requires loading the service model and resolving endpoints and credentials,
+    so clients are indexed by service, configuration, region and credentials and created only once.
+    The pool is used by Boto3Client only while it is active, i.e. during the requests served by the API.
+    """
+
+    _active = None
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def active():
+        """Return the active pool, if any."""
+        return Boto3ClientPool._active
+
+    def activate(self):
+        """Make this pool the one used to create boto3 clients."""
+        Boto3ClientPool._active = self
+
+    @staticmethod
+    def deactivate():
+        """Stop using pooled boto3 clients."""
+        Boto3ClientPool._active = None
+
+    def get_client(self, client_name: str, botocore_config_kwargs: Dict = None):
+        """Return the pooled client for the current region and credentials, creating it if needed."""
+        key = (client_name, json.dumps(botocore_config_kwargs, sort_keys=True), *_session_identity())
+        with self._lock:
+            client = self._clients.get(key)
+            if not client:
+                client = self._clients[key] = _create_client(client_name, botocore_config_kwargs)
+            return client
+
+    def size(self):
+        """Return the number of pooled clients."""
+        with self._lock:
+            return len(self._clients)
+
+
+def _create_client(client_name: str, botocore_config_kwargs: Dict = None):
+    with _BOTO3_SESSION_LOCK:
+        client = boto3.client(client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None)
+    client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+    return client
 
 
 class Boto3Client:
     """Boto3 client Class."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        client_pool = Boto3ClientPool.active()
+        if client_pool:
+            self._client = client_pool.get_client(client_name, botocore_config_kwargs)
+        else:
+            self._client = _create_client(client_name, botocore_config_kwargs)
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -163,26 +279,141 @@ class Boto3Resource:
     """Boto3 resource Class."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
+        with _BOTO3_SESSION_LOCK:
+            self._resource = boto3.resource(resource_name)
         self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
 
 
+class FunctionCache:
+    """
+    In-memory LRU cache storing the results of a single function, together with its usage statistics.
+
+    A mutex is associated to every key being computed so that concurrent invocations with the same arguments
+    are serialized; mutexes are discarded as soon as no thread is using them.
+    """
+
+    def __init__(self, name: str, max_entries: int = None, ttl: int = None):
+        self.name = name
+        self.max_entries = max_entries
+        # Entries of caches with a time to live are process scoped, i.e. they are kept until they expire
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._mutexes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.waits = 0
+
+    @contextmanager
+    def key_mutex(self, key):
+        """Hold the mutex associated to the given key, creating it if needed."""
+        with self._lock:
+            mutex = self._mutexes.setdefault(key, [threading.Lock(), 0])
+            mutex[1] += 1
+        try:
+            if not mutex[0].acquire(blocking=False):
+                with self._lock:
+                    self.waits += 1
+                mutex[0].acquire()
+            try:
+                yield
+            finally:
+                mutex[0].release()
+        finally:
+            with self._lock:
+                mutex[1] -= 1
+                if mutex[1] == 0:
+                    del self._mutexes[key]
+
+    def get(self, key):
+        """Return a tuple (found, value) and mark the entry as the most recently used one."""
+        with self._lock:
+            if key in self._entries:
+                value, expires_at = self._entries[key]
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """Store the value, evicting the least recently used entries when the maximum size is exceeded."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl if self.ttl else None)
+            self._entries.move_to_end(key)
+            while self.max_entries and len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all the entries, preserving the statistics."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Reset the usage statistics."""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.waits = 0
+
+    def stats(self):
+        """Return the usage statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "waits": self.waits,
+                "inFlight": len(self._mutexes),
+            }
+
+
 class Cache:
     """Simple utility class providing a cache mechanism for expensive functions."""
 
     _caches = []
+    # Maximum number of results kept in memory for every cached function, unless specified in the decorator
+    DEFAULT_MAX_ENTRIES = 1000
 
     @staticmethod
     def is_enabled():
         """Tell if the cache is enabled."""
         return not os.environ.get("PCLUSTER_CACHE_DISABLED")
 
+    @staticmethod
+    def register(cache: FunctionCache):
+        """Register a cache not created by the cached decorator, so that it is cleared and reported with the others."""
+        Cache._caches.append(cache)
+        return cache
+
     @staticmethod
     def clear_all():
         """Clear the content of all caches."""
         for cache in Cache._caches:
             cache.clear()
 
+    @staticmethod
+    def clear_request_scoped():
+        """Clear the content of the caches whose results can change between different requests."""
+        for cache in Cache._caches:
+            if not cache.ttl:
+                cache.clear()
+
+    @staticmethod
+    def stats():
+        """Return the usage statistics of all the caches, indexed by the name of the cached function."""
+        return {cache.name: cache.stats() for cache in Cache._caches}
+
+    @staticmethod
+    def reset_stats():
+        """Reset the usage statistics of all caches."""
+        for cache in Cache._caches:
+            cache.reset_stats()
+
     @staticmethod
     def _make_key(val):
         if isinstance(val, list):
@@ -196,32 +427,105 @@ class Cache:
         return key
 
     @staticmethod
-    def cached(function):
+    def _make_persistent_key(function, args, kwargs):
+        """
+        Return a tuple (key, region) where key is stable across different processes, or (None, None) on failure.
+
+        The first positional argument is expected to be the client instance, so it is not part of the key,
+        while the ParallelCluster version, the region and the credentials in use are.
+        Credentials are read from the default boto3 session shared by the clients, as done for process scoped keys.
+        """
+        try:
+            region = get_region()
+            _, credentials_fingerprint = _session_identity()
+        except Exception as e:
+            LOGGER.debug("Unable to compute persistent cache key for %s: %s", function.__qualname__, e)
+            return None, None
+
+        from pcluster.utils import get_installed_version  # pylint: disable=import-outside-toplevel
+
+        key_data = [
+            get_installed_version(),
+            region,
+            credentials_fingerprint,
+            function.__module__,
+            function.__qualname__,
+            args[1:],
+            kwargs,
+        ]
+        return hashlib.sha256(json.dumps(key_data, sort_keys=True, default=repr).encode()).hexdigest(), region
+
+    @staticmethod
+    def _call_with_persistent_cache(function, persistent_ttl, args, kwargs):
+        """Call the function looking for its result in the persistent cache first, when enabled."""
+        if not persistent_ttl or not PersistentCache.is_enabled():
+            return function(*args, **kwargs)
+
+        persistent_key, region = Cache._make_persistent_key(function, args, kwargs)
+        if not persistent_key:
+            return function(*args, **kwargs)
+
+        persistent_cache = PersistentCache.instance()
+        found, return_value = persistent_cache.get(persistent_key)
+        if found:
+            AWSUsageCounter.add_cache_hit()
+        else:
+            return_value = function(*args, **kwargs)
+            persistent_cache.put(persistent_key, function.__qualname__, region, return_value, persistent_ttl)
+        return return_value
+
+    @staticmethod
+    def _make_process_scoped_key(args, kwargs):
+        """
+        Return a key that does not depend on the client instance, which is the first positional argument.
+
+        The region and the credentials in use are part of the key, so that results can be shared by all the clients
+        created in the process.
+        """
+        return hash((_session_identity(), Cache._make_key(args[1:]), Cache._make_key(kwargs)))
+
+    @staticmethod
+    def cached(
+        function=None, persistent_ttl: int = None, max_entries: int = DEFAULT_MAX_ENTRIES, process_ttl: int = None
+    ):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
+
+        At most max_entries results are kept in memory, the least recently used ones are evicted first;
+        use None for an unbounded cache.
+        When persistent_ttl (in seconds) is specified, the results are also stored in the on-disk PersistentCache
+        so that they can be reused by other processes, if the persistent cache is enabled.
+        The in-memory cache is always looked up first.
+
+        Results are request scoped by default, so they are removed by clear_request_scoped. When process_ttl
+        (in seconds) is specified, the results are process scoped instead: they are shared by all the client instances
+        using the same region and credentials, and they are kept until they expire. This is meant for data that does not
+        change, like instance type specs, and requires the function to be a client method.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
-        Cache._caches.append(cache)
+        if function is None:
+            return functools.partial(
+                Cache.cached, persistent_ttl=persistent_ttl, max_entries=max_entries, process_ttl=process_ttl
+            )
+
+        cache = Cache.register(FunctionCache(function.__qualname__, max_entries, ttl=process_ttl))
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
+            if process_ttl:
+                cache_key = Cache._make_process_scoped_key(args, kwargs)
+            else:
+                cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
+            with cache.key_mutex(cache_key):
+                found, return_value = cache.get(cache_key) if Cache.is_enabled() else (False, None)
+                if found:
+                    AWSUsageCounter.add_cache_hit()
                 else:
-                    return_value = function(*args, **kwargs)
-                if Cache.is_enabled():
-                    cache[cache_key] = return_value
+                    return_value = Cache._call_with_persistent_cache(function, persistent_ttl, args, kwargs)
+                    if Cache.is_enabled():
+                        cache.put(cache_key, return_value)
                 return return_value
 
         return wrapper
@@ -229,7 +533,9 @@ class Cache:
 
 def get_region():
     """Get region used internally for all the AWS calls."""
-    region = boto3.session.Session().region_name
+    # The environment variable takes precedence over the AWS config file, and it is always set when the region
+    # is configured by ParallelCluster; reading it directly avoids creating a boto3 session at every call.
+    region = os.environ.get("AWS_DEFAULT_REGION") or boto3.session.Session().region_name
     if region is None:
         raise AWSClientError("get_region", "AWS region not configured")
     return region
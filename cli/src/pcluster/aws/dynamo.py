@@ -8,8 +8,18 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import logging
+import time
+from typing import Dict
+
 from pcluster.aws.common import AWSExceptionHandler, Boto3Resource
 
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of keys that can be retrieved with a single BatchGetItem request
+BATCH_GET_ITEM_MAX_KEYS = 100
+BATCH_GET_ITEM_MAX_RETRIES = 3
+
 
 class DynamoResource(Boto3Resource):
     """DynamoDB Boto3 resource."""
@@ -22,6 +32,32 @@ class DynamoResource(Boto3Resource):
         """Get item from a DynamoDB table."""
         return self._resource.Table(table_name).get_item(ConsistentRead=True, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def batch_get_item(self, keys_by_table: Dict[str, dict]):
+        """
+        Get the item with the given key from every table, with a single BatchGetItem request.
+
+        Keys not processed by DynamoDB are retried with exponential backoff.
+        Return a dict table name -> item, tables without the item or with keys still unprocessed are not included.
+        """
+        request_items = {
+            table_name: {"Keys": [key], "ConsistentRead": True} for table_name, key in keys_by_table.items()
+        }
+        items = {}
+        for attempt in range(BATCH_GET_ITEM_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(0.1 * 2**attempt)
+            response = self._resource.batch_get_item(RequestItems=request_items)
+            for table_name, table_items in response.get("Responses", {}).items():
+                if table_items:
+                    items[table_name] = table_items[0]
+            request_items = response.get("UnprocessedKeys")
+            if not request_items:
+                break
+        else:
+            LOGGER.info("Unable to retrieve items from tables: %s", ", ".join(request_items))
+        return items
+
     @AWSExceptionHandler.handle_client_exception
     def put_item(self, table_name, item, condition_expression=None):
         """Put item into a DynamoDB table."""
@@ -11,7 +11,7 @@
 import itertools
 import re
 from datetime import datetime
-from typing import Any, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -28,6 +28,15 @@ from pcluster.constants import (
 )
 from pcluster.utils import get_partition
 
+# Time to live, in seconds, of the results stored in the persistent cache and shared across API requests
+INSTANCE_TYPES_CACHE_TTL = 24 * 60 * 60
+OFFICIAL_IMAGES_CACHE_TTL = 60 * 60
+SUBNETS_CACHE_TTL = 60 * 60
+IMAGES_CACHE_TTL = 15 * 60
+
+# Maximum number of instance types accepted by a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_BATCH_SIZE = 100
+
 
 class Ec2Client(Boto3Client):
     """Implement EC2 Boto3 client."""
@@ -35,6 +44,7 @@ class Ec2Client(Boto3Client):
     def __init__(self):
         super().__init__("ec2")
         self.additional_instance_types_data = {}
+        self.instance_types_cache = {}
         self.security_groups_cache = {}
         self.subnets_cache = {}
         self.capacity_reservations_cache = {}
@@ -56,7 +66,7 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=INSTANCE_TYPES_CACHE_TTL, process_ttl=INSTANCE_TYPES_CACHE_TTL)
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -68,12 +78,46 @@ class Ec2Client(Boto3Client):
         free_tier_instance_type = list(self._paginate_results(self._client.describe_instance_types, **kwargs))
         return free_tier_instance_type[0]["InstanceType"] if free_tier_instance_type else "t3.micro"
 
+    @AWSExceptionHandler.handle_client_exception
+    def describe_instance_types(self, instance_types):
+        """
+        Return a list of instance types data, as returned by EC2's DescribeInstanceTypes API.
+
+        Instance types not found in cache are retrieved with batched calls, so this method can be used
+        to cache the information of many instance types at once before calling get_instance_type_info.
+        Instance types defined in the additional instance types data are skipped.
+        """
+        result = []
+        missed_instance_types = []
+        for instance_type in dict.fromkeys(instance_types):
+            if instance_type in self.additional_instance_types_data:
+                continue
+            cached_data = self.instance_types_cache.get(instance_type)
+            if cached_data:
+                result.append(cached_data)
+            else:
+                missed_instance_types.append(instance_type)
+        for instance_types_batch in utils.grouper(missed_instance_types, DESCRIBE_INSTANCE_TYPES_BATCH_SIZE):
+            response = list(
+                self._paginate_results(self._client.describe_instance_types, InstanceTypes=list(instance_types_batch))
+            )
+            for instance_type_data in response:
+                self.instance_types_cache[instance_type_data.get("InstanceType")] = instance_type_data
+                result.append(instance_type_data)
+        return result
+
     @AWSExceptionHandler.handle_client_exception
     def describe_subnets(self, subnet_ids):
-        """Return a list of subnets."""
+        """
+        Return a list of subnets.
+
+        Subnets are stored in an index by subnet id, so that all the subnets of a configuration can be described
+        with a single call and then served to get_subnet_avail_zone, get_subnet_vpc, get_subnet_cidr and
+        get_subnets_az_mapping without further calls.
+        """
         result = []
         missed_subnets = []
-        for subnet_id in subnet_ids:
+        for subnet_id in dict.fromkeys(subnet_ids):
             cached_data = self.subnets_cache.get(subnet_id)
             if cached_data:
                 result.append(cached_data)
@@ -86,6 +130,13 @@ class Ec2Client(Boto3Client):
                 result.append(subnet)
         return result
 
+    def _describe_subnet(self, subnet_id):
+        """Return the metadata of the given subnet."""
+        subnets = self.describe_subnets([subnet_id])
+        if subnets:
+            return subnets[0]
+        raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
+
     @AWSExceptionHandler.handle_client_exception
     def describe_capacity_reservations(self, capacity_reservation_ids):
         """Return a list of Capacity Reservations."""
@@ -111,38 +162,36 @@ class Ec2Client(Boto3Client):
         return result
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=SUBNETS_CACHE_TTL, process_ttl=SUBNETS_CACHE_TTL)
     def get_subnet_avail_zone(self, subnet_id):
         """Return the availability zone associated to the given subnet."""
-        subnets = self.describe_subnets([subnet_id])
-        if subnets:
-            return subnets[0].get("AvailabilityZone")
-        raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
+        return self._describe_subnet(subnet_id).get("AvailabilityZone")
 
+    @AWSExceptionHandler.handle_client_exception
     def get_subnets_az_mapping(self, subnet_ids):
         """Return a dictionary mapping the input subnet_ids to their respective availability zones."""
-        return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
+        subnets = {subnet.get("SubnetId"): subnet for subnet in self.describe_subnets(subnet_ids)}
+        mapping = {}
+        for subnet_id in subnet_ids:
+            if subnet_id not in subnets:
+                raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
+            mapping[subnet_id] = subnets[subnet_id].get("AvailabilityZone")
+        return mapping
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=SUBNETS_CACHE_TTL, process_ttl=SUBNETS_CACHE_TTL)
     def get_subnet_vpc(self, subnet_id):
         """Return a vpc associated to the given subnet."""
-        subnets = self.describe_subnets([subnet_id])
-        if subnets:
-            return subnets[0].get("VpcId")
-        raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
+        return self._describe_subnet(subnet_id).get("VpcId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=SUBNETS_CACHE_TTL, process_ttl=SUBNETS_CACHE_TTL)
     def get_subnet_cidr(self, subnet_id):
         """Return cidr block  of the given subnet."""
-        subnets = self.describe_subnets([subnet_id])
-        if subnets:
-            return subnets[0].get("CidrBlock")
-        raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
+        return self._describe_subnet(subnet_id).get("CidrBlock")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=IMAGES_CACHE_TTL)
     def describe_image(self, ami_id):
         """Describe image by image id, return an object of ImageInfo."""
         result = self._client.describe_images(ImageIds=[ami_id])
@@ -274,10 +323,17 @@ class Ec2Client(Boto3Client):
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self.additional_instance_types_data.get(instance_type) or self._describe_instance_type(instance_type)
         )
 
+    @Cache.cached(persistent_ttl=INSTANCE_TYPES_CACHE_TTL, process_ttl=INSTANCE_TYPES_CACHE_TTL)
+    def _describe_instance_type(self, instance_type):
+        """Return the raw data returned by EC2's DescribeInstanceTypes API for the given instance type."""
+        cached_data = self.instance_types_cache.get(instance_type)
+        if cached_data:
+            return cached_data
+        return self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_supported_architectures(self, instance_type):
@@ -292,22 +348,25 @@ class Ec2Client(Boto3Client):
     def _find_valid_official_image(self, images):
         return max(images, key=lambda image: ("0" if self._is_image_deprecated(image) else "1") + image["CreationDate"])
 
-    @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
-        tags = filters.tags if filters and filters.tags else []
+        tags = tuple((tag.key, tag.value) for tag in filters.tags) if filters and filters.tags else ()
+        return self._get_official_image_id(os, architecture, owner, tags)
 
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(persistent_ttl=OFFICIAL_IMAGES_CACHE_TTL, process_ttl=OFFICIAL_IMAGES_CACHE_TTL)
+    def _get_official_image_id(self, os, architecture, owner, tags):
+        """Return the id of the current official image, cached by owner and (key, value) tag pairs."""
         filters = [{"Name": "name", "Values": ["{0}*".format(self._get_official_image_name_prefix(os, architecture))]}]
-        filters.extend([{"Name": f"tag:{tag.key}", "Values": [tag.value]} for tag in tags])
+        filters.extend([{"Name": f"tag:{key}", "Values": [value]} for key, value in tags])
         images = self._client.describe_images(Owners=[owner], Filters=filters, IncludeDeprecated=True).get("Images")
         if not images:
             raise AWSClientError(function_name="describe_images", message="Cannot find official ParallelCluster AMI")
         return self._find_valid_official_image(images).get("ImageId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=OFFICIAL_IMAGES_CACHE_TTL, process_ttl=OFFICIAL_IMAGES_CACHE_TTL)
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
         owners = ["amazon"]
@@ -348,6 +407,16 @@ class Ec2Client(Boto3Client):
         """Terminate list of EC2 instances."""
         return self._client.terminate_instances(InstanceIds=instance_ids)
 
+    @AWSExceptionHandler.handle_client_exception
+    def get_instance_states(self, instance_ids) -> Dict[str, str]:
+        """Retrieve the state of the given instances, including the ones that are not running."""
+        return {
+            status["InstanceId"]: status["InstanceState"]["Name"]
+            for status in self._paginate_results(
+                self._client.describe_instance_status, InstanceIds=list(instance_ids), IncludeAllInstances=True
+            )
+        }
+
     @AWSExceptionHandler.handle_client_exception
     def list_instance_ids(self, filters):
         """Retrieve a filtered list of instance ids."""
@@ -358,11 +427,13 @@ class Ec2Client(Boto3Client):
         ]
 
     @AWSExceptionHandler.handle_client_exception
-    def describe_instances(self, filters, next_token=None) -> Tuple[List[Any], str]:
-        """Retrieve a filtered list of instances."""
+    def describe_instances(self, filters, next_token=None, max_results=None) -> Tuple[List[Any], str]:
+        """Retrieve a filtered list of instances, returning at most max_results instances if specified."""
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
+        if max_results:
+            describe_stacks_kwargs["MaxResults"] = max_results
         response = self._client.describe_instances(Filters=filters, **describe_stacks_kwargs)
         instances = []
         for reservation in response["Reservations"]:
@@ -370,7 +441,7 @@ class Ec2Client(Boto3Client):
         return instances, response.get("NextToken")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=INSTANCE_TYPES_CACHE_TTL, process_ttl=INSTANCE_TYPES_CACHE_TTL)
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
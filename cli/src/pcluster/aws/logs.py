@@ -121,6 +121,11 @@ class LogsClient(Boto3Client):
             )
         return tasks[0].get("status").get("code")
 
+    @AWSExceptionHandler.handle_client_exception
+    def cancel_export_task(self, task_id):
+        """Cancel the CloudWatch export task with the given task_id."""
+        self._client.cancel_export_task(taskId=task_id)
+
     @AWSExceptionHandler.handle_client_exception
     def describe_log_streams(self, log_group_name, log_stream_name_prefix=None, next_token=None):
         """Return a list of log streams in the given log group, filtered by the given prefix."""
@@ -0,0 +1,170 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import os
+import pickle  # nosec B403
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class PersistentCache:
+    """
+    On-disk cache storing results of AWS calls across different pcluster invocations.
+
+    It is used as the second tier of the in-memory Cache and it is enabled only when the
+    PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable is set.
+    Every entry has its own expiration time and the least recently used entries are evicted
+    when the number of entries exceeds the configured maximum.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str = None, max_entries: int = None):
+        self.path = path or PersistentCache.default_path()
+        self.max_entries = max_entries or int(
+            os.environ.get("PCLUSTER_PERSISTENT_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)
+        )
+        self._initialized = False
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return bool(os.environ.get("PCLUSTER_PERSISTENT_CACHE_ENABLED")) and not os.environ.get(
+            "PCLUSTER_CACHE_DISABLED"
+        )
+
+    @staticmethod
+    def default_path():
+        """Return the path of the cache database file."""
+        default_path = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache", "aws-cache.db"))
+        return os.environ.get("PCLUSTER_PERSISTENT_CACHE_FILE", default=default_path)
+
+    @staticmethod
+    def instance():
+        """Return the PersistentCache instance associated to the current cache file."""
+        with PersistentCache._instance_lock:
+            if not PersistentCache._instance or PersistentCache._instance.path != PersistentCache.default_path():
+                PersistentCache._instance = PersistentCache()
+            return PersistentCache._instance
+
+    @contextmanager
+    def _connection(self):
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=5)) as connection:
+            with connection:
+                if not self._initialized:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS cache_entries ("
+                        "key TEXT PRIMARY KEY, "
+                        "function_name TEXT NOT NULL, "
+                        "region TEXT, "
+                        "value BLOB NOT NULL, "
+                        "expires_at REAL NOT NULL, "
+                        "last_access REAL NOT NULL, "
+                        "hits INTEGER NOT NULL DEFAULT 0)"
+                    )
+                    self._initialized = True
+                yield connection
+
+    def get(self, key: str):
+        """
+        Retrieve the value associated to the given key.
+
+        :return: a tuple (found, value), found is False if the entry is missing, expired or not readable.
+        """
+        try:
+            now = time.time()
+            with self._connection() as connection:
+                row = connection.execute(
+                    "SELECT value FROM cache_entries WHERE key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+                if row is None:
+                    return False, None
+                connection.execute(
+                    "UPDATE cache_entries SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                )
+            # A nosec comment is appended to the following line in order to disable the B301 check.
+            # The cache file lives in a directory accessible only by the current user.
+            return True, pickle.loads(row[0])  # nosec B301
+        except Exception as e:
+            LOGGER.debug("Unable to read entry from persistent cache %s: %s", self.path, e)
+            return False, None
+
+    def put(self, key: str, function_name: str, region: str, value, ttl: float):
+        """Store the given value, evicting expired and least recently used entries if needed."""
+        try:
+            now = time.time()
+            serialized_value = pickle.dumps(value)
+            with self._connection() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache_entries "
+                    "(key, function_name, region, value, expires_at, last_access, hits) VALUES (?, ?, ?, ?, ?, ?, 0)",
+                    (key, function_name, region, serialized_value, now + ttl, now),
+                )
+                connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE key IN ("
+                    "SELECT key FROM cache_entries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except Exception as e:
+            LOGGER.debug("Unable to write entry to persistent cache %s: %s", self.path, e)
+
+    def clear(self, region: str = None):
+        """Remove all the entries, or only the ones of the given region, and return the number of removed entries."""
+        if not os.path.isfile(self.path):
+            return 0
+        with self._connection() as connection:
+            if region:
+                cursor = connection.execute("DELETE FROM cache_entries WHERE region = ?", (region,))
+            else:
+                cursor = connection.execute("DELETE FROM cache_entries")
+            return cursor.rowcount
+
+    def stats(self, region: str = None):
+        """Return statistics about the content of the cache."""
+        stats = {
+            "path": self.path,
+            "enabled": PersistentCache.is_enabled(),
+            "maxEntries": self.max_entries,
+            "sizeBytes": 0,
+            "entries": 0,
+            "expiredEntries": 0,
+            "hits": 0,
+            "functions": {},
+        }
+        if not os.path.isfile(self.path):
+            return stats
+
+        stats["sizeBytes"] = os.path.getsize(self.path)
+        query = (
+            "SELECT function_name, COUNT(*), SUM(CASE WHEN expires_at <= ? THEN 1 ELSE 0 END), SUM(hits) "
+            "FROM cache_entries {0} GROUP BY function_name ORDER BY function_name"
+        )
+        with self._connection() as connection:
+            if region:
+                rows = connection.execute(query.format("WHERE region = ?"), (time.time(), region)).fetchall()
+            else:
+                rows = connection.execute(query.format(""), (time.time(),)).fetchall()
+        for function_name, entries, expired_entries, hits in rows:
+            stats["functions"][function_name] = {"entries": entries, "expiredEntries": expired_entries, "hits": hits}
+            stats["entries"] += entries
+            stats["expiredEntries"] += expired_entries
+            stats["hits"] += hits
+        return stats
@@ -0,0 +1,35 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from pcluster.aws.common import AWSExceptionHandler, Boto3Client
+
+
+class ResourceGroupsTaggingClient(Boto3Client):
+    """Implement Resource Groups Tagging API Boto3 client."""
+
+    def __init__(self):
+        super().__init__("resourcegroupstaggingapi")
+
+    @AWSExceptionHandler.handle_client_exception
+    def get_resources_with_tag(self, resource_type: str, tag_key: str, next_token: str = None):
+        """
+        Return a page of the resources of the given type having the given tag key.
+
+        Results are not cached, since resources that have just been created must be returned.
+
+        :param resource_type: resource type in the service[:resourceType] format, e.g. cloudformation:stack
+        :return: a tuple with the list of resources, each one with its ResourceARN and Tags, and the token to retrieve
+                 the next page, None if there are no more pages
+        """
+        kwargs = {"TagFilters": [{"Key": tag_key}], "ResourceTypeFilters": [resource_type]}
+        if next_token:
+            kwargs["PaginationToken"] = next_token
+        response = self._client.get_resources(**kwargs)
+        return response.get("ResourceTagMappingList", []), response.get("PaginationToken") or None
@@ -51,9 +51,12 @@ class S3Client(Boto3Client):
             )
 
     @AWSExceptionHandler.handle_client_exception
-    def put_object(self, bucket_name, body, key):
+    def put_object(self, bucket_name, body, key, metadata=None):
         """Upload object content to s3."""
-        return self._client.put_object(Bucket=bucket_name, Body=body, Key=key)
+        kwargs = {"Bucket": bucket_name, "Body": body, "Key": key}
+        if metadata:
+            kwargs["Metadata"] = metadata
+        return self._client.put_object(**kwargs)
 
     @AWSExceptionHandler.handle_client_exception
     def get_object(self, bucket_name, key, version_id=None, expected_bucket_owner=None):
@@ -114,14 +117,16 @@ class S3Client(Boto3Client):
         self._client.put_bucket_policy(Bucket=bucket_name, Policy=policy)
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_fileobj(self, bucket_name, file_obj, key):
+    def upload_fileobj(self, bucket_name, file_obj, key, metadata=None):
         """Upload file-like object to S3 bucket."""
-        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key)
+        extra_args = {"ExtraArgs": {"Metadata": metadata}} if metadata else {}
+        self._client.upload_fileobj(Fileobj=file_obj, Bucket=bucket_name, Key=key, **extra_args)
 
     @AWSExceptionHandler.handle_client_exception
-    def upload_file(self, bucket_name, file_path, key):
+    def upload_file(self, bucket_name, file_path, key, metadata=None):
         """Upload file to S3 bucket."""
-        self._client.upload_file(Filename=file_path, Bucket=bucket_name, Key=key)
+        extra_args = {"ExtraArgs": {"Metadata": metadata}} if metadata else {}
+        self._client.upload_file(Filename=file_path, Bucket=bucket_name, Key=key, **extra_args)
 
     @AWSExceptionHandler.handle_client_exception
     def create_presigned_url(self, bucket_name, object_name, version_id=None, expiration=3600):
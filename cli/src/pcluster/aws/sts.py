@@ -10,6 +10,9 @@
 # limitations under the License.
 from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache
 
+# The account id depends only on the credentials in use, which are part of the key of process scoped cache entries
+ACCOUNT_ID_CACHE_TTL = 24 * 60 * 60
+
 
 class StsClient(Boto3Client):
     """STS Boto3 client."""
@@ -18,7 +21,7 @@ class StsClient(Boto3Client):
         super().__init__("sts")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(process_ttl=ACCOUNT_ID_CACHE_TTL)
     def get_account_id(self):
         """Get account id by get_caller_identity."""
         return self._client.get_caller_identity().get("Account")
@@ -0,0 +1,49 @@
+#  Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import List
+
+import argparse
+
+from pcluster import utils
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.cli.commands.common import CliCommand, print_json
+
+
+class CacheCommand(CliCommand):
+    """Implement pcluster cache command."""
+
+    # CLI
+    name = "cache"
+    help = "Inspect or clear the local cache of AWS API results."
+    description = (
+        "Inspect or clear the local cache of AWS API results shared across pcluster invocations. "
+        "The cache is used only when the PCLUSTER_PERSISTENT_CACHE_ENABLED environment variable is set."
+    )
+
+    def __init__(self, subparsers):
+        super().__init__(subparsers, name=self.name, help=self.help, description=self.description)
+
+    def register_command_args(self, parser: argparse.ArgumentParser) -> None:  # noqa: D102
+        parser.add_argument(
+            "action",
+            choices=["clear", "stats"],
+            help="clear removes the cached entries, stats shows statistics about the cached entries.",
+        )
+
+    def execute(  # noqa: D102
+        self, args: argparse.Namespace, extra_args: List[str]  # pylint: disable=unused-argument
+    ) -> None:
+        persistent_cache = PersistentCache.instance()
+        try:
+            if args.action == "clear":
+                print_json({"deletedEntries": persistent_cache.clear(region=args.region)})
+            else:
+                print_json(persistent_cache.stats(region=args.region))
+        except Exception as e:
+            utils.error(f"Unable to {args.action} the cache {persistent_cache.path}.\n{e}")
@@ -84,6 +84,7 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             end_time=args.end_time,
             filters=args.filters,
             output_file=output_file,
+            export_windows=args.export_windows,
         )
         LOGGER.debug("Cluster's logs exported correctly to %s", url)
         return {"path": output_file} if output_file is not None else {"url": url}
@@ -129,6 +129,16 @@ class ExportLogsCommand:
                 "(e.g. 1984-09-15T19:20:30Z), time elements might be omitted. Defaults to current time"
             ),
         )
+        parser.add_argument(
+            "--export-windows",
+            type=partial(to_int, "export-windows"),
+            default=1,
+            help=(
+                "Number of time windows to split the export of the logs into. Windows are exported concurrently "
+                "when allowed by CloudWatch Logs and downloaded while the following ones are being exported. "
+                "(Defaults to 1.)"
+            ),
+        )
 
     @staticmethod
     def _validate_output_file_path(file_path: str):
@@ -77,6 +77,7 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
             start_time=args.start_time,
             end_time=args.end_time,
             output_file=output_file,
+            export_windows=args.export_windows,
         )
         LOGGER.debug("Image's logs exported correctly to %s", url)
         return {"path": output_file} if output_file else {"url": url}
@@ -19,6 +19,7 @@ import os
 import re
 import sys
 from functools import partial
+from typing import Iterator
 
 import argparse
 from botocore.exceptions import NoCredentialsError  # TODO: remove
@@ -262,14 +263,22 @@ def run(sys_args, model=None):
     return _run_operation(model, args, extra_args)
 
 
+def _print_output(ret):
+    if isinstance(ret, Iterator):
+        # Streamed output, i.e. newline-delimited JSON, printed while items are retrieved
+        for item in ret:
+            print(json.dumps(item), flush=True)
+    elif ret:
+        output_str = json.dumps(ret, indent=2)
+        print(output_str)
+        LOGGER.info(output_str)
+
+
 def main():
     pcluster_logging.config_logger()
     try:
         ret = run(sys.argv[1:])
-        if ret:
-            output_str = json.dumps(ret, indent=2)
-            print(output_str)
-            LOGGER.info(output_str)
+        _print_output(ret)
         sys.exit(0)
     except NoCredentialsError:  # TODO: remove from here
         LOGGER.error("AWS Credentials not found.")
@@ -19,18 +19,38 @@ function that is provided as the first argument and passing the **kwargs
 provided.
 """
 
+import json
 import logging
+import sys
+from contextlib import contextmanager
 
 import argparse
-import boto3
 import jmespath
-from botocore.exceptions import WaiterError
 
 import pcluster.cli.model
+from pcluster.aws.cfn import CfnClient
+from pcluster.aws.common import AWSClientError, StackNotFoundError
 from pcluster.cli.exceptions import APIOperationException, ParameterException
+from pcluster.models.stack_waiter import StackWaiter
+from pcluster.utils import poll_with_backoff
+from pcluster.validators.common import ValidationProfile
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum time to wait for the operations on the cluster stack, same as the CloudFormation waiters
+STACK_WAIT_TIMEOUT = 3600
+
+# Compute fleet statuses reached at the end of the transition started by each requested status
+COMPUTE_FLEET_FINAL_STATUSES = {
+    "START_REQUESTED": "RUNNING",
+    "STOP_REQUESTED": "STOPPED",
+    "ENABLED": "ENABLED",
+    "DISABLED": "DISABLED",
+}
+COMPUTE_FLEET_TRANSITION_STATUSES = {"START_REQUESTED", "STARTING", "STOP_REQUESTED", "STOPPING"}
+# The status update is picked up within 3 minutes and completed within 10 minutes
+COMPUTE_FLEET_WAIT_TIMEOUT = 780
+
 
 def _cluster_status(cluster_name):
     controller = "cluster_operations_controller"
@@ -39,6 +59,40 @@ def _cluster_status(cluster_name):
     return pcluster.cli.model.call(full_func_name, cluster_name=cluster_name)
 
 
+def _compute_fleet_status(cluster_name, region=None):
+    controller = "cluster_compute_fleet_controller"
+    func_name = "describe_compute_fleet"
+    full_func_name = f"pcluster.api.controllers.{controller}.{func_name}"
+    return pcluster.cli.model.call(full_func_name, cluster_name=cluster_name, region=region)
+
+
+def _wait_for_stack(stack_name, expected_status):
+    """
+    Wait for the operation on the cluster stack to complete, printing the stack events while they occur.
+
+    Return True if the stack reached the expected status.
+    """
+
+    def _print_event(event):
+        event_description = CfnClient.format_event(event)
+        if event["StackName"] != stack_name:
+            event_description = f"{event['StackName']} {event_description}"
+        # Standard error is redirected to the logger while running the operation, events are printed to the terminal
+        print(event_description, file=sys.__stderr__, flush=True)
+
+    try:
+        status = StackWaiter(stack_name, on_event=_print_event).wait(timeout=STACK_WAIT_TIMEOUT)
+    except StackNotFoundError:
+        # The stack has been deleted before its status could be retrieved
+        status = "DELETE_COMPLETE"
+    except (AWSClientError, TimeoutError) as e:
+        LOGGER.error("Failed when waiting for stack %s with error: %s", stack_name, e)
+        return False
+    if status != expected_status:
+        LOGGER.error("Stack %s reached status %s, expected %s", stack_name, status, expected_status)
+    return status == expected_status
+
+
 def add_additional_args(parser_map):
     """Add any additional arguments to parsers for individual operations.
 
@@ -49,6 +103,19 @@ def add_additional_args(parser_map):
     parser_map["create-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["delete-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
     parser_map["update-cluster"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    parser_map["update-compute-fleet"].add_argument("--wait", action="store_true", help=argparse.SUPPRESS)
+    for operation in ["create-cluster", "update-cluster"]:
+        parser_map[operation].add_argument(
+            "--validation-profile",
+            help="Path of a file where to write a JSON report with wall time, AWS calls and cache hits of each "
+            "config validator.",
+        )
+    parser_map["describe-cluster-instances"].add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Print the instances of all the pages as newline-delimited JSON, one instance per line, while the "
+        "following pages are retrieved.",
+    )
 
 
 def middleware_hooks():
@@ -56,7 +123,13 @@ def middleware_hooks():
 
     The map has operation names as the keys and functions as values.
     """
-    return {"create-cluster": create_cluster, "delete-cluster": delete_cluster, "update-cluster": update_cluster}
+    return {
+        "create-cluster": create_cluster,
+        "delete-cluster": delete_cluster,
+        "update-cluster": update_cluster,
+        "describe-cluster-instances": describe_cluster_instances,
+        "update-compute-fleet": update_compute_fleet,
+    }
 
 
 def queryable(func):
@@ -71,17 +144,33 @@ def queryable(func):
     return wrapper
 
 
+@contextmanager
+def _validation_profile(kwargs):
+    """Profile the validators executed in the context, if the validation profile output file has been requested."""
+    output_file = kwargs.pop("validation_profile", None)
+    if not output_file:
+        yield
+        return
+
+    profile = ValidationProfile()
+    try:
+        with profile.activate():
+            yield
+    finally:
+        try:
+            with open(output_file, "w", encoding="utf-8") as profile_file:
+                json.dump(profile.report(), profile_file, indent=2)
+        except OSError as e:
+            LOGGER.error("Unable to write validation profile to %s: %s", output_file, e)
+
+
 @queryable
 def update_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
-    ret = func(**kwargs)
+    with _validation_profile(kwargs):
+        ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_update_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster update with error: %s", e)
+        if not _wait_for_stack(kwargs["cluster_name"], "UPDATE_COMPLETE"):
             raise APIOperationException(_cluster_status(kwargs["cluster_name"]))
         ret = _cluster_status(kwargs["cluster_name"])
     return ret
@@ -90,14 +179,10 @@ def update_cluster(func, _body, kwargs):
 @queryable
 def create_cluster(func, body, kwargs):
     wait = kwargs.pop("wait", False)
-    ret = func(**kwargs)
+    with _validation_profile(kwargs):
+        ret = func(**kwargs)
     if wait and not kwargs.get("dryrun"):
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_create_complete")
-        try:
-            waiter.wait(StackName=body["clusterName"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster creation with error: %s", e)
+        if not _wait_for_stack(body["clusterName"], "CREATE_COMPLETE"):
             raise APIOperationException(_cluster_status(body["clusterName"]))
         ret = _cluster_status(body["clusterName"])
     return ret
@@ -108,13 +193,61 @@ def delete_cluster(func, _body, kwargs):
     wait = kwargs.pop("wait", False)
     ret = func(**kwargs)
     if wait:
-        cloud_formation = boto3.client("cloudformation")
-        waiter = cloud_formation.get_waiter("stack_delete_complete")
-        try:
-            waiter.wait(StackName=kwargs["cluster_name"])
-        except WaiterError as e:
-            LOGGER.error("Failed when waiting for cluster deletion with error: %s", e)
+        if not _wait_for_stack(kwargs["cluster_name"], "DELETE_COMPLETE"):
             raise APIOperationException({"message": f"Failed when deleting cluster '{kwargs['cluster_name']}'."})
         return {"message": f"Successfully deleted cluster '{kwargs['cluster_name']}'."}
     else:
         return ret
+
+
+@queryable
+def update_compute_fleet(func, body, kwargs):
+    wait = kwargs.pop("wait", False)
+    ret = func(**kwargs)
+    if wait:
+        cluster_name = kwargs["cluster_name"]
+        expected_status = COMPUTE_FLEET_FINAL_STATUSES[body["status"]]
+        try:
+            ret = poll_with_backoff(
+                lambda: _compute_fleet_status(cluster_name, kwargs.get("region")),
+                until=lambda compute_fleet: compute_fleet["status"] not in COMPUTE_FLEET_TRANSITION_STATUSES,
+                timeout=COMPUTE_FLEET_WAIT_TIMEOUT,
+            )
+        except TimeoutError as e:
+            LOGGER.error("Failed when waiting for compute fleet status update with error: %s", e)
+            raise APIOperationException(_compute_fleet_status(cluster_name, kwargs.get("region")))
+        if ret["status"] != expected_status:
+            raise APIOperationException(
+                {
+                    "message": f"Unexpected final compute fleet status {ret['status']}, expected {expected_status}. "
+                    "The status has probably been updated concurrently.",
+                    **ret,
+                }
+            )
+    return ret
+
+
+def describe_cluster_instances(func, _body, kwargs):
+    if not kwargs.pop("ndjson", False):
+        return func(**kwargs)
+    query = kwargs.pop("query", None)
+    return _iter_paginated_items(func, kwargs, "instances", query)
+
+
+def _iter_paginated_items(func, kwargs, items_key, query=None):
+    """Return a generator of the items of all the pages of a paginated operation, retrieving pages only when needed."""
+    try:
+        expression = jmespath.compile(query) if query else None
+    except jmespath.exceptions.ParseError:
+        raise ParameterException({"message": "Invalid query string.", "query": query})
+
+    def _generator(next_token):
+        while True:
+            page = func(**{**kwargs, "next_token": next_token})
+            for item in page.get(items_key, []):
+                yield expression.search(item) if expression else item
+            next_token = page.get("nextToken")
+            if not next_token:
+                return
+
+    return _generator(kwargs.pop("next_token", None))
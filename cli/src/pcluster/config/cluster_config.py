@@ -110,6 +110,7 @@ from pcluster.validators.cluster_validators import (
     SchedulableMemoryValidator,
     SchedulerOsValidator,
     SchedulerValidator,
+    SecurityGroupsReachability,
     SharedStorageMountDirValidator,
     SharedStorageNameValidator,
     UnmanagedFsxMultiAzValidator,
@@ -1321,6 +1322,7 @@ class BaseClusterConfig(Resource):
     ):
         super().__init__()
         self.__region = None
+        self.__security_groups_reachability = None
         # config_region represents the region parameter in the configuration file
         # and is only used by configure_aws_region_from_config in controllers.
         # Since the region is already set by configure_aws_region_from_config to the environment variable,
@@ -1487,7 +1489,7 @@ class BaseClusterConfig(Resource):
                             EfsIdValidator,
                             efs_id=storage.file_system_id,
                             avail_zones_mapping=self.availability_zones_subnets_mapping,
-                            security_groups_by_nodes=self.security_groups_by_nodes,
+                            security_groups_reachability=self.security_groups_reachability,
                         )
                     else:
                         new_storage_count["efs"] += 1
@@ -1495,7 +1497,7 @@ class BaseClusterConfig(Resource):
                 ExistingFsxNetworkingValidator,
                 file_storage_ids=list(existing_fsx),
                 subnet_ids=[self.head_node.networking.subnet_id] + self.compute_subnet_ids,
-                security_groups_by_nodes=self.security_groups_by_nodes,
+                security_groups_reachability=self.security_groups_reachability,
             )
             self._validate_max_storage_count(ebs_count, existing_storage_count, new_storage_count)
             self._validate_new_storage_multiple_subnets(
@@ -1652,12 +1654,32 @@ class BaseClusterConfig(Resource):
                     subnet_ids_list.append(subnet_id)
         return subnet_ids_list
 
+    @property
+    def subnet_ids(self):
+        """Return the list of all the subnet ids used by the head node and by the queues."""
+        return list(dict.fromkeys([self.head_node.networking.subnet_id] + self.compute_subnet_ids))
+
+    def _cache_subnets_info(self):
+        """
+        Cache subnets information together to reduce number of boto3 calls.
+
+        Since this cache is only an optimization, if AWSClientError happens (e.g. one of the subnets does not exist)
+        we catch the exception, so that every subnet is described when needed and the error is reported
+        by the validators.
+        """
+        try:
+            AWSApi.instance().ec2.describe_subnets(self.subnet_ids)
+        except AWSClientError:
+            logging.warning("Unable to cache describe_subnets results for all subnets.")
+
     @property
     def availability_zones_subnets_mapping(self):
         """Retrieve the mapping of availability zone and cluster subnets."""
         mapping = {self.head_node.networking.availability_zone: {self.head_node.networking.subnet_id}}
-        for subnet_id in self.compute_subnet_ids:
-            mapping.setdefault(AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id), set()).add(subnet_id)
+        for subnet_id, availability_zone in AWSApi.instance().ec2.get_subnets_az_mapping(
+            self.compute_subnet_ids
+        ).items():
+            mapping.setdefault(availability_zone, set()).add(subnet_id)
         return mapping
 
     @property
@@ -1768,6 +1790,13 @@ class BaseClusterConfig(Resource):
                 security_groups_for_all_nodes.add(frozenset(security_groups_for_compute_node))
         return security_groups_for_all_nodes
 
+    @property
+    def security_groups_reachability(self):
+        """Return the index of the traffic allowed to the cluster nodes, shared by the storage validators."""
+        if not self.__security_groups_reachability:
+            self.__security_groups_reachability = SecurityGroupsReachability(self.security_groups_by_nodes)
+        return self.__security_groups_reachability
+
     @property
     def extra_chef_attributes(self):
         """Return extra chef attributes."""
@@ -1900,6 +1929,7 @@ class AwsBatchClusterConfig(BaseClusterConfig):
     def __init__(self, cluster_name: str, scheduling: AwsBatchScheduling, **kwargs):
         super().__init__(cluster_name, **kwargs)
         self.scheduling = scheduling
+        self._cache_subnets_info()
 
     def _register_validators(self, context: ValidatorContext = None):
         super()._register_validators(context)
@@ -2333,13 +2363,14 @@ class SlurmQueue(_CommonQueue):
                 deny_list=SLURM_SETTINGS_DENY_LIST["Queue"]["Global"],
                 settings_level=CustomSlurmSettingLevel.QUEUE,
             )
+        # The security groups are shared by all the compute resources of the queue, so they are checked only once
+        self._register_validator(
+            EfaSecurityGroupValidator,
+            efa_enabled=any(compute_resource.efa.enabled for compute_resource in self.compute_resources),
+            security_groups=self.networking.security_groups,
+            additional_security_groups=self.networking.additional_security_groups,
+        )
         for compute_resource in self.compute_resources:
-            self._register_validator(
-                EfaSecurityGroupValidator,
-                efa_enabled=compute_resource.efa.enabled,
-                security_groups=self.networking.security_groups,
-                additional_security_groups=self.networking.additional_security_groups,
-            )
             self._register_validator(
                 EfaPlacementGroupValidator,
                 efa_enabled=compute_resource.efa.enabled,
@@ -2533,16 +2564,17 @@ class SchedulerPluginQueue(_CommonQueue):
                 queue_name=self.name,
                 subnet_ids=self.networking.subnet_ids,
             )
+        # The security groups are shared by all the compute resources of the queue, so they are checked only once
+        self._register_validator(
+            EfaSecurityGroupValidator,
+            efa_enabled=any(compute_resource.efa.enabled for compute_resource in self.compute_resources),
+            security_groups=self.networking.security_groups,
+            additional_security_groups=self.networking.additional_security_groups,
+        )
         for compute_resource in self.compute_resources:
             self._register_validator(
                 CapacityTypeValidator, capacity_type=self.capacity_type, instance_type=compute_resource.instance_type
             )
-            self._register_validator(
-                EfaSecurityGroupValidator,
-                efa_enabled=compute_resource.efa.enabled,
-                security_groups=self.networking.security_groups,
-                additional_security_groups=self.networking.additional_security_groups,
-            )
             self._register_validator(
                 EfaPlacementGroupValidator,
                 efa_enabled=compute_resource.efa.enabled,
@@ -2882,6 +2914,28 @@ class SchedulerPluginScheduling(Resource):
 class CommonSchedulerClusterConfig(BaseClusterConfig):
     """Represent the common Cluster configuration between Slurm Config and Scheduler Plugin Config."""
 
+    @property
+    def instance_types(self):
+        """Return the list of all the instance types used by the head node and by the compute resources."""
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        return list(dict.fromkeys(instance_types))
+
+    def _cache_instance_types_info(self):
+        """
+        Cache instance types information together to reduce number of boto3 calls.
+
+        Since this cache is only an optimization, if AWSClientError happens (e.g. one of the instance types
+        does not exist) we catch the exception, so that every instance type is described when needed and the error
+        is reported by the validators.
+        """
+        try:
+            AWSApi.instance().ec2.describe_instance_types(self.instance_types)
+        except AWSClientError:
+            logging.warning("Unable to cache describe_instance_types results for all instance types.")
+
     def _register_validators(self, context: ValidatorContext = None):
         super()._register_validators(context)
         checked_images = []
@@ -3043,6 +3097,8 @@ class SchedulerPluginClusterConfig(CommonSchedulerClusterConfig):
             AWSApi.instance().ec2.describe_capacity_reservations(self.all_relevant_capacity_reservation_ids)
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
+        self._cache_subnets_info()
+        self._cache_instance_types_info()
 
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
@@ -3107,6 +3163,8 @@ class SlurmClusterConfig(CommonSchedulerClusterConfig):
             AWSApi.instance().ec2.describe_capacity_reservations(self.all_relevant_capacity_reservation_ids)
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
+        self._cache_subnets_info()
+        self._cache_instance_types_info()
 
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
@@ -13,19 +13,34 @@
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
 import asyncio
+import concurrent.futures
 import itertools
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
 from typing import List, Set
 
-from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
+from pcluster.validators.common import (
+    SYNC_VALIDATORS_DEFAULT_TIMEOUT_SEC,
+    VALIDATION_DEFAULT_TIMEOUT_SEC,
+    VALIDATORS_MAX_WORKERS,
+    AsyncValidator,
+    FailureLevel,
+    ValidationProfile,
+    ValidationResult,
+    Validator,
+    ValidatorContext,
+)
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
 from pcluster.validators.s3_validators import UrlValidator
 
 LOGGER = logging.getLogger(__name__)
 
+# Interval used to check if a queued sync validator has started, so that its own timeout can be applied
+_QUEUED_VALIDATOR_POLL_INTERVAL_SEC = 0.1
+
 
 class ValidatorSuppressor(ABC):
     """Interface for a class that encapsulates the logic to suppress config validators."""
@@ -68,9 +83,90 @@ class TypeMatchValidatorsSuppressor(ValidatorSuppressor):
         return validator.type in self._validators_to_suppress
 
 
+class _ValidatorExecution:
+    """Represent a validator execution whose results are collected by the top level resource being validated."""
+
+    def __init__(self, validator: Validator, validator_args: dict):
+        self.validator = validator
+        self.validator_args = validator_args
+
+    def _unexpected_failure(self, error: Exception) -> List[ValidationResult]:
+        LOGGER.debug("Validator %s unexpected failure: %s", self.validator.type, error)
+        return [ValidationResult(str(error), FailureLevel.ERROR, self.validator.type)]
+
+    def _timeout_failure(self, timeout: float) -> List[ValidationResult]:
+        LOGGER.debug("Validator %s timed out after %s seconds", self.validator.type, timeout)
+        return [
+            ValidationResult(
+                f"Validation of ({self.validator_args}) timed out after {timeout} seconds.",
+                FailureLevel.WARNING,
+                self.validator.type,
+            )
+        ]
+
+
+class _SyncValidatorExecution(_ValidatorExecution):
+    """Sync validator submitted to a worker pool, so that independent validators can run concurrently."""
+
+    def __init__(self, validator: Validator, validator_args: dict, executor: concurrent.futures.Executor):
+        super().__init__(validator, validator_args)
+        self.timeout = SYNC_VALIDATORS_DEFAULT_TIMEOUT_SEC
+        self.started_at = None
+        self.future = executor.submit(self._execute)
+
+    def _execute(self):
+        self.started_at = time.monotonic()
+        try:
+            return self.validator.execute(**self.validator_args)
+        except Exception as e:
+            return self._unexpected_failure(e)
+
+    def result(self, deadline: float, validation_timeout: float) -> List[ValidationResult]:
+        """
+        Wait for the validator results.
+
+        The validator is reported as timed out if it runs for more than its own timeout
+        or if it does not complete before the overall validation deadline.
+        Threads cannot be interrupted, so a timed out validator keeps running in background.
+        """
+        while not self.future.done():
+            started_at = self.started_at
+            timeout_at = deadline if started_at is None else min(deadline, started_at + self.timeout)
+            remaining = timeout_at - time.monotonic()
+            if remaining <= 0:
+                self.future.cancel()
+                return self._timeout_failure(validation_timeout if timeout_at == deadline else self.timeout)
+            if started_at is None:
+                remaining = min(remaining, _QUEUED_VALIDATOR_POLL_INTERVAL_SEC)
+            concurrent.futures.wait([self.future], timeout=remaining)
+        return self.future.result()
+
+
+class _AsyncValidatorExecution(_ValidatorExecution):
+    """Async validator whose coroutine is scheduled in the event loop when the validation results are awaited."""
+
+    def __init__(self, validator: AsyncValidator, validator_args: dict):
+        super().__init__(validator, validator_args)
+        self.coroutine = validator.execute_async(**validator_args)
+        self.task = None
+
+    def result(self, validation_timeout: float) -> List[ValidationResult]:
+        """Return the validator results, the task is expected to be completed or cancelled for timeout."""
+        if self.task.cancelled():
+            return self._timeout_failure(validation_timeout)
+        if self.task.exception():
+            return self._unexpected_failure(self.task.exception())
+        return self.task.result()
+
+
 class Resource:
     """Represent an abstract Resource entity."""
 
+    # Worker pool shared by all the resources, used to run sync validators concurrently
+    _validators_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=VALIDATORS_MAX_WORKERS, thread_name_prefix="validator"
+    )
+
     class Param:
         """
         Represent a Configuration-managed attribute of a Resource.
@@ -81,6 +177,9 @@ class Resource:
         of resource class.
         """
 
+        # A Param is created for every attribute of the resources, slots keep their memory footprint small
+        __slots__ = ("__value", "__implied", "__default", "__update_policy")
+
         def __init__(self, value, default=None, update_policy=None):
             # If the value is None, it means that the value has not been specified in the configuration; hence it can
             # be implied from its default, if present.
@@ -122,12 +221,15 @@ class Resource:
             return repr(self.value)
 
     def __init__(self, implied: bool = False):
+        # Internal attributes are not backed by params, so the parameters management of __setattr__ is bypassed
         # Parameters registry
-        self.__params = {}
-        self._validation_futures = []
-        self._validation_failures: List[ValidationResult] = []
-        self._validators: List = []
-        self.implied = implied
+        object.__setattr__(self, "_Resource__params", {})
+        object.__setattr__(self, "_validation_futures", [])
+        object.__setattr__(self, "_sync_validation_futures", [])
+        object.__setattr__(self, "_validation_failures", [])
+        object.__setattr__(self, "_validation_path", None)
+        object.__setattr__(self, "_validators", [])
+        object.__setattr__(self, "implied", implied)
 
     @property
     def params(self):
@@ -171,46 +273,69 @@ class Resource:
         return Resource.Param(value, default=default, update_policy=update_policy)
 
     @staticmethod
-    def _validator_execute(validator_class, validator_args, suppressors, validation_executor):
+    def _validator_execute(validator_class, validator_args, suppressors, validation_executor, resource_path=None):
         validator = validator_class()
 
         if any(suppressor.suppress_validator(validator) for suppressor in (suppressors or [])):
             LOGGER.debug("Suppressing validator %s", validator_class.__name__)
             return None
 
+        profile = ValidationProfile.active()
+        if profile:
+            validator.stats = profile.add_execution(validator.type, resource_path)
+
         LOGGER.debug("Executing validator %s", validator_class.__name__)
         return validation_executor(validator_args, validator)
 
     @staticmethod
     def _validator_execute_sync(validator_args, validator):
-        try:
-            return validator.execute(**validator_args)
-        except Exception as e:
-            LOGGER.debug("Validator %s unexpected failure: %s", validator.type, e)
-            return [ValidationResult(str(e), FailureLevel.ERROR, validator.type)]
+        return _SyncValidatorExecution(validator, validator_args, Resource._validators_executor)
 
     @staticmethod
     def _validator_execute_async(validator_args, validator):
-        return validator.execute_async(**validator_args)
+        return _AsyncValidatorExecution(validator, validator_args)
 
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
+    def _await_sync_validators(self, deadline: float, validation_timeout: float):
+        # results are collected in the same order the validators have been registered,
+        # regardless of the order in which they complete
         return list(
             itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
+                execution.result(deadline, validation_timeout) for execution in self._sync_validation_futures
+            )
+        )
+
+    def _await_async_validators(self, deadline: float, validation_timeout: float):
+        # the overall deadline cascades to all the async validators of the resource and its children,
+        # the ones still pending when it expires are cancelled and reported as timed out
+        if not self._validation_futures:
+            return []
+        loop = asyncio.get_event_loop()
+        for execution in self._validation_futures:
+            execution.task = loop.create_task(execution.coroutine)
+        tasks = [execution.task for execution in self._validation_futures]
+        _, pending = loop.run_until_complete(asyncio.wait(tasks, timeout=max(deadline - time.monotonic(), 0)))
+        if pending:
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        return list(
+            itertools.chain.from_iterable(
+                execution.result(validation_timeout) for execution in self._validation_futures
             )
         )
 
     def _nested_resources(self):
+        """Return the nested resources together with their name, e.g. "queues[queue1]" for the items of a list."""
         nested_resources = []
-        for _, value in self.__dict__.items():
+        for name, value in self.__dict__.items():
             if isinstance(value, Resource):
-                nested_resources.append(value)
+                nested_resources.append((name, value))
             if isinstance(value, list) and value:
-                nested_resources.extend(item for item in value if isinstance(item, Resource))
+                nested_resources.extend(
+                    (f"{name}[{getattr(item, 'name', None) or index}]", item)
+                    for index, item in enumerate(value)
+                    if isinstance(item, Resource)
+                )
         return nested_resources
 
     def validate(
@@ -220,46 +345,62 @@ class Resource:
         Execute registered validators.
 
         The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
-        one where the async validators results should be awaited for.
+        one where the validators results should be awaited for.
+        Sync validators run concurrently in a worker pool while the async ones run in the event loop;
+        results are returned in the order the validators have been registered, sync ones first.
         """
         # this validation logic is a responsibility that could be completely separated from the resource tree
         # also until we need to support both sync and async validation this logic will be unnecessarily complex
         # embracing async validation completely is possible and will greatly simplify this
         self._validation_futures.clear()
+        self._sync_validation_futures.clear()
         self._validation_failures.clear()
+        validation_timeout = VALIDATION_DEFAULT_TIMEOUT_SEC
+        deadline = time.monotonic() + validation_timeout
+        if not nested:
+            self._validation_path = self.__class__.__name__
 
         try:
             self._validate_nested_resources(context, suppressors)
             self._validate_self(context, suppressors)
         finally:
             if nested:
-                result = self._validation_failures, self._validation_futures.copy()
+                result = self._sync_validation_futures.copy(), self._validation_futures.copy()
             else:
-                self._validation_failures.extend(self._await_async_validators())
+                # async validators run in the event loop while sync ones are still running in the worker pool
+                async_failures = self._await_async_validators(deadline, validation_timeout)
+                self._validation_failures.extend(self._await_sync_validators(deadline, validation_timeout))
+                self._validation_failures.extend(async_failures)
                 result = self._validation_failures
             self._validation_futures.clear()
+            self._sync_validation_futures.clear()
 
         return result
 
     def _validate_nested_resources(self, context, suppressors):
         # Call validators for nested resources
-        for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
+        for name, nested_resource in self._nested_resources():
+            nested_resource._validation_path = f"{self._validation_path}/{name}"
+            sync_futures, futures = nested_resource.validate(suppressors, context, nested=True)
             self._validation_futures.extend(futures)
-            self._validation_failures.extend(failures)
+            self._sync_validation_futures.extend(sync_futures)
 
     def _validate_self(self, context, suppressors):
         self._validators.clear()
         self._register_validators(context)
         for validator in self._validators:
             if issubclass(validator[0], AsyncValidator):
-                result = self._validator_execute(*validator, suppressors, self._validator_execute_async)
+                result = self._validator_execute(
+                    *validator, suppressors, self._validator_execute_async, self._validation_path
+                )
                 if result:
                     self._validation_futures.extend([result])
             else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync) or []
+                result = self._validator_execute(
+                    *validator, suppressors, self._validator_execute_sync, self._validation_path
                 )
+                if result:
+                    self._sync_validation_futures.append(result)
 
     def _register_validators(self, context: ValidatorContext = None):
         """
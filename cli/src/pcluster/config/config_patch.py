@@ -69,6 +69,8 @@ class ConfigPatch:
 
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
+        # Structural hashes of the sections of the configurations, by section id
+        self.__section_hashes = {}
         self._compare()
 
     @property
@@ -99,6 +101,10 @@ class ConfigPatch:
         :param section_schema: schema corresponding to the section to be analyzed (contains all the resources/params)
         :param param_path: A list on which the items correspond to the path of the param in the configuration schema
         """
+        if self._are_identical(base_section, target_section):
+            # Identical sections cannot contain changes, so there is no need to walk them
+            return
+
         for _, field_obj in section_schema.declared_fields.items():
             data_key = field_obj.data_key
             is_nested_section = hasattr(field_obj, "nested")
@@ -148,9 +154,34 @@ class ConfigPatch:
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
-        nested_path = copy.deepcopy(param_path)
-        nested_path.append(data_key)
-        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
+        self._compare_section(base_value, target_value, field_obj.schema, param_path + [data_key])
+
+    def _are_identical(self, base_value, target_value):
+        """Tell if the two values are equal, comparing first their structural hashes to detect differences quickly."""
+        return base_value is target_value or (
+            self._structural_hash(base_value) == self._structural_hash(target_value) and base_value == target_value
+        )
+
+    def _structural_hash(self, value):
+        """
+        Return a hash of the content of the given value, equal for all the values that are equal.
+
+        The hashes of dicts and lists are computed only once, since the compared configurations are not modified.
+        """
+        if isinstance(value, (dict, list)):
+            section_hash = self.__section_hashes.get(id(value))
+            if section_hash is None:
+                if isinstance(value, dict):
+                    section_hash = hash(frozenset((key, self._structural_hash(item)) for key, item in value.items()))
+                else:
+                    section_hash = hash(tuple(self._structural_hash(item) for item in value))
+                self.__section_hashes[id(value)] = section_hash
+            return section_hash
+        try:
+            return hash(value)
+        except TypeError:
+            # Unhashable values are compared by equality only
+            return hash(type(value))
 
     def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
         """
@@ -159,24 +190,23 @@ class ConfigPatch:
         If update_key is not set we're considering Name as identifier.
         """
         update_key = field_obj.metadata.get("update_key")
+        base_nested_sections = base_section.get(data_key, [])
 
-        # Compare items in the list by searching the right item to compare through update_key value
-        # First, compare all sections from target vs base config and mark visited base sections.
+        # Compare items in the list by searching the right item to compare through update_key value.
+        # Base sections are indexed by update_key value, the first one is used when the value is repeated.
+        base_nested_sections_by_key = {}
+        for base_nested_section in base_nested_sections:
+            base_nested_sections_by_key.setdefault(base_nested_section.get(update_key), base_nested_section)
+
+        # First, compare all sections from target vs base config and keep track of the visited base sections.
+        visited_base_sections = set()
         for target_nested_section in target_section.get(data_key, []):
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
+            base_nested_section = base_nested_sections_by_key.get(update_key_value)
             if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
+                nested_path = param_path + [f"{data_key}[{update_key_value}]"]
                 self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
+                visited_base_sections.add(id(base_nested_section))
             else:
                 self.changes.append(
                     Change(
@@ -189,8 +219,8 @@ class ConfigPatch:
                     )
                 )
         # Then, compare all non visited base sections vs target config.
-        for base_nested_section in base_section.get(data_key, []):
-            if not base_nested_section.get("visited", False):
+        for base_nested_section in base_nested_sections:
+            if id(base_nested_section) not in visited_base_sections:
                 self.changes.append(
                     Change(
                         param_path,
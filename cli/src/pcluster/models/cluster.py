@@ -12,16 +12,18 @@
 # This module contains all the classes representing the Resources objects.
 # These objects are obtained from the configuration file through a conversion based on the Schema classes.
 #
+import concurrent.futures
 import hashlib
 import json
 import logging
 import os
 import tempfile
-import time
+import threading
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from functools import partial
+from typing import Callable, Iterator, List, Optional, Set, Tuple
 from urllib.request import urlopen
 
 import pkg_resources
@@ -31,6 +33,7 @@ from marshmallow import ValidationError
 
 from pcluster.api.models import Metadata
 from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.cfn import CfnClient
 from pcluster.aws.common import AWSClientError, BadRequestError, LimitExceededError, StackNotFoundError, get_region
 from pcluster.config.cluster_config import BaseClusterConfig, SchedulerPluginScheduling, Tag
 from pcluster.config.common import ValidatorSuppressor
@@ -45,6 +48,7 @@ from pcluster.constants import (
 )
 from pcluster.models.cluster_resources import (
     ClusterInstance,
+    ClusterInstancesSummary,
     ClusterStack,
     ExportClusterLogsFiltersParser,
     ListClusterLogsFiltersParser,
@@ -63,7 +67,9 @@ from pcluster.models.common import (
     upload_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
+from pcluster.models.instances_terminator import InstancesTerminator
 from pcluster.models.s3_bucket import S3Bucket, S3BucketFactory, S3FileFormat, create_s3_presigned_url, parse_bucket_url
+from pcluster.models.stack_waiter import StackWaiter
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.templates.cdk_builder import CDKTemplateBuilder
 from pcluster.templates.import_cdk import start as start_cdk_import
@@ -81,6 +87,11 @@ from pcluster.validators.common import FailureLevel, ValidationResult, Validator
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of values of a DescribeInstances filter
+DESCRIBE_INSTANCES_MAX_FILTER_VALUES = 200
+# Maximum number of instances returned by each DescribeInstances request when iterating over all the cluster instances
+DESCRIBE_INSTANCES_PAGE_SIZE = 1000
+
 # pylint: disable=C0302
 
 
@@ -162,6 +173,137 @@ def _cluster_error_mapper(error, message=None):
         return ClusterActionError(message)
 
 
+class ClusterDescribeSnapshot:
+    """Represent the result of the lookups performed concurrently to describe a cluster."""
+
+    def __init__(self, stack: ClusterStack, results: dict, errors: dict):
+        self.stack = stack
+        self.__results = results
+        self.__errors = errors
+
+    @property
+    def errors(self) -> dict:
+        """Return the errors of the lookups that failed, by lookup name."""
+        return dict(self.__errors)
+
+    def get(self, name: str):
+        """Return the result of the given lookup, raising the error it failed with, if any."""
+        if name in self.__errors:
+            raise self.__errors[name]
+        return self.__results[name]
+
+
+def _get_cluster_instance_filters(cluster_names: List[str], node_type: NodeType = None, queue_name: str = None):
+    filters = [
+        {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": list(cluster_names)},
+        {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
+    ]
+    if node_type:
+        filters.append({"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [node_type.value]})
+    if queue_name:
+        filters.append({"Name": f"tag:{PCLUSTER_QUEUE_NAME_TAG}", "Values": [queue_name]})
+    return filters
+
+
+def _get_compute_fleet_statuses(clusters: List["Cluster"]) -> dict:
+    """Return the compute fleet status of every cluster, retrieving the statuses stored in DynamoDB in batches."""
+    statuses = {}
+    managed_clusters = []
+    for cluster in clusters:
+        if not (cluster.stack.is_working_status or cluster.stack.status == "UPDATE_IN_PROGRESS"):
+            statuses[cluster.name] = ComputeFleetStatus.UNKNOWN
+        elif cluster.stack.scheduler == "awsbatch":
+            try:
+                statuses[cluster.name] = ComputeFleetStatus(
+                    AWSApi.instance().batch.get_compute_environment_state(cluster.stack.batch_compute_environment)
+                )
+            except AWSClientError as e:
+                statuses[cluster.name] = ClusterActionError(f"Unable to retrieve compute fleet status. {e}")
+        else:
+            managed_clusters.append(cluster)
+    managers = [cluster.compute_fleet_status_manager for cluster in managed_clusters]
+    for cluster, status in zip(managed_clusters, ComputeFleetStatusManager.get_statuses(managers)):
+        statuses[cluster.name] = status
+    return statuses
+
+
+def _get_head_node_instances(clusters: List["Cluster"]) -> dict:
+    """Return the head node of every cluster, retrieving all of them with the same DescribeInstances requests."""
+    head_nodes = {}
+    cluster_names = [cluster.name for cluster in clusters]
+    for names in grouper(cluster_names, DESCRIBE_INSTANCES_MAX_FILTER_VALUES):
+        filters = _get_cluster_instance_filters(names, NodeType.HEAD_NODE)
+        next_token = None
+        try:
+            while True:
+                instances, next_token = AWSApi.instance().ec2.describe_instances(filters, next_token)
+                for instance in map(ClusterInstance, instances):
+                    head_nodes[instance.cluster_name] = instance
+                if not next_token:
+                    break
+        except AWSClientError as e:
+            for name in names:
+                head_nodes[name] = ClusterActionError(f"Failed to retrieve cluster instances. {e}")
+    for name in cluster_names:
+        head_nodes.setdefault(name, ClusterActionError("Unable to retrieve head node information."))
+    return head_nodes
+
+
+def _get_config_presigned_urls(clusters: List["Cluster"]) -> dict:
+    """Return the configuration url of every cluster, checking the access to each bucket only once."""
+    bucket_errors = {}
+    urls = {}
+    for cluster in clusters:
+        bucket_name = cluster.stack.s3_bucket_name
+        if bucket_name not in bucket_errors:
+            try:
+                AWSApi.instance().s3.head_bucket(bucket_name=bucket_name)
+                bucket_errors[bucket_name] = None
+            except AWSClientError as e:
+                bucket_errors[bucket_name] = ClusterActionError(
+                    f"Unable to access bucket associated to the cluster.\n{e}"
+                )
+        if bucket_errors[bucket_name]:
+            urls[cluster.name] = bucket_errors[bucket_name]
+            continue
+        bucket = S3Bucket(
+            service_name=cluster.name,
+            name=bucket_name,
+            artifact_directory=cluster.stack.s3_artifact_directory,
+            stack_name=cluster.stack_name,
+        )
+        try:
+            urls[cluster.name] = bucket.get_config_presigned_url(
+                config_name=PCLUSTER_S3_ARTIFACTS_DICT.get("source_config_name"),
+                version_id=cluster.stack.original_config_version,
+            )
+        except AWSClientError as e:
+            urls[cluster.name] = ClusterActionError(f"Unable to generate the configuration url. {e}")
+    return urls
+
+
+def _get_plugin_metadata(clusters: List["Cluster"]) -> dict:
+    """Return the scheduler plugin metadata of every cluster, loading only the configurations of plugin clusters."""
+    metadata = {}
+    for cluster in clusters:
+        try:
+            metadata[cluster.name] = cluster.get_plugin_metadata() if cluster.stack.scheduler == "plugin" else None
+        except Exception as e:
+            metadata[cluster.name] = ClusterActionError(f"Unable to retrieve scheduler metadata. {e}")
+    return metadata
+
+
+def _get_cluster_creation_failures(clusters: List["Cluster"]) -> dict:
+    """Return the creation failure of every cluster."""
+    failures = {}
+    for cluster in clusters:
+        try:
+            failures[cluster.name] = cluster.stack.get_cluster_creation_failure()
+        except AWSClientError as e:
+            failures[cluster.name] = ClusterActionError(f"Unable to retrieve cluster creation failure. {e}")
+    return failures
+
+
 class Cluster:
     """Represent a running cluster, composed by a ClusterConfig and a ClusterStack."""
 
@@ -170,6 +312,7 @@ class Cluster:
         self.__source_config_text = config
         self.__stack = stack
         self.__bucket = None
+        self.__bucket_lock = threading.Lock()
         self.template_body = None
         self.__config = None
         self.__s3_artifact_dir = None
@@ -320,6 +463,13 @@ class Cluster:
         if self.__bucket:
             return self.__bucket
 
+        # The bucket can be requested by concurrent lookups, see describe_snapshot
+        with self.__bucket_lock:
+            if not self.__bucket:
+                self.__bucket = self._init_bucket()
+        return self.__bucket
+
+    def _init_bucket(self):
         if self.__source_config_text:
             # get custom_s3_bucket in create command
             custom_bucket_name = self.config.custom_s3_bucket
@@ -330,7 +480,7 @@ class Cluster:
                 custom_bucket_name = None
 
         try:
-            self.__bucket = S3BucketFactory.init_s3_bucket(
+            return S3BucketFactory.init_s3_bucket(
                 service_name=self.name,
                 stack_name=self.stack_name,
                 custom_s3_bucket=custom_bucket_name,
@@ -339,8 +489,6 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Unable to initialize s3 bucket. {e}")
 
-        return self.__bucket
-
     def create(
         self,
         disable_rollback: bool = False,
@@ -365,19 +513,23 @@ class Cluster:
             self._add_tags()
             self._generate_artifact_dir()
             artifact_dir_generated = True
-            self._upload_config()
-            LOGGER.info("Generation and upload completed successfully")
-
-            # Create template if not provided by the user
-            assets_metadata = None
-            if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
-                self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
-                    cluster_config=self.config, bucket=self.bucket, stack_name=self.stack_name
-                )
+            self.bucket.is_new_artifact_directory = True
+            # The cluster resources do not depend on the template, so they are uploaded while the template is built
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                resources_upload = executor.submit(self._upload_resources)
+                self._upload_config()
+                LOGGER.info("Generation and upload completed successfully")
+
+                # Create template if not provided by the user
+                assets_metadata = None
+                if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                    self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
+                        cluster_config=self.config, bucket=self.bucket, stack_name=self.stack_name
+                    )
 
-            LOGGER.info("Uploading cluster artifacts...")
-            # upload cluster artifacts and generated template
-            self._upload_artifacts()
+                LOGGER.info("Uploading cluster artifacts...")
+                self._upload_template()
+                resources_upload.result()
             LOGGER.info("Upload of cluster artifacts completed successfully")
 
             LOGGER.info("Creating stack named: %s", self.stack_name)
@@ -560,32 +712,44 @@ class Cluster:
         All files contained in root dir will be uploaded to
         {bucket_name}/parallelcluster/{version}/clusters/{cluster_name}/{resource_dir}/artifact.
         """
+        self._upload_resources()
+        self._upload_template()
+
+    def _upload_resources(self):
+        """
+        Upload cluster specific resources, instance types data and scheduler plugin template.
+
+        The uploads are independent of each other, so they are performed concurrently.
+        """
         LOGGER.info("Uploading cluster artifacts to S3...")
         self._check_bucket_existence()
         try:
-            resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
-            self.bucket.upload_resources(
-                resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
-            )
+            uploads = [
+                partial(
+                    self.bucket.upload_resources,
+                    resource_dir=pkg_resources.resource_filename(__name__, "../resources/custom_resources"),
+                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name"),
+                ),
+                partial(
+                    self.bucket.upload_config,
+                    self.config.get_instance_types_data(),
+                    PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
+                    format=S3FileFormat.JSON,
+                ),
+            ]
             if self.config.scheduler_resources:
-                self.bucket.upload_resources(
-                    resource_dir=self.config.scheduler_resources,
-                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                uploads.append(
+                    partial(
+                        self.bucket.upload_resources,
+                        resource_dir=self.config.scheduler_resources,
+                        custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                    )
                 )
-
-            # Upload template
-            if self.template_body:
-                self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
-
-            # upload instance types data
-            self.bucket.upload_config(
-                self.config.get_instance_types_data(),
-                PCLUSTER_S3_ARTIFACTS_DICT.get("instance_types_data_name"),
-                format=S3FileFormat.JSON,
-            )
-
             if isinstance(self.config.scheduling, SchedulerPluginScheduling):
-                self._render_and_upload_scheduler_plugin_template()
+                uploads.append(self._render_and_upload_scheduler_plugin_template)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(uploads)) as executor:
+                for future in [executor.submit(upload) for upload in uploads]:
+                    future.result()
             LOGGER.info("Cluster artifacts uploaded correctly.")
         except BadRequestClusterActionError:
             raise
@@ -594,6 +758,18 @@ class Cluster:
             LOGGER.error(message)
             raise _cluster_error_mapper(e, message)
 
+    def _upload_template(self):
+        """Upload the cluster template, if generated."""
+        if not self.template_body:
+            return
+        self._check_bucket_existence()
+        try:
+            self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
+        except Exception as e:
+            message = f"Unable to upload cluster template to the S3 bucket {self.bucket.name} due to exception: {e}"
+            LOGGER.error(message)
+            raise _cluster_error_mapper(e, message)
+
     def _render_and_upload_scheduler_plugin_template(self, dry_run=False):
         scheduler_plugin_template = get_attr(
             self.config, "scheduling.settings.scheduler_definition.cluster_infrastructure.cloud_formation.template"
@@ -716,11 +892,16 @@ class Cluster:
             raise e
 
     def _wait_for_stack_update(self):
-        """Wait for the given stack to be finished updating."""
-        while self._get_updated_stack_status() == "UPDATE_IN_PROGRESS":
-            time.sleep(5)
-        while self._get_updated_stack_status() == "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS":
-            time.sleep(2)
+        """Wait for the given stack to be finished updating, logging the new stack events."""
+        try:
+            StackWaiter(
+                self.stack_name,
+                on_event=lambda event: LOGGER.info(CfnClient.format_event(event)),
+                get_status=self._get_updated_stack_status,
+                is_in_progress=lambda status: status in {"UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS"},
+            ).wait()
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Unable to retrieve events of stack {self.stack_name}. {e}")
 
     def _get_stack_template(self):
         """Return the template body of the stack."""
@@ -733,15 +914,14 @@ class Cluster:
         """Terminate all compute nodes of a cluster."""
         try:
             LOGGER.info("\nChecking if there are running compute nodes that require termination...")
-            filters = self._get_instance_filters(node_type=NodeType.COMPUTE)
-            instances = AWSApi.instance().ec2.list_instance_ids(filters)
-
-            for instance_ids in grouper(instances, 100):
-                LOGGER.info("Terminating following instances: %s", instance_ids)
-                if instance_ids:
-                    AWSApi.instance().ec2.terminate_instances(instance_ids)
+            instances = (instance["InstanceId"] for instance in self._iter_instances_data(NodeType.COMPUTE))
+            report = InstancesTerminator().terminate(instances)
+            if report.failed:
+                raise ClusterActionError(
+                    f"Unable to terminate {len(report.failed)} instances: {next(iter(report.failed.values()))}"
+                )
 
-            LOGGER.info("Compute fleet cleaned up.")
+            LOGGER.info("Compute fleet cleaned up, termination requested for %s instances.", len(report.terminated))
         except Exception as e:
             LOGGER.error("Failed when checking for running EC2 instances with error: %s", str(e))
             raise _cluster_error_mapper(e, f"Unable to delete running EC2 instances with error: {e}")
@@ -749,8 +929,7 @@ class Cluster:
     @property
     def compute_instances(self) -> List[ClusterInstance]:
         """Get compute instances."""
-        instances, _ = self.describe_instances(node_type=NodeType.COMPUTE)
-        return instances
+        return list(self.iter_instances(node_type=NodeType.COMPUTE))
 
     @property
     def head_node_instance(self) -> ClusterInstance:
@@ -761,16 +940,79 @@ class Cluster:
         else:
             raise ClusterActionError("Unable to retrieve head node information.")
 
+    def describe_snapshot(self, include_creation_failure: bool = False) -> ClusterDescribeSnapshot:
+        """
+        Retrieve the information needed to describe the cluster, performing the independent lookups concurrently.
+
+        Once the stack is known, compute fleet status, configuration url, scheduler plugin metadata, head node
+        and, if requested, creation failure are retrieved in parallel.
+        A lookup that fails does not affect the others: its error is raised only when its result is accessed
+        through the returned snapshot.
+        """
+        stack = self.stack
+        lookups = {
+            "compute_fleet_status": lambda: self.compute_fleet_status,
+            "config_presigned_url": lambda: self.config_presigned_url,
+            "plugin_metadata": self.get_plugin_metadata,
+            "head_node_instance": lambda: self.head_node_instance,
+        }
+        if include_creation_failure:
+            lookups["creation_failure"] = stack.get_cluster_creation_failure
+
+        results, errors = {}, {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+            futures = {name: executor.submit(lookup) for name, lookup in lookups.items()}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+
+        return ClusterDescribeSnapshot(stack, results, errors)
+
+    @staticmethod
+    def describe_snapshots(
+        clusters: List["Cluster"], include_creation_failure: Callable[[ClusterStack], bool] = None
+    ) -> List[ClusterDescribeSnapshot]:
+        """
+        Retrieve the information needed to describe multiple clusters, sharing the AWS calls among them.
+
+        Compute fleet statuses are retrieved with DynamoDB BatchGetItem requests, head nodes with DescribeInstances
+        requests covering all the clusters and the access to the buckets is checked once per bucket.
+        Stacks must be already known, e.g. by initializing the clusters with the result of a DescribeStacks sweep.
+        As for describe_snapshot, the failure of a lookup is raised only when its result is accessed.
+        """
+        bulk_lookups = {
+            "compute_fleet_status": _get_compute_fleet_statuses,
+            "config_presigned_url": _get_config_presigned_urls,
+            "plugin_metadata": _get_plugin_metadata,
+            "head_node_instance": _get_head_node_instances,
+        }
+        lookup_clusters = {name: clusters for name in bulk_lookups}
+        if include_creation_failure:
+            bulk_lookups["creation_failure"] = _get_cluster_creation_failures
+            lookup_clusters["creation_failure"] = [
+                cluster for cluster in clusters if include_creation_failure(cluster.stack)
+            ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(bulk_lookups)) as executor:
+            futures = {
+                name: executor.submit(bulk_lookup, lookup_clusters[name]) for name, bulk_lookup in bulk_lookups.items()
+            }
+            values = {name: future.result() for name, future in futures.items()}
+
+        snapshots = []
+        for cluster in clusters:
+            results, errors = {}, {}
+            for name, cluster_values in values.items():
+                if cluster.name in cluster_values:
+                    value = cluster_values[cluster.name]
+                    (errors if isinstance(value, Exception) else results)[name] = value
+            snapshots.append(ClusterDescribeSnapshot(cluster.stack, results, errors))
+        return snapshots
+
     def _get_instance_filters(self, node_type: NodeType, queue_name: str = None):
-        filters = [
-            {"Name": f"tag:{PCLUSTER_CLUSTER_NAME_TAG}", "Values": [self.stack_name]},
-            {"Name": "instance-state-name", "Values": ["pending", "running", "stopping", "stopped"]},
-        ]
-        if node_type:
-            filters.append({"Name": f"tag:{PCLUSTER_NODE_TYPE_TAG}", "Values": [node_type.value]})
-        if queue_name:
-            filters.append({"Name": f"tag:{PCLUSTER_QUEUE_NAME_TAG}", "Values": [queue_name]})
-        return filters
+        return _get_cluster_instance_filters([self.stack_name], node_type, queue_name)
 
     def describe_instances(
         self, node_type: NodeType = None, next_token: str = None, queue_name: str = None
@@ -783,6 +1025,35 @@ class Cluster:
         except AWSClientError as e:
             raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
 
+    def iter_instances(
+        self, node_type: NodeType = None, queue_name: str = None, page_size: int = DESCRIBE_INSTANCES_PAGE_SIZE
+    ) -> Iterator[ClusterInstance]:
+        """Return a lazy iterator over all the cluster instances, retrieving the next page only when needed."""
+        return map(ClusterInstance, self._iter_instances_data(node_type, queue_name, page_size))
+
+    def summarize_instances(self, node_type: NodeType = None, queue_name: str = None) -> ClusterInstancesSummary:
+        """Return the number of cluster instances per queue, state and instance type."""
+        summary = ClusterInstancesSummary()
+        for instance_data in self._iter_instances_data(node_type, queue_name):
+            summary.add(instance_data)
+        return summary
+
+    def _iter_instances_data(
+        self, node_type: NodeType = None, queue_name: str = None, page_size: int = DESCRIBE_INSTANCES_PAGE_SIZE
+    ):
+        filters = self._get_instance_filters(node_type, queue_name)
+        next_token = None
+        try:
+            while True:
+                instances, next_token = AWSApi.instance().ec2.describe_instances(
+                    filters, next_token, max_results=page_size
+                )
+                yield from instances
+                if not next_token:
+                    return
+        except AWSClientError as e:
+            raise _cluster_error_mapper(e, f"Failed to retrieve cluster instances. {e}")
+
     def has_running_capacity(self, updated_value: bool = False) -> bool:
         """Return True if the cluster has running capacity. Note: the value will be cached."""
         if self.__has_running_capacity is None or updated_value:
@@ -798,7 +1069,7 @@ class Cluster:
         """Return the number of instances or desired capacity. Note: the value will be cached."""
         if self.__running_capacity is None or updated_value:
             if self.stack.scheduler == "slurm":
-                self.__running_capacity = len(self.compute_instances)
+                self.__running_capacity = self.summarize_instances(node_type=NodeType.COMPUTE).total
             elif self.stack.scheduler == "awsbatch":
                 self.__running_capacity = AWSApi.instance().batch.get_compute_environment_capacity(
                     ce_name=self.stack.batch_compute_environment
@@ -1031,6 +1302,7 @@ class Cluster:
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        export_windows: int = 1,
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
@@ -1044,6 +1316,8 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param export_windows: Number of time windows the logs are exported in, exports of different windows run
+               concurrently when allowed by CloudWatch Logs and they are downloaded while the others are in progress
         """
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
@@ -1066,6 +1340,7 @@ class Cluster:
                         output_dir=root_archive_dir,
                         bucket_prefix=bucket_prefix,
                         keep_s3_objects=keep_s3_objects,
+                        export_windows=export_windows,
                     )
                     logs_exporter.execute(
                         log_stream_prefix=export_logs_filters.log_stream_prefix,
@@ -11,12 +11,20 @@
 import datetime
 import itertools
 import re
+from collections import Counter
 from dataclasses import dataclass
 from typing import List
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceInfo, StackInfo
-from pcluster.constants import CW_LOGS_CFN_PARAM_NAME, OS_MAPPING, PCLUSTER_NODE_TYPE_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    CW_LOGS_CFN_PARAM_NAME,
+    OS_MAPPING,
+    PCLUSTER_CLUSTER_NAME_TAG,
+    PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_QUEUE_NAME_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.models.common import FiltersParserError, LogGroupTimeFiltersParser, get_all_stack_events
 
 
@@ -208,10 +216,45 @@ class ClusterInstance(InstanceInfo):
         """Return os of the instance."""
         return self._get_tag(PCLUSTER_NODE_TYPE_TAG)
 
+    @property
+    def cluster_name(self) -> str:
+        """Return the name of the cluster the instance belongs to."""
+        return self._get_tag(PCLUSTER_CLUSTER_NAME_TAG)
+
     def _get_tag(self, tag_key: str):
         return next(iter([tag["Value"] for tag in self._tags if tag["Key"] == tag_key]), None)
 
 
+class ClusterInstancesSummary:
+    """Object to store the number of cluster instances, counted without building a ClusterInstance for each of them."""
+
+    def __init__(self):
+        self.total = 0
+        self.by_queue = Counter()
+        self.by_state = Counter()
+        self.by_instance_type = Counter()
+
+    def add(self, instance_data: dict):
+        """Count an instance, as returned by a describe_instances call."""
+        self.total += 1
+        queue_name = next(
+            (tag["Value"] for tag in instance_data.get("Tags", []) if tag["Key"] == PCLUSTER_QUEUE_NAME_TAG), None
+        )
+        if queue_name:
+            self.by_queue[queue_name] += 1
+        self.by_state[instance_data.get("State", {}).get("Name")] += 1
+        self.by_instance_type[instance_data.get("InstanceType")] += 1
+
+    def to_dict(self) -> dict:
+        """Return the counts in a format that can be serialized to JSON."""
+        return {
+            "total": self.total,
+            "queues": dict(self.by_queue),
+            "states": dict(self.by_state),
+            "instanceTypes": dict(self.by_instance_type),
+        }
+
+
 class ClusterLogsFiltersParser:
     """Class to parse filters."""
 
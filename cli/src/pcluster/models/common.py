@@ -8,25 +8,39 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import concurrent.futures
 import datetime
 import gzip
 import json
 import logging
 import os
 import os.path
+import shutil
 import tarfile
+import tempfile
 import time
+from collections import deque
+from contextlib import ExitStack
 from typing import List
 
 import configparser
 
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, get_region
+from pcluster.aws.common import AWSClientError, LimitExceededError, get_region
 from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
+LOGS_DOWNLOAD_MAX_WORKERS = 8
+LOGS_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+LOGS_DOWNLOAD_PROGRESS_INTERVAL_SEC = 10
+EXPORT_TASK_RUNNING_STATUSES = ("PENDING", "PENDING_CANCEL", "RUNNING")
+LOG_EVENTS_EXPORT_MAX_BYTES = 64 * 1024 * 1024
+LOG_EVENTS_EXPORT_MAX_WORKERS = 8
+LOG_EVENTS_THROTTLING_MAX_RETRIES = 8
+LOG_EVENTS_THROTTLING_MAX_BACKOFF_SEC = 10
+
 
 class LimitExceeded(Exception):
     """Base exception type for errors caused by exceeding the limit of some underlying AWS service."""
@@ -137,7 +151,19 @@ class LogsExporterError(Exception):
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
-    def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
+    def __init__(
+        self,
+        resource_id,
+        log_group_name,
+        bucket,
+        output_dir,
+        bucket_prefix=None,
+        keep_s3_objects=False,
+        export_windows=1,
+        use_log_events_api=None,
+    ):
+        if export_windows < 1:
+            raise LogsExporterError("The number of export windows must be greater than 0.")
         # check bucket
         bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
         if bucket_region != get_region():
@@ -149,6 +175,9 @@ class CloudWatchLogsExporter:
         self.log_group_name = log_group_name
         self.output_dir = output_dir
         self.keep_s3_objects = keep_s3_objects
+        self.export_windows = export_windows
+        # When not specified, the GetLogEvents API is used for small exports only
+        self.use_log_events_api = use_log_events_api
 
         if bucket_prefix:
             self.bucket_prefix = bucket_prefix
@@ -162,87 +191,398 @@ class CloudWatchLogsExporter:
 
     def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
         """Start export task. Returns logs streams folder."""
-        # Export logs to S3
-        task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
-        LOGGER.info("Log export task id: %s", task_id)
+        log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
+        if self._should_use_log_events_api(start_time, end_time):
+            try:
+                self._download_log_events(log_stream_prefix, start_time, end_time, log_streams_dir)
+            except AWSClientError as e:
+                raise LogsExporterError(f"Unexpected error when retrieving log events: {e}")
+            LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
+            return
+        windows = self._split_time_range(start_time, end_time)
+        task_ids = []
+        if len(windows) == 1:
+            # Export logs to S3
+            task_ids.append(
+                self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
+            )
+            LOGGER.info("Log export task id: %s", task_ids[0])
         # Download exported S3 objects to output dir subfolder
         try:
-            log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
-            self._download_s3_objects_with_prefix(task_id, log_streams_dir)
+            if len(windows) == 1:
+                self._download_s3_objects_with_prefix(task_ids[0], log_streams_dir)
+            else:
+                self._export_windows_to_dir(windows, log_stream_prefix, log_streams_dir, task_ids)
             LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
         finally:
             if not self.keep_s3_objects:
                 if self.delete_everything_under_prefix:
-                    delete_key = self.bucket_prefix
+                    delete_keys = [self.bucket_prefix]
                 else:
-                    delete_key = "/".join((self.bucket_prefix, task_id))
-                LOGGER.debug("Cleaning up S3 bucket %s. Deleting all objects under %s", self.bucket, delete_key)
-                AWSApi.instance().s3_resource.delete_objects(bucket_name=self.bucket, prefix=delete_key)
+                    delete_keys = ["/".join((self.bucket_prefix, task_id)) for task_id in task_ids]
+                for delete_key in delete_keys:
+                    LOGGER.debug("Cleaning up S3 bucket %s. Deleting all objects under %s", self.bucket, delete_key)
+                    AWSApi.instance().s3_resource.delete_objects(bucket_name=self.bucket, prefix=delete_key)
+
+    def _should_use_log_events_api(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        """
+        Tell if log events must be retrieved with the GetLogEvents API rather than with export tasks.
+
+        Retrieving log events directly avoids waiting for export tasks, which cannot run concurrently,
+        but it requires an API call for every MB of events, so it's used only when the size of the events
+        in the time range, estimated from the size of the log group, is small.
+        """
+        if self.use_log_events_api is not None:
+            return self.use_log_events_api
+        if self.keep_s3_objects or self.export_windows > 1:
+            return False
+        try:
+            log_group = AWSApi.instance().logs.describe_log_group(self.log_group_name)
+        except AWSClientError as e:
+            LOGGER.debug("Unable to retrieve size of log group %s: %s", self.log_group_name, e)
+            return False
+
+        estimated_bytes = log_group.get("storedBytes", 0)
+        creation_time = log_group.get("creationTime")
+        now = datetime_to_epoch(datetime.datetime.now(tz=datetime.timezone.utc))
+        if start_time and end_time and creation_time and now > creation_time:
+            exported_time = datetime_to_epoch(end_time) - max(datetime_to_epoch(start_time), creation_time)
+            estimated_bytes *= min(1, max(0, exported_time / (now - creation_time)))
+        LOGGER.debug("Estimated size of log events to export: %s bytes", estimated_bytes)
+        return estimated_bytes <= LOG_EVENTS_EXPORT_MAX_BYTES
+
+    def _download_log_events(self, log_stream_prefix, start_time, end_time, destdir):
+        """
+        Retrieve the events of all the log streams with the GetLogEvents API and write them into destdir.
+
+        Log streams are retrieved concurrently and their events are written while paginating through them,
+        with the same format of the objects created by export tasks.
+        """
+        start_millis = start_time and datetime_to_epoch(start_time)
+        end_millis = end_time and datetime_to_epoch(end_time)
+        logs_client = AWSApi.instance().logs
+        log_stream_names = list(self._list_log_streams(logs_client, log_stream_prefix, end_millis))
+        LOGGER.info("Retrieving events of %s log streams from log group %s", len(log_stream_names), self.log_group_name)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=LOG_EVENTS_EXPORT_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self._download_log_stream_events, logs_client, log_stream_name, start_millis, end_millis, destdir
+                )
+                for log_stream_name in log_stream_names
+            ]
+            try:
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _list_log_streams(self, logs_client, log_stream_prefix, end_millis):
+        """Return the names of the log streams that could contain events before end_millis."""
+        next_token = None
+        while True:
+            response = logs_client.describe_log_streams(
+                self.log_group_name, log_stream_name_prefix=log_stream_prefix, next_token=next_token
+            )
+            for log_stream in response.get("logStreams", []):
+                first_event = log_stream.get("firstEventTimestamp", log_stream.get("creationTime"))
+                if not end_millis or not first_event or first_event <= end_millis:
+                    yield log_stream["logStreamName"]
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+
+    def _download_log_stream_events(self, logs_client, log_stream_name, start_millis, end_millis, destdir):
+        """Write the events of the given log stream into destdir, the file is created only if there are events."""
+        stream_path = os.path.join(destdir, log_stream_name)
+        with ExitStack() as stack:
+            stream_file = None
+            for events in self._log_stream_events_pages(logs_client, log_stream_name, start_millis, end_millis):
+                if events and not stream_file:
+                    os.makedirs(os.path.dirname(stream_path), exist_ok=True)
+                    stream_file = stack.enter_context(open(stream_path, "w", encoding="utf-8"))
+                for event in events:
+                    stream_file.write(f"{_format_event_timestamp(event['timestamp'])} {event['message']}\n")
+
+    def _log_stream_events_pages(self, logs_client, log_stream_name, start_millis, end_millis):
+        """Return the pages of events of the given log stream in the time range."""
+        next_token = None
+        while True:
+            response = self._get_log_events(logs_client, log_stream_name, start_millis, end_millis, next_token)
+            yield response.get("events", [])
+            # The end of the stream is reached when the same token is returned
+            if not response.get("nextForwardToken") or response["nextForwardToken"] == next_token:
+                break
+            next_token = response["nextForwardToken"]
+
+    def _get_log_events(self, logs_client, log_stream_name, start_millis, end_millis, next_token):
+        """Retrieve a page of log events, retrying with exponential backoff when throttled."""
+        attempt = 0
+        while True:
+            try:
+                return logs_client.get_log_events(
+                    self.log_group_name,
+                    log_stream_name,
+                    start_time=start_millis,
+                    # The end time of export tasks is inclusive, while the one of GetLogEvents is exclusive
+                    end_time=end_millis and end_millis + 1,
+                    start_from_head=True,
+                    next_token=next_token,
+                )
+            except LimitExceededError:
+                if attempt >= LOG_EVENTS_THROTTLING_MAX_RETRIES:
+                    raise
+                backoff = min(LOG_EVENTS_THROTTLING_MAX_BACKOFF_SEC, 0.5 * 2**attempt)
+                LOGGER.debug("Throttled when retrieving events of %s, retrying in %s seconds", log_stream_name, backoff)
+                time.sleep(backoff)
+                attempt += 1
+
+    def _split_time_range(self, start_time: datetime.datetime, end_time: datetime.datetime):
+        """
+        Split the given time range in export_windows consecutive windows.
+
+        The time range of an export task includes both its ends, so every window ends one millisecond
+        before the beginning of the following one to avoid exporting the same events twice.
+        """
+        if self.export_windows == 1 or not start_time or not end_time:
+            return [(start_time, end_time)]
+        start_millis = datetime_to_epoch(start_time)
+        end_millis = datetime_to_epoch(end_time)
+        windows_count = max(1, min(self.export_windows, end_millis - start_millis))
+        boundaries = [
+            start_millis + (end_millis - start_millis) * index // windows_count for index in range(windows_count + 1)
+        ]
+        windows = []
+        for index in range(windows_count):
+            window_start = start_time if index == 0 else _epoch_millis_to_datetime(boundaries[index])
+            window_end = (
+                end_time if index == windows_count - 1 else _epoch_millis_to_datetime(boundaries[index + 1] - 1)
+            )
+            windows.append((window_start, window_end))
+        return windows
+
+    def _export_windows_to_dir(self, windows, log_stream_prefix, destdir, task_ids):
+        """
+        Export the given time windows and download them into destdir.
+
+        Export tasks are started for as many windows as allowed by the CloudWatch Logs service,
+        and the logs of every window are downloaded as soon as its export task completes,
+        while the export of the following windows is still in progress.
+        Downloaded windows are appended to the log stream files in chronological order.
+        """
+        windows_dir = tempfile.mkdtemp(prefix=".cloudwatch-logs-windows-", dir=self.output_dir)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as download_executor:
+                try:
+                    downloads = self._export_windows(
+                        windows, log_stream_prefix, windows_dir, download_executor, task_ids
+                    )
+                except AWSClientError as e:
+                    raise self._export_task_error(e)
+                for index in range(len(windows)):
+                    downloads[index].result()
+                    self._merge_window(os.path.join(windows_dir, str(index)), destdir)
+        finally:
+            shutil.rmtree(windows_dir, ignore_errors=True)
+
+    def _export_windows(self, windows, log_stream_prefix, windows_dir, download_executor, task_ids):
+        """
+        Run the export tasks of the given windows and submit the download of every completed one.
+
+        If a window fails, the export tasks still running are cancelled, so that they do not hold the limit
+        of active export tasks nor write into the bucket prefix after it has been cleaned up.
+        """
+        pending_windows = deque(enumerate(windows))
+        running_tasks = {}
+        max_running_tasks = None
+        downloads = {}
+        try:
+            while pending_windows or running_tasks:
+                max_running_tasks = self._start_window_exports(
+                    len(windows), pending_windows, running_tasks, max_running_tasks, log_stream_prefix, task_ids
+                )
+                time.sleep(1)
+                for index, task_id in list(running_tasks.items()):
+                    status = AWSApi.instance().logs.get_export_task_status(task_id)
+                    if status in EXPORT_TASK_RUNNING_STATUSES:
+                        continue
+                    del running_tasks[index]
+                    if status != "COMPLETED":
+                        raise LogsExporterError(f"CloudWatch logs export task {task_id} failed with status: {status}")
+                    downloads[index] = download_executor.submit(
+                        self._download_s3_objects_with_prefix, task_id, os.path.join(windows_dir, str(index))
+                    )
+                # Stop the export as soon as the download of a window fails
+                failed_download = next((d for d in downloads.values() if d.done() and d.exception()), None)
+                if failed_download:
+                    raise failed_download.exception()
+        finally:
+            for task_id in running_tasks.values():
+                self._cancel_export_task(task_id)
+        return downloads
+
+    def _start_window_exports(
+        self, windows_count, pending_windows, running_tasks, max_running_tasks, log_stream_prefix, task_ids
+    ):
+        """
+        Start the export tasks of the pending windows, as long as the CloudWatch Logs service allows it.
+
+        :return: the maximum number of export tasks that can be active at the same time, None if still unknown
+        """
+        while pending_windows and (max_running_tasks is None or len(running_tasks) < max_running_tasks):
+            index, (start_time, end_time) = pending_windows[0]
+            try:
+                task_id = self._create_export_task(log_stream_prefix, start_time, end_time)
+            except AWSClientError as e:
+                if e.error_code != "LimitExceededException" or not running_tasks:
+                    raise
+                # The maximum number of export tasks that can be active at the same time has been reached
+                return len(running_tasks)
+            LOGGER.info("Log export task id for window %s/%s: %s", index + 1, windows_count, task_id)
+            pending_windows.popleft()
+            running_tasks[index] = task_id
+            task_ids.append(task_id)
+        return max_running_tasks
+
+    @staticmethod
+    def _cancel_export_task(task_id):
+        try:
+            LOGGER.info("Cancelling log export task %s", task_id)
+            AWSApi.instance().logs.cancel_export_task(task_id)
+        except AWSClientError as e:
+            # The task may have completed in the meantime
+            LOGGER.warning("Unable to cancel log export task %s: %s", task_id, e)
+
+    @staticmethod
+    def _merge_window(window_dir, destdir):
+        """Append the log streams downloaded for a window to the ones in destdir."""
+        for dirpath, _, filenames in os.walk(window_dir):
+            for filename in filenames:
+                window_path = os.path.join(dirpath, filename)
+                stream_path = os.path.join(destdir, os.path.relpath(window_path, window_dir))
+                os.makedirs(os.path.dirname(stream_path), exist_ok=True)
+                with open(window_path, "rb") as window_file, open(stream_path, "ab") as stream_file:
+                    shutil.copyfileobj(window_file, stream_file, LOGS_DOWNLOAD_CHUNK_SIZE)
+        shutil.rmtree(window_dir, ignore_errors=True)
 
     def _export_logs_to_s3(
         self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None
     ):
         """Export the contents of an image's CloudWatch log group to an s3 bucket."""
         try:
-            LOGGER.debug("Starting export of logs from log group %s to s3 bucket %s", self.log_group_name, self.bucket)
-            task_id = AWSApi.instance().logs.create_export_task(
-                log_group_name=self.log_group_name,
-                log_stream_name_prefix=log_stream_prefix,
-                bucket=self.bucket,
-                bucket_prefix=self.bucket_prefix,
-                start_time=start_time,
-                end_time=end_time,
-            )
-
+            task_id = self._create_export_task(log_stream_prefix, start_time, end_time)
             result_status = self._wait_for_task_completion(task_id)
             if result_status != "COMPLETED":
                 raise LogsExporterError(f"CloudWatch logs export task {task_id} failed with status: {result_status}")
             return task_id
         except AWSClientError as e:
-            # TODO use log type/class
-            if "Please check if CloudWatch Logs has been granted permission to perform this operation." in str(e):
-                raise LogsExporterError(
-                    f"CloudWatch Logs needs GetBucketAcl and PutObject permission for the s3 bucket {self.bucket}. "
-                    "See https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/S3ExportTasks.html#S3Permissions "
-                    "for more details."
-                )
-            raise LogsExporterError(f"Unexpected error when starting export task: {e}")
+            raise self._export_task_error(e)
+
+    def _create_export_task(
+        self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None
+    ):
+        """Start the export of the log group to the s3 bucket and return the task id."""
+        LOGGER.debug("Starting export of logs from log group %s to s3 bucket %s", self.log_group_name, self.bucket)
+        return AWSApi.instance().logs.create_export_task(
+            log_group_name=self.log_group_name,
+            log_stream_name_prefix=log_stream_prefix,
+            bucket=self.bucket,
+            bucket_prefix=self.bucket_prefix,
+            start_time=start_time,
+            end_time=end_time,
+        )
+
+    def _export_task_error(self, error: AWSClientError):
+        # TODO use log type/class
+        if "Please check if CloudWatch Logs has been granted permission to perform this operation." in str(error):
+            return LogsExporterError(
+                f"CloudWatch Logs needs GetBucketAcl and PutObject permission for the s3 bucket {self.bucket}. "
+                "See https://docs.aws.amazon.com/AmazonCloudWatch/latest/logs/S3ExportTasks.html#S3Permissions "
+                "for more details."
+            )
+        return LogsExporterError(f"Unexpected error when starting export task: {error}")
 
     @staticmethod
     def _wait_for_task_completion(task_id):
         """Wait for the CloudWatch logs export task given by task_id to finish."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
         status = "PENDING"
-        still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
-        while status in still_running_statuses:
+        while status in EXPORT_TASK_RUNNING_STATUSES:
             time.sleep(1)
             status = AWSApi.instance().logs.get_export_task_status(task_id)
         return status
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir.
+
+        Objects are downloaded concurrently and decompressed while they are streamed from S3,
+        so that they are never entirely loaded in memory nor stored compressed on disk.
+        Objects belonging to the same log stream are appended to the same file in key order.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        keys_by_path = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
             decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
             decompressed_path = decompressed_path.replace(
                 r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
             )
-            compressed_path = f"{decompressed_path}.gz"
-
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
-            )
-
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+            keys_by_path.setdefault(decompressed_path, []).append(archive_object.key)
+
+        total_objects = sum(len(keys) for keys in keys_by_path.values())
+        LOGGER.info("Downloading %s exported log objects from s3 bucket %s", total_objects, self.bucket)
+        s3_client = AWSApi.instance().s3
+        with concurrent.futures.ThreadPoolExecutor(max_workers=LOGS_DOWNLOAD_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self._download_log_stream, s3_client, sorted(keys), decompressed_path)
+                for decompressed_path, keys in keys_by_path.items()
+            ]
+            try:
+                downloaded_objects = 0
+                last_report = time.monotonic()
+                for future in concurrent.futures.as_completed(futures):
+                    downloaded_objects += future.result()
+                    if time.monotonic() - last_report >= LOGS_DOWNLOAD_PROGRESS_INTERVAL_SEC:
+                        LOGGER.info("Downloaded %s/%s exported log objects", downloaded_objects, total_objects)
+                        last_report = time.monotonic()
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+        LOGGER.info("Downloaded %s/%s exported log objects", total_objects, total_objects)
+
+    def _download_log_stream(self, s3_client, keys, decompressed_path):
+        """Download and decompress the given objects, in the given order, into decompressed_path."""
+        os.makedirs(os.path.dirname(decompressed_path), exist_ok=True)
+        with open(decompressed_path, "wb") as outfile:
+            for key in keys:
+                LOGGER.debug("Downloading object with key=%s to %s", key, decompressed_path)
+                body = s3_client.get_object(bucket_name=self.bucket, key=key)["Body"]
+                try:
+                    with gzip.GzipFile(fileobj=body) as gfile:
+                        shutil.copyfileobj(gfile, outfile, LOGS_DOWNLOAD_CHUNK_SIZE)
+                finally:
+                    body.close()
+        return len(keys)
+
+
+def _format_event_timestamp(epoch_millis: int):
+    """Format the timestamp of a log event as in the objects created by CloudWatch Logs export tasks."""
+    timestamp = datetime.datetime.fromtimestamp(epoch_millis // 1000, tz=datetime.timezone.utc)
+    return f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')}.{epoch_millis % 1000:03d}Z"
+
+
+def _epoch_millis_to_datetime(epoch_millis: int):
+    """Convert unix epoch with milliseconds to UTC datetime, so that datetime_to_epoch returns the same value."""
+    # Half a millisecond is added because datetime_to_epoch truncates the value, which could then be
+    # affected by floating point errors
+    return datetime.datetime.fromtimestamp(0, tz=datetime.timezone.utc) + datetime.timedelta(
+        milliseconds=epoch_millis + 0.5
+    )
 
 
 def get_all_stack_events(stack_name: str):
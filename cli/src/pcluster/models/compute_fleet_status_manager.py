@@ -9,17 +9,19 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-import time
 from abc import ABCMeta, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
+from typing import List
 
 from boto3.dynamodb.conditions import Attr
 from pkg_resources import packaging
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
+from pcluster.aws.dynamo import BATCH_GET_ITEM_MAX_KEYS
 from pcluster.constants import PCLUSTER_DYNAMODB_PREFIX
+from pcluster.utils import grouper, poll_with_backoff
 
 LOGGER = logging.getLogger(__name__)
 
@@ -79,18 +81,17 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         status, _ = self.get_status_with_last_updated_time(status_fallback=fallback)
         return status
 
-    def _wait_for_status_transition(self, wait_on_status, timeout=300, retry_every_seconds=15):
-        current_status = self.get_status()
-        start_time = time.time()
-        while current_status == wait_on_status and not self._timeout_expired(start_time, timeout):
-            current_status = self.get_status()
-            time.sleep(retry_every_seconds)
-
-        if current_status == wait_on_status:
+    def _wait_for_status_transition(self, wait_on_status, timeout=300, max_retry_interval=15):
+        try:
+            return poll_with_backoff(
+                self.get_status,
+                until=lambda status: status != wait_on_status,
+                timeout=timeout,
+                max_interval=max_retry_interval,
+            )
+        except TimeoutError:
             raise TimeoutError("Timeout expired while waiting for status transition.")
 
-        return current_status
-
     def update_status(self, request_status, in_progress_status, final_status, wait_transition=False):
         """
         Update the status of the compute fleet and wait for a status transition.
@@ -143,6 +144,45 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         """Get compute fleet status and the last compute fleet status updated time."""
         pass
 
+    @property
+    @abstractmethod
+    def _status_item_key(self):
+        """Return the key of the item storing the compute fleet status."""
+        pass
+
+    @abstractmethod
+    def _parse_status_item(self, item):
+        """Return compute fleet status and last updated time stored in the given item."""
+        pass
+
+    @staticmethod
+    def get_statuses(managers: List["ComputeFleetStatusManager"], fallback=ComputeFleetStatus.UNKNOWN):
+        """
+        Get the compute fleet status of multiple clusters, retrieving them with BatchGetItem requests.
+
+        The statuses not returned by the batch requests are retrieved one by one.
+        Return the statuses in the same order of the given managers.
+        """
+        statuses = {}
+        for chunk in grouper(managers, BATCH_GET_ITEM_MAX_KEYS):
+            try:
+                items = AWSApi.instance().ddb_resource.batch_get_item(
+                    {manager._table_name: manager._status_item_key for manager in chunk}
+                )
+            except AWSClientError as e:
+                LOGGER.info("Failed when retrieving fleet statuses from DynamoDB with error %s", e)
+                items = {}
+            for manager in chunk:
+                status = None
+                if manager._table_name in items:
+                    try:
+                        status, _ = manager._parse_status_item(items[manager._table_name])
+                    except Exception as e:
+                        LOGGER.warning("Unable to parse fleet status from DynamoDB item with error %s", e)
+                        status = fallback
+                statuses[manager._table_name] = status or manager.get_status(fallback=fallback)
+        return [statuses[manager._table_name] for manager in managers]
+
     @staticmethod
     def get_manager(cluster_name, version, scheduler):
         """Return compute fleet status manager based on version and plugin."""
@@ -151,10 +191,6 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         else:
             return JsonComputeFleetStatusManager(cluster_name)
 
-    @staticmethod
-    def _timeout_expired(start_time, timeout):
-        return (time.time() - start_time) > timeout
-
 
 class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     """
@@ -185,15 +221,10 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, {"Id": self.DB_KEY})
+            compute_fleet_item = AWSApi.instance().ddb_resource.get_item(self._table_name, self._status_item_key)
             if not compute_fleet_item or "Item" not in compute_fleet_item:
                 raise Exception("COMPUTE_FLEET data not found in db table")
-            return (
-                ComputeFleetStatus(
-                    compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)
-                ),
-                compute_fleet_item["Item"].get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_status_item(compute_fleet_item["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -202,6 +233,16 @@ class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    @property
+    def _status_item_key(self):
+        return {"Id": self.DB_KEY}
+
+    def _parse_status_item(self, item):
+        return (
+            ComputeFleetStatus(item.get(self.DB_DATA).get(self.COMPUTE_FLEET_STATUS_ATTRIBUTE)),
+            item.get(self.DB_DATA).get(self.COMPUTE_FLEET_LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
@@ -248,15 +289,10 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
     ):
         """Get compute fleet status and the last compute fleet status updated time."""
         try:
-            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(
-                self._table_name, {"Id": self.COMPUTE_FLEET_STATUS_KEY}
-            )
+            compute_fleet_status = AWSApi.instance().ddb_resource.get_item(self._table_name, self._status_item_key)
             if not compute_fleet_status or "Item" not in compute_fleet_status:
                 raise Exception("COMPUTE_FLEET status not found in db table")
-            return (
-                ComputeFleetStatus(compute_fleet_status["Item"][self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
-                compute_fleet_status["Item"].get(self.LAST_UPDATED_TIME_ATTRIBUTE),
-            )
+            return self._parse_status_item(compute_fleet_status["Item"])
         except Exception as e:
             LOGGER.warning(
                 "Failed when retrieving fleet status from DynamoDB with error %s. "
@@ -265,6 +301,16 @@ class PlainTextComputeFleetStatusManager(ComputeFleetStatusManager):
             )
             return status_fallback, last_updated_time_fallback
 
+    @property
+    def _status_item_key(self):
+        return {"Id": self.COMPUTE_FLEET_STATUS_KEY}
+
+    def _parse_status_item(self, item):
+        return (
+            ComputeFleetStatus(item[self.COMPUTE_FLEET_STATUS_ATTRIBUTE]),
+            item.get(self.LAST_UPDATED_TIME_ATTRIBUTE),
+        )
+
     def _put_status(self, current_status, next_status):
         """Set compute fleet status on DB."""
         try:
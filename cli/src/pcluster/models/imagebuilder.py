@@ -678,6 +678,7 @@ class ImageBuilder:
         start_time: datetime = None,
         end_time: datetime = None,
         output_file: str = None,
+        export_windows: int = 1,
     ):
         """
         Export image builder's logs in the given output path, by using given bucket as a temporary folder.
@@ -688,6 +689,8 @@ class ImageBuilder:
         :param keep_s3_objects: Keep the exported objects exports to S3. The default behavior is to delete them
         :param start_time: Start time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
+        :param export_windows: Number of time windows the logs are exported in, exports of different windows run
+               concurrently when allowed by CloudWatch Logs and they are downloaded while the others are in progress
         """
         # check stack
         stack_exists = self._stack_exists()
@@ -711,6 +714,7 @@ class ImageBuilder:
                         output_dir=root_archive_dir,
                         bucket_prefix=bucket_prefix,
                         keep_s3_objects=keep_s3_objects,
+                        export_windows=export_windows,
                     )
                     logs_exporter.execute(
                         start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
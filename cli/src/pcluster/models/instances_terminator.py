@@ -0,0 +1,220 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import logging
+import random
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError, LimitExceededError
+from pcluster.utils import grouper
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum number of instances terminated by each TerminateInstances request
+TERMINATE_INSTANCES_BATCH_SIZE = 100
+TERMINATE_INSTANCES_MAX_WORKERS = 8
+# Initial and maximum rate of TerminateInstances requests per second, and number of requests that can be sent at once
+TERMINATE_INSTANCES_REQUESTS_PER_SECOND = 5
+TERMINATE_INSTANCES_BURST = 10
+TERMINATE_INSTANCES_MAX_ATTEMPTS = 6
+THROTTLING_BACKOFF_BASE_SEC = 0.5
+THROTTLING_BACKOFF_MAX_SEC = 20
+DESCRIBE_INSTANCE_STATUS_MAX_IDS = 100
+TERMINATING_STATES = {"shutting-down", "terminated"}
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket limiting the rate of the requests sent to a service.
+
+    The rate is halved every time a request is throttled, and then increased again by a fraction of the initial rate
+    for every successful request, up to the initial rate.
+    """
+
+    def __init__(self, rate: float, capacity: int, min_rate: float = None):
+        self.__max_rate = rate
+        self.__min_rate = min_rate or rate / 10
+        self.__rate = rate
+        self.__capacity = capacity
+        self.__tokens = capacity
+        self.__last_refill = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the current number of requests per second."""
+        return self.__rate
+
+    def acquire(self):
+        """Wait until a request can be sent."""
+        while True:
+            with self.__lock:
+                now = time.monotonic()
+                self.__tokens = min(self.__capacity, self.__tokens + (now - self.__last_refill) * self.__rate)
+                self.__last_refill = now
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+                    return
+                wait_time = (1 - self.__tokens) / self.__rate
+            time.sleep(wait_time)
+
+    def on_throttled(self):
+        """Reduce the rate of the requests after a request has been throttled."""
+        with self.__lock:
+            self.__rate = max(self.__min_rate, self.__rate / 2)
+            self.__tokens = 0
+
+    def on_success(self):
+        """Increase the rate of the requests after a successful request."""
+        with self.__lock:
+            self.__rate = min(self.__max_rate, self.__rate + self.__max_rate / 10)
+
+
+class InstancesTerminationReport:
+    """Represent the result of the termination of a set of instances."""
+
+    def __init__(self):
+        self.__terminated = []
+        self.__failed = {}
+        self.__not_terminating = []
+        self.__lock = threading.Lock()
+
+    @property
+    def terminated(self) -> List[str]:
+        """Return the ids of the instances whose termination has been requested."""
+        return list(self.__terminated)
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        """Return the errors of the instances that could not be terminated, by instance id."""
+        return dict(self.__failed)
+
+    @property
+    def not_terminating(self) -> List[str]:
+        """Return the ids of the instances that were not shutting down after the termination request."""
+        return list(self.__not_terminating)
+
+    def add_terminated(self, instance_ids: Tuple[str]):
+        """Record instances whose termination has been requested, returning the number of instances processed."""
+        with self.__lock:
+            self.__terminated.extend(instance_ids)
+            return len(self.__terminated) + len(self.__failed)
+
+    def add_failed(self, instance_ids: Tuple[str], error: str):
+        """Record instances that could not be terminated, returning the number of instances processed."""
+        with self.__lock:
+            self.__failed.update({instance_id: error for instance_id in instance_ids})
+            return len(self.__terminated) + len(self.__failed)
+
+    def set_not_terminating(self, instance_ids: List[str]):
+        """Record instances that were not shutting down after the termination request."""
+        self.__not_terminating = list(instance_ids)
+
+
+class InstancesTerminator:
+    """
+    Terminate EC2 instances sending concurrent TerminateInstances requests.
+
+    Requests are rate limited with a token bucket, which slows down when requests are throttled. Throttled requests
+    are retried with exponential backoff. Once all the requests have been sent, the instances are checked to be
+    shutting down with DescribeInstanceStatus.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = TERMINATE_INSTANCES_BATCH_SIZE,
+        max_workers: int = TERMINATE_INSTANCES_MAX_WORKERS,
+        rate_limiter: TokenBucket = None,
+        max_attempts: int = TERMINATE_INSTANCES_MAX_ATTEMPTS,
+    ):
+        self.__batch_size = batch_size
+        self.__max_workers = max_workers
+        self.__rate_limiter = rate_limiter or TokenBucket(
+            TERMINATE_INSTANCES_REQUESTS_PER_SECOND, TERMINATE_INSTANCES_BURST
+        )
+        self.__max_attempts = max_attempts
+
+    def terminate(self, instance_ids: Iterable[str]) -> InstancesTerminationReport:
+        """
+        Terminate the given instances and return the termination report.
+
+        Instance ids can be provided by a lazy iterable, they are consumed while the batches are terminated.
+        """
+        report = InstancesTerminationReport()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+            pending = set()
+            for batch in grouper(instance_ids, self.__batch_size):
+                # Limit the number of batches waiting to be sent to avoid consuming all the instance ids in advance
+                if len(pending) >= 2 * self.__max_workers:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(executor.submit(self._terminate_batch, batch, report))
+            for future in concurrent.futures.as_completed(pending):
+                future.result()
+
+            self._verify_termination(report, executor)
+        return report
+
+    def _terminate_batch(self, instance_ids: Tuple[str], report: InstancesTerminationReport):
+        error = None
+        for attempt in range(self.__max_attempts):
+            self.__rate_limiter.acquire()
+            try:
+                AWSApi.instance().ec2.terminate_instances(instance_ids)
+                self.__rate_limiter.on_success()
+                processed = report.add_terminated(instance_ids)
+                LOGGER.info("Requested termination of %s instances: %s", len(instance_ids), instance_ids)
+                LOGGER.info("Termination progress: %s instances processed", processed)
+                return
+            except LimitExceededError as e:
+                error = e
+                self.__rate_limiter.on_throttled()
+                backoff = min(THROTTLING_BACKOFF_MAX_SEC, THROTTLING_BACKOFF_BASE_SEC * 2**attempt)
+                LOGGER.warning(
+                    "Termination of %s instances throttled, retrying in %.1f seconds with a rate of %.2f "
+                    "requests per second",
+                    len(instance_ids),
+                    backoff,
+                    self.__rate_limiter.rate,
+                )
+                # The random jitter spreads the retries of concurrent batches, it is not used for security purposes.
+                time.sleep(backoff * random.uniform(0.5, 1))  # nosec B311
+            except AWSClientError as e:
+                error = e
+                break
+        LOGGER.error("Unable to terminate instances %s: %s", instance_ids, error)
+        report.add_failed(instance_ids, str(error))
+
+    @staticmethod
+    def _verify_termination(report: InstancesTerminationReport, executor: concurrent.futures.Executor):
+        terminated = report.terminated
+        try:
+            states = {}
+            for batch_states in executor.map(
+                AWSApi.instance().ec2.get_instance_states, grouper(terminated, DESCRIBE_INSTANCE_STATUS_MAX_IDS)
+            ):
+                states.update(batch_states)
+        except AWSClientError as e:
+            LOGGER.warning("Unable to verify the state of the terminated instances: %s", e)
+            return
+        # Instances not returned by DescribeInstanceStatus are no longer visible, so they have been terminated
+        not_terminating = [
+            instance_id
+            for instance_id in terminated
+            if instance_id in states and states[instance_id] not in TERMINATING_STATES
+        ]
+        if not_terminating:
+            LOGGER.warning("The following instances are not shutting down: %s", not_terminating)
+        report.set_not_terminating(not_terminating)
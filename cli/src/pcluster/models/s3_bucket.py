@@ -18,16 +18,23 @@ import logging
 import os
 import re
 from enum import Enum
+from io import BytesIO
 
 import yaml
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
+from pcluster.aws.persistent_cache import PersistentCache
 from pcluster.constants import PCLUSTER_S3_BUCKET_VERSION
 from pcluster.utils import get_partition, get_url_domain_suffix, yaml_load, zip_dir
 
 LOGGER = logging.getLogger(__name__)
 
+# Metadata of the uploaded objects containing the SHA-256 of their content, used to skip the upload of unchanged objects
+CONTENT_HASH_METADATA_KEY = "content-sha256"
+# Expiration time of the archives of the resource directories stored in the persistent cache
+ZIPPED_RESOURCES_CACHE_TTL_SEC = 7 * 24 * 60 * 60
+
 
 class S3FileFormat(Enum):
     """Define S3 file format."""
@@ -66,6 +73,8 @@ class S3Bucket:
         self._root_directory = "parallelcluster"
         self._bootstrapped_file_name = ".bootstrapped"
         self.artifact_directory = artifact_directory
+        # Set when the artifact directory has just been generated, so that no object can exist under it
+        self.is_new_artifact_directory = False
         self._is_custom_bucket = is_custom_bucket
         self.__partition = None
         self.__region = None
@@ -221,19 +230,28 @@ class S3Bucket:
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
         """
-        for res in os.listdir(resource_dir):
+        for res in sorted(os.listdir(resource_dir)):
             path = os.path.join(resource_dir, res)
             if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
+                key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name)
+                content = _zip_resource_dir(path)
+                self._upload_if_changed(
+                    key,
+                    content,
+                    lambda metadata, key=key, content=content: AWSApi.instance().s3.upload_fileobj(
+                        file_obj=BytesIO(content), bucket_name=self.name, key=key, metadata=metadata
+                    ),
                 )
             elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
+                key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, res)
+                with open(path, "rb") as resource_file:
+                    content = resource_file.read()
+                self._upload_if_changed(
+                    key,
+                    content,
+                    lambda metadata, key=key, path=path: AWSApi.instance().s3.upload_file(
+                        file_path=path, bucket_name=self.name, key=key, metadata=metadata
+                    ),
                 )
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
@@ -271,13 +289,38 @@ class S3Bucket:
     # --------------------------------------- S3 private functions --------------------------------------- #
 
     def upload_file(self, content, file_name, file_type, format=S3FileFormat.YAML):
-        """Upload file to S3 bucket."""
-        return AWSApi.instance().s3.put_object(
-            bucket_name=self.name,
-            body=format_content(content, format),
-            key=self.get_object_key(file_type, file_name),
+        """Upload file to S3 bucket, unless an object with the same content is already present."""
+        body = format_content(content, format)
+        key = self.get_object_key(file_type, file_name)
+        return self._upload_if_changed(
+            key,
+            body.encode("utf-8") if isinstance(body, str) else body,
+            lambda metadata: AWSApi.instance().s3.put_object(
+                bucket_name=self.name, body=body, key=key, metadata=metadata
+            ),
         )
 
+    def _upload_if_changed(self, key: str, content: bytes, upload):
+        """
+        Upload the content with the given upload function, unless the object with the given key has the same content.
+
+        The hash of the content is stored in the metadata of the uploaded object.
+        The existing object is not looked up when the artifact directory is new, e.g. when creating a cluster.
+        :return: the response of the upload, or the VersionId of the existing object if the upload is skipped.
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        if self.is_new_artifact_directory:
+            return upload(metadata={CONTENT_HASH_METADATA_KEY: content_hash})
+        try:
+            response = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key)
+            if response.get("Metadata", {}).get(CONTENT_HASH_METADATA_KEY) == content_hash:
+                LOGGER.info("Skipping upload of unchanged object %s", key)
+                return {"VersionId": response.get("VersionId")}
+        except AWSClientError as e:
+            if e.error_code != "404":
+                LOGGER.debug("Unable to retrieve metadata of object %s: %s", key, e)
+        return upload(metadata={CONTENT_HASH_METADATA_KEY: content_hash})
+
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
         """Get file from S3 bucket."""
         result = AWSApi.instance().s3.get_object(
@@ -431,3 +474,28 @@ def format_content(content, s3_file_format: S3FileFormat):
         return json.dumps(content, separators=(",", ":"))
     else:
         return content
+
+
+def _zip_resource_dir(path):
+    """
+    Return the content of the zip archive of the given directory.
+
+    When the persistent cache is enabled, the archive created by a previous invocation is reused if the files in the
+    directory did not change.
+    """
+    if not PersistentCache.is_enabled():
+        return zip_dir(path).getvalue()
+
+    fingerprint = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for file in sorted(files):
+            file_stat = os.stat(os.path.join(root, file))
+            relative_path = os.path.relpath(os.path.join(root, file), start=path)
+            fingerprint.update(f"{relative_path}:{file_stat.st_size}:{file_stat.st_mtime_ns}\n".encode("utf-8"))
+    cache_key = f"zip_dir:{os.path.abspath(path)}:{fingerprint.hexdigest()}"
+    found, content = PersistentCache.instance().get(cache_key)
+    if not found:
+        content = zip_dir(path).getvalue()
+        PersistentCache.instance().put(cache_key, "zip_dir", None, content, ttl=ZIPPED_RESOURCES_CACHE_TTL_SEC)
+    return content
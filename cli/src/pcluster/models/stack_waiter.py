@@ -0,0 +1,175 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import time
+from typing import Callable, Dict, List
+
+from pcluster.aws.aws_api import AWSApi
+
+LOGGER = logging.getLogger(__name__)
+
+NESTED_STACK_RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+STACK_EVENTS_MIN_POLL_INTERVAL_SEC = 2
+STACK_EVENTS_MAX_POLL_INTERVAL_SEC = 15
+STACK_EVENTS_POLL_BACKOFF_FACTOR = 1.5
+
+
+def is_stack_in_progress(status: str):
+    """Return True if the given stack status is not a terminal one."""
+    return status.endswith("_IN_PROGRESS")
+
+
+class StackEventsCursor:
+    """
+    Retrieve the events of a stack incrementally.
+
+    Events are returned by DescribeStackEvents from the newest to the oldest, so only the pages up to the last event
+    already seen are retrieved.
+    """
+
+    def __init__(self, stack_name: str, since=None):
+        self.__stack_name = stack_name
+        self.__since = since
+        self.__last_event_id = None
+
+    def skip_completed_operations(self):
+        """
+        Move the cursor after the events of the stack operations already completed.
+
+        The events of an operation in progress are still returned, even if they occurred before the call.
+        """
+        next_token = None
+        while True:
+            response = AWSApi.instance().cfn.get_stack_events(self.__stack_name, next_token=next_token)
+            for event in response["StackEvents"]:
+                if event.get("PhysicalResourceId") == event["StackId"] and not is_stack_in_progress(
+                    event["ResourceStatus"]
+                ):
+                    self.__last_event_id = event["EventId"]
+                    return
+            next_token = response.get("NextToken")
+            if not next_token:
+                return
+
+    def fetch(self) -> List[Dict]:
+        """Return the events occurred after the last call, from the oldest to the newest."""
+        new_events = []
+        next_token = None
+        while True:
+            response = AWSApi.instance().cfn.get_stack_events(self.__stack_name, next_token=next_token)
+            for event in response["StackEvents"]:
+                if event["EventId"] == self.__last_event_id or (self.__since and event["Timestamp"] < self.__since):
+                    next_token = None
+                    break
+                new_events.append(event)
+            else:
+                next_token = response.get("NextToken")
+            if not next_token:
+                break
+        if new_events:
+            self.__last_event_id = new_events[0]["EventId"]
+        return list(reversed(new_events))
+
+
+class StackWaiter:
+    """
+    Wait for the completion of a stack operation, streaming the events of the stack and of its nested stacks.
+
+    Only the events of the operation in progress are streamed, the ones of the previous operations are skipped.
+
+    The stack events are polled often while the stack is changing, then less frequently when no new events are
+    returned. The wait ends as soon as the stack reaches a terminal status.
+    """
+
+    def __init__(
+        self,
+        stack_name: str,
+        on_event: Callable[[Dict], None] = None,
+        get_status: Callable[[], str] = None,
+        is_in_progress: Callable[[str], bool] = is_stack_in_progress,
+        min_interval: float = STACK_EVENTS_MIN_POLL_INTERVAL_SEC,
+        max_interval: float = STACK_EVENTS_MAX_POLL_INTERVAL_SEC,
+        backoff_factor: float = STACK_EVENTS_POLL_BACKOFF_FACTOR,
+    ):
+        self.__stack_name = stack_name
+        self.__stack_id = None
+        self.__on_event = on_event
+        self.__get_status = get_status or self._describe_stack_status
+        self.__is_in_progress = is_in_progress
+        self.__min_interval = min_interval
+        self.__max_interval = max_interval
+        self.__backoff_factor = backoff_factor
+
+    def wait(self, timeout: float = None) -> str:
+        """
+        Wait for the stack to reach a status that is no longer in progress and return it.
+
+        :raise TimeoutError: if the stack is still in progress when the timeout expires
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        status = self.__get_status()
+        root_stack = self.__stack_id or self.__stack_name
+        root_cursor = StackEventsCursor(root_stack)
+        root_cursor.skip_completed_operations()
+        cursors = {root_stack: root_cursor}
+        interval = self.__min_interval
+        while True:
+            # Events are retrieved after the status, so that the events leading to a terminal status are streamed
+            has_new_events = self._stream_events(cursors)
+            if not self.__is_in_progress(status):
+                return status
+            if has_new_events:
+                interval = self.__min_interval
+            else:
+                interval = min(self.__max_interval, interval * self.__backoff_factor)
+            if deadline:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Timeout expired while waiting for stack {self.__stack_name}.")
+                interval = min(interval, remaining)
+            time.sleep(interval)
+            status = self.__get_status()
+
+    def _stream_events(self, cursors: Dict[str, StackEventsCursor]):
+        """Pass the new events of the stacks to the event handler, following the nested stacks being changed."""
+        has_new_events = False
+        for stack_name, cursor in list(cursors.items()):
+            if stack_name not in cursors:
+                continue
+            for event in cursor.fetch():
+                has_new_events = True
+                if self.__on_event:
+                    self.__on_event(event)
+                nested_stack_id = self._nested_stack_id(event)
+                if not nested_stack_id:
+                    continue
+                if is_stack_in_progress(event["ResourceStatus"]):
+                    if nested_stack_id not in cursors:
+                        LOGGER.debug("Following events of nested stack %s", nested_stack_id)
+                        cursors[nested_stack_id] = StackEventsCursor(nested_stack_id, since=event["Timestamp"])
+                elif nested_stack_id in cursors:
+                    # Retrieve the last events of the nested stack before no longer following it
+                    has_new_events |= self._stream_events({nested_stack_id: cursors.pop(nested_stack_id)})
+        return has_new_events
+
+    @staticmethod
+    def _nested_stack_id(event: Dict):
+        """Return the id of the nested stack the event refers to, if any."""
+        physical_id = event.get("PhysicalResourceId")
+        if event.get("ResourceType") == NESTED_STACK_RESOURCE_TYPE and physical_id and physical_id != event["StackId"]:
+            return physical_id
+        return None
+
+    def _describe_stack_status(self):
+        # The stack is described by id after the first call, so that its status can be retrieved after its deletion
+        stack = AWSApi.instance().cfn.describe_stack(self.__stack_id or self.__stack_name)
+        self.__stack_id = stack["StackId"]
+        return stack["StackStatus"]
@@ -110,15 +110,16 @@ class CDKArtifactsManager:
         """Return the template content."""
         return self.cluster_cdk_assembly.get_template_body()
 
-    def upload_assets(self, bucket: S3Bucket):
+    def get_assets_metadata(self, bucket: S3Bucket):
         """
-        Upload the assets in the cloud assembly directory to the cluster artifacts S3 Bucket.
+        Return the metadata of the assets in the cloud assembly directory, including their content.
 
-        Returns a mapping of the Asset Logical ID and associated parameters to be passed to the root template.
+        Every entry contains the Asset Logical ID and the associated parameters to be passed to the root template.
         Output:
         ```
         [
             {
+                'id': '<ASSET_LOGICAL_ID>',
                 'hash_parameter': {
                     'key': 'AssetParameters<ASSET_LOGICAL_ID>ArtifactHash<ALPHANUMERIC>', 'value': ''
                 },
@@ -127,7 +128,8 @@ class CDKArtifactsManager:
                 },
                 's3_object_key_parameter': {
                     'key': 'AssetParameters<ASSET_LOGICAL_ID>S3VersionKey<ALPHANUMERIC>', 'value': '<ASSET_OBJECT_KEY>'
-                }
+                },
+                'content': <ASSET_CONTENT>
             },
             ...
         ]
@@ -142,6 +144,7 @@ class CDKArtifactsManager:
             asset_id = cdk_asset.id
             assets_metadata.append(
                 {
+                    "id": asset_id,
                     # `artifactHashParameter` only needed when using `cdk deploy` to check the integrity of files
                     # uploaded to S3
                     "hash_parameter": {"key": cdk_asset.artifact_hash_parameter, "value": ""},
@@ -153,10 +156,22 @@ class CDKArtifactsManager:
                     "content": asset_file_content,
                 }
             )
-            LOGGER.info(f"Uploading asset {asset_id} to S3")
 
+        return assets_metadata
+
+    def upload_assets(self, bucket: S3Bucket):
+        """
+        Upload the assets in the cloud assembly directory to the cluster artifacts S3 Bucket.
+
+        Returns the metadata of the uploaded assets, see get_assets_metadata.
+        """
+        assets_metadata = self.get_assets_metadata(bucket)
+        for asset_metadata in assets_metadata:
+            LOGGER.info(f"Uploading asset {asset_metadata['id']} to S3")
             bucket.upload_cfn_asset(
-                asset_file_content=asset_file_content, asset_name=asset_id, format=S3FileFormat.MINIFIED_JSON
+                asset_file_content=asset_metadata["content"],
+                asset_name=asset_metadata["id"],
+                format=S3FileFormat.MINIFIED_JSON,
             )
 
         return assets_metadata
@@ -17,7 +17,8 @@ import tempfile
 
 from pcluster.config.cluster_config import BaseClusterConfig
 from pcluster.config.imagebuilder_config import ImageBuilderConfig
-from pcluster.models.s3_bucket import S3Bucket
+from pcluster.models.s3_bucket import S3Bucket, S3FileFormat
+from pcluster.templates.cluster_template_cache import ClusterTemplateCache
 from pcluster.utils import load_yaml_dict
 
 LOGGER = logging.getLogger(__name__)
@@ -30,7 +31,47 @@ class CDKTemplateBuilder:
     def build_cluster_template(
         cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
     ):
-        """Build template for the given cluster and return as output in Yaml format."""
+        """
+        Build template for the given cluster and return as output in Yaml format.
+
+        When the persistent cache is enabled, the template synthesized for the same configuration is reused.
+        """
+        template_cache = ClusterTemplateCache(cluster_config, bucket, stack_name, log_group_name)
+        if not template_cache.is_enabled():
+            generated_template, assets_metadata = CDKTemplateBuilder._synthesize_cluster_template(
+                cluster_config, bucket, stack_name, log_group_name
+            )
+        else:
+            cached_template = template_cache.get()
+            if cached_template:
+                generated_template, assets_metadata = cached_template
+            else:
+                # Synthesize the template with placeholders for the values changing at every invocation
+                with template_cache.placeholders() as stack_arguments:
+                    generated_template, assets_metadata = CDKTemplateBuilder._synthesize_cluster_template(
+                        cluster_config, bucket, stack_name, **stack_arguments
+                    )
+                template_cache.put(generated_template, assets_metadata)
+                generated_template, assets_metadata = template_cache.render(generated_template, assets_metadata)
+
+        for asset_metadata in assets_metadata:
+            LOGGER.info("Uploading asset %s to S3", asset_metadata["id"])
+            bucket.upload_cfn_asset(
+                asset_file_content=asset_metadata["content"],
+                asset_name=asset_metadata["id"],
+                format=S3FileFormat.MINIFIED_JSON,
+            )
+
+        return generated_template, assets_metadata
+
+    @staticmethod
+    def _synthesize_cluster_template(
+        cluster_config: BaseClusterConfig,
+        bucket: S3Bucket,
+        stack_name: str,
+        log_group_name: str = None,
+        timestamp: str = None,
+    ):
         LOGGER.info("Importing CDK...")
         from aws_cdk.core import App  # pylint: disable=C0415
 
@@ -43,13 +84,13 @@ class CDKTemplateBuilder:
         with tempfile.TemporaryDirectory() as cloud_assembly_dir:
             output_file = str(stack_name)
             app = App(outdir=str(cloud_assembly_dir))
-            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name)
+            ClusterCdkStack(app, output_file, stack_name, cluster_config, bucket, log_group_name, timestamp=timestamp)
 
             cloud_assembly = app.synth()
             LOGGER.info("CDK template generation completed successfully")
 
             cdk_artifacts_manager = CDKArtifactsManager(cloud_assembly)
-            assets_metadata = cdk_artifacts_manager.upload_assets(bucket=bucket)
+            assets_metadata = cdk_artifacts_manager.get_assets_metadata(bucket=bucket)
             generated_template = cdk_artifacts_manager.get_template_body()
 
         return generated_template, assets_metadata
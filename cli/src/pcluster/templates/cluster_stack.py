@@ -112,6 +112,7 @@ class ClusterCdkStack:
         cluster_config: Union[SlurmClusterConfig, AwsBatchClusterConfig],
         bucket: S3Bucket,
         log_group_name=None,
+        timestamp: str = None,
         **kwargs,
     ) -> None:
         self.stack = Stack(scope=scope, id=construct_id, **kwargs)
@@ -119,7 +120,7 @@ class ClusterCdkStack:
         self._launch_template_builder = CdkLaunchTemplateBuilder()
         self.config = cluster_config
         self.bucket = bucket
-        self.timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        self.timestamp = timestamp or datetime.utcnow().strftime("%Y%m%d%H%M%S")
         if self.config.is_cw_logging_enabled:
             if log_group_name:
                 # pcluster update keep the log group,
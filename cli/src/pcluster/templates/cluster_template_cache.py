@@ -0,0 +1,208 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# This module contains the cache of the cluster templates generated by CDK.
+#
+import hashlib
+import json
+import logging
+import re
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime
+
+from pcluster.aws.common import get_region
+from pcluster.aws.persistent_cache import PersistentCache
+from pcluster.config.cluster_config import BaseClusterConfig
+from pcluster.constants import CW_LOG_GROUP_NAME_PREFIX
+from pcluster.models.s3_bucket import S3Bucket
+from pcluster.schemas.cluster_schema import ClusterSchema
+from pcluster.utils import get_installed_version
+
+LOGGER = logging.getLogger(__name__)
+
+CLUSTER_TEMPLATE_CACHE_TTL_SEC = 24 * 60 * 60
+
+# Values changing at every invocation are replaced by placeholders during the synthesis,
+# so that the same synthesized template can be rendered for different invocations.
+CONFIG_VERSION_PLACEHOLDER = "PclusterConfigVersionPlaceholder"
+ORIGINAL_CONFIG_VERSION_PLACEHOLDER = "PclusterOriginalConfigVersionPlaceholder"
+TIMESTAMP_PLACEHOLDER = "PclusterTimestampPlaceholder"
+LOG_GROUP_NAME_PLACEHOLDER = "PclusterLogGroupNamePlaceholder"
+
+# Names of the root template parameters of an asset, e.g. AssetParameters<ASSET_ID>S3Bucket<CONSTRUCT_PATH_HASH>
+ASSET_PARAMETER_NAME_PATTERN = re.compile(r"^AssetParameters[0-9a-f]{64}(?P<name>\w+)[0-9A-F]{8}$")
+
+
+def _asset_id(asset_content):
+    """Return the id assigned by CDK to a nested stack template, i.e. the SHA-256 of its compact JSON content."""
+    serialized_content = json.dumps(asset_content, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(serialized_content.encode("utf-8")).hexdigest()
+
+
+def _asset_parameter_name(asset_parameter_name, asset_id):
+    """
+    Return the name of the given asset parameter for the asset with the given id.
+
+    CDK names the parameter after its construct path, suffixed by the first 8 characters of the MD5 of the path.
+    """
+    match = ASSET_PARAMETER_NAME_PATTERN.match(asset_parameter_name)
+    if not match:
+        # Unknown naming scheme, the asset id contained in the name is replaced as any other occurrence
+        return asset_parameter_name
+    construct_path = f"AssetParameters/{asset_id}/{match.group('name')}"
+    path_hash = hashlib.md5(construct_path.encode("utf-8")).hexdigest()[:8].upper()  # nosec B303 B324
+    return f"AssetParameters{asset_id}{match.group('name')}{path_hash}"
+
+
+def _replace_placeholders(content, replacements: dict):
+    """Replace the placeholders in all the keys and string values of the given content."""
+    if isinstance(content, dict):
+        return {
+            _replace_placeholders(key, replacements): _replace_placeholders(value, replacements)
+            for key, value in content.items()
+        }
+    if isinstance(content, list):
+        return [_replace_placeholders(item, replacements) for item in content]
+    if isinstance(content, str):
+        for placeholder, value in replacements.items():
+            content = content.replace(placeholder, value)
+    return content
+
+
+class ClusterTemplateCache:
+    """
+    Cache of the templates and assets synthesized by CDK for a cluster.
+
+    Entries are stored in the PersistentCache and are keyed by a hash of the cluster configuration, together with
+    the other inputs of the synthesis (version of ParallelCluster, stack, bucket, region and resolved AMIs).
+    The values depending on the single invocation (config versions, wait condition timestamp and log group name,
+    which contains the creation time of a new cluster) are synthesized as placeholders, that are replaced when the
+    template is retrieved.
+    """
+
+    def __init__(
+        self, cluster_config: BaseClusterConfig, bucket: S3Bucket, stack_name: str, log_group_name: str = None
+    ):
+        self.__cluster_config = cluster_config
+        self.__bucket = bucket
+        self.__stack_name = stack_name
+        if not log_group_name and cluster_config.is_cw_logging_enabled:
+            # The name of the log group of a new cluster contains its creation time, as done by the ClusterCdkStack
+            timestamp = datetime.utcnow().strftime("%Y%m%d%H%M")
+            log_group_name = f"{CW_LOG_GROUP_NAME_PREFIX}{stack_name}-{timestamp}"
+        self.__log_group_name = log_group_name
+        self.__key = None
+
+    def is_enabled(self):
+        """Tell if the templates of the cluster can be cached."""
+        return (
+            PersistentCache.is_enabled()
+            # The AWS Batch template contains the creation time of the CodeBuild log group
+            and self.__cluster_config.scheduling.scheduler != "awsbatch"
+            and bool(self.__cluster_config.config_version)
+            and bool(self.__cluster_config.original_config_version)
+            and self.key is not None
+        )
+
+    @property
+    def key(self):
+        """Return the key of the cache entry, None if it cannot be computed."""
+        if self.__key is None:
+            try:
+                cluster_config = self.__cluster_config
+                key_content = {
+                    "version": get_installed_version(),
+                    "region": get_region(),
+                    "stack_name": self.__stack_name,
+                    "bucket_name": self.__bucket.name,
+                    "artifact_directory": self.__bucket.artifact_directory,
+                    "config": ClusterSchema(cluster_name=self.__stack_name).dump(deepcopy(cluster_config)),
+                    "official_ami": cluster_config.official_ami,
+                    "head_node_ami": cluster_config.head_node_ami,
+                    "image_dict": cluster_config.image_dict,
+                }
+                serialized_content = json.dumps(key_content, sort_keys=True, default=str)
+                self.__key = "cluster-template:" + hashlib.sha256(serialized_content.encode("utf-8")).hexdigest()
+            except Exception as e:
+                LOGGER.debug("Unable to compute the cluster template cache key: %s", e)
+        return self.__key
+
+    def get(self):
+        """
+        Retrieve the template and the assets metadata of the cluster, rendered for the current invocation.
+
+        :return: a tuple (template, assets_metadata), None if the entry is missing or expired.
+        """
+        found, value = PersistentCache.instance().get(self.key)
+        if not found:
+            return None
+        LOGGER.info("Reusing cached cluster template %s", self.key)
+        return self.render(*value)
+
+    def put(self, template, assets_metadata):
+        """Store the template and the assets metadata synthesized with the placeholders."""
+        PersistentCache.instance().put(
+            self.key,
+            "build_cluster_template",
+            get_region(),
+            (template, assets_metadata),
+            ttl=CLUSTER_TEMPLATE_CACHE_TTL_SEC,
+        )
+
+    @contextmanager
+    def placeholders(self):
+        """
+        Set the placeholders in the cluster configuration for the duration of the synthesis.
+
+        :return: the arguments of the ClusterCdkStack to be used for the synthesis.
+        """
+        cluster_config = self.__cluster_config
+        config_version, original_config_version = cluster_config.config_version, cluster_config.original_config_version
+        cluster_config.config_version = CONFIG_VERSION_PLACEHOLDER
+        cluster_config.original_config_version = ORIGINAL_CONFIG_VERSION_PLACEHOLDER
+        try:
+            yield {
+                "log_group_name": LOG_GROUP_NAME_PLACEHOLDER if self.__log_group_name else None,
+                "timestamp": TIMESTAMP_PLACEHOLDER,
+            }
+        finally:
+            cluster_config.config_version = config_version
+            cluster_config.original_config_version = original_config_version
+
+    def render(self, template, assets_metadata):
+        """
+        Replace the placeholders of the template and of the assets with the values of the current invocation.
+
+        The id of a nested template is the hash of its content, so the ids of the assets containing placeholders
+        are computed again, together with the names of their parameters in the root template.
+        """
+        replacements = {
+            CONFIG_VERSION_PLACEHOLDER: self.__cluster_config.config_version,
+            ORIGINAL_CONFIG_VERSION_PLACEHOLDER: self.__cluster_config.original_config_version,
+            TIMESTAMP_PLACEHOLDER: datetime.utcnow().strftime("%Y%m%d%H%M%S"),
+        }
+        if self.__log_group_name:
+            replacements[LOG_GROUP_NAME_PLACEHOLDER] = self.__log_group_name
+
+        asset_replacements = {}
+        for asset_metadata in assets_metadata:
+            asset_id = asset_metadata["id"]
+            new_asset_id = _asset_id(_replace_placeholders(asset_metadata["content"], replacements))
+            if new_asset_id != asset_id:
+                for parameter in ["hash_parameter", "s3_bucket_parameter", "s3_object_key_parameter"]:
+                    parameter_name = asset_metadata[parameter]["key"]
+                    asset_replacements[parameter_name] = _asset_parameter_name(parameter_name, new_asset_id)
+                asset_replacements[asset_id] = new_asset_id
+        # Parameter names contain the asset id, so they are replaced first
+        replacements.update(asset_replacements)
+
+        return _replace_placeholders(template, replacements), _replace_placeholders(assets_metadata, replacements)
@@ -9,12 +9,15 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import contextvars
 import datetime
 import functools
+import hashlib
 import itertools
 import json
 import logging
 import os
+import pickle  # nosec B403
 import random
 import re
 import string
@@ -34,7 +37,7 @@ from yaml import SafeLoader
 from yaml.constructor import ConstructorError
 from yaml.resolver import BaseResolver
 
-from pcluster.aws.common import get_region
+from pcluster.aws.common import Cache, FunctionCache, get_region
 from pcluster.constants import SUPPORTED_OSES_FOR_ARCHITECTURE, SUPPORTED_OSES_FOR_SCHEDULER
 
 LOGGER = logging.getLogger(__name__)
@@ -136,13 +139,16 @@ def zip_dir(path):
     Create a zip archive containing all files and dirs rooted in path.
 
     The archive is created in memory and a file handler is returned by the function.
+    Files are added in a fixed order and with fixed timestamps, so that the archive content depends only on the
+    content of the files.
     :param path: directory containing the resources to archive.
     :return: file handler pointing to the compressed archive.
     """
     file_out = BytesIO()
     with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
-        for root, _, files in os.walk(path):
-            for file in files:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file in sorted(files):
                 _add_file_to_zip(
                     ziph,
                     os.path.join(root, file),
@@ -256,25 +262,50 @@ def verify_stack_status(stack_name, waiting_states, successful_states):
     :param successful_states: list of final status considered as successful
     :return: True if the final status is in the successful_states list, False otherwise.
     """
-    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+    from pcluster.models.stack_waiter import StackWaiter  # pylint: disable=import-outside-toplevel
 
-    status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
     resource_status = ""
-    while status in waiting_states:
-        status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
-        events = AWSApi.instance().cfn.get_stack_events(stack_name)["StackEvents"][0]
-        resource_status = ("Status: %s - %s" % (events.get("LogicalResourceId"), events.get("ResourceStatus"))).ljust(
-            80
-        )
+
+    def _print_event(event):
+        nonlocal resource_status
+        resource_status = ("Status: %s - %s" % (event.get("LogicalResourceId"), event.get("ResourceStatus"))).ljust(80)
         sys.stdout.write("\r%s" % resource_status)
         sys.stdout.flush()
-        time.sleep(5)
+
+    status = StackWaiter(
+        stack_name, on_event=_print_event, is_in_progress=lambda stack_status: stack_status in waiting_states
+    ).wait()
     # print the last status update in the logs
     if resource_status != "":
         LOGGER.debug(resource_status)
     return status in successful_states
 
 
+def poll_with_backoff(func, until, timeout, initial_interval=1, max_interval=15, backoff_factor=2):
+    """
+    Call func until its result satisfies the until condition and return the last result.
+
+    The first polls are close to each other to detect quick transitions, then the interval between the polls grows
+    exponentially up to max_interval.
+
+    :param func: function to poll, called without arguments
+    :param until: function receiving the result of func and returning True when the polling must stop
+    :param timeout: maximum number of seconds to wait
+    :raise TimeoutError: if the condition is not satisfied before the timeout expires
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    result = func()
+    while not until(result):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Timeout expired after {timeout} seconds.")
+        time.sleep(min(interval, remaining))
+        interval = min(max_interval, interval * backoff_factor)
+        result = func()
+    return result
+
+
 def get_templates_bucket_path():
     """Return a string containing the path of bucket."""
     region = get_region()
@@ -384,10 +415,27 @@ def get_attr(obj, attributes, default=None):
 
 
 def yaml_load(stream):
-    yaml.add_constructor(
-        tag=BaseResolver.DEFAULT_MAPPING_TAG, constructor=yaml_no_duplicates_constructor, Loader=SafeLoader
-    )
-    return yaml.safe_load(stream)
+    """
+    Parse the given YAML document, which can be a string or a file, failing if it contains duplicate keys.
+
+    Parsed documents are cached by the hash of their content, so that the same configuration or template
+    is parsed only once per process. Every call returns a new copy of the result, that can be freely modified.
+    """
+    content = stream.read() if hasattr(stream, "read") else stream
+    if not Cache.is_enabled():
+        return yaml.load(content, Loader=_NoDuplicatesSafeLoader)  # nosec B506
+
+    encoded_content = content if isinstance(content, bytes) else content.encode("utf-8", errors="surrogatepass")
+    cache_key = hashlib.sha256(encoded_content).hexdigest()
+    with _yaml_load_cache.key_mutex(cache_key):
+        found, serialized_result = _yaml_load_cache.get(cache_key)
+        if not found:
+            result = yaml.load(content, Loader=_NoDuplicatesSafeLoader)  # nosec B506
+            serialized_result = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            _yaml_load_cache.put(cache_key, serialized_result)
+            return result
+    # Results are kept serialized because unpickling is faster than a deep copy
+    return pickle.loads(serialized_result)  # nosec B301
 
 
 def yaml_no_duplicates_constructor(loader, node, deep=False):
@@ -403,6 +451,20 @@ def yaml_no_duplicates_constructor(loader, node, deep=False):
     return loader.construct_mapping(node, deep)
 
 
+class _NoDuplicatesSafeLoader(getattr(yaml, "CSafeLoader", SafeLoader)):
+    """Safe YAML loader failing on duplicate keys, based on libyaml when available."""
+
+
+_NoDuplicatesSafeLoader.add_constructor(BaseResolver.DEFAULT_MAPPING_TAG, yaml_no_duplicates_constructor)
+
+# Parsed YAML documents only depend on their content, so they are kept across requests
+YAML_LOAD_CACHE_MAX_ENTRIES = 32
+YAML_LOAD_CACHE_TTL_SEC = 60 * 60
+_yaml_load_cache = Cache.register(
+    FunctionCache("yaml_load", max_entries=YAML_LOAD_CACHE_MAX_ENTRIES, ttl=YAML_LOAD_CACHE_TTL_SEC)
+)
+
+
 def get_http_tokens_setting(imds_support):
     """Get http tokens settings for supported IMDS version."""
     return "required" if imds_support == "v2.0" else "optional"
@@ -531,8 +593,10 @@ class AsyncUtils:
 
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
+            # the context is propagated to keep context variables of the calling task, e.g. the AWS usage counters
+            context = contextvars.copy_context()
             return await asyncio.get_event_loop().run_in_executor(
-                AsyncUtils._thread_pool_executor, lambda: func(self, *args, **kwargs)
+                AsyncUtils._thread_pool_executor, lambda: context.run(func, self, *args, **kwargs)
             )
 
         return wrapper
@@ -10,9 +10,10 @@
 # limitations under the License.
 import math
 import re
+from bisect import bisect_right
 from collections import defaultdict
 from enum import Enum
-from ipaddress import collapse_addresses, ip_network
+from ipaddress import ip_network
 from itertools import combinations, product
 from typing import List
 
@@ -418,60 +419,65 @@ class EfaMultiAzValidator(Validator):
 # --------------- Storage validators --------------- #
 
 
-def _is_access_allowed(security_groups_ids, subnets, port, security_groups_by_nodes, protocol="tcp"):
+class SecurityGroupsReachability:
     """
-    Verify given list of security groups to check if they allow in and out access on the given port.
+    Index of the traffic allowed by security groups to and from the cluster nodes.
 
-    :param security_groups_ids: list of security groups to verify
-    :param port: port to verify
-    :param security_groups_by_nodes: all security groups from cluster. This is a set of frozen sets.
-    Each frozen set contains sg combination of a queue.
-    :param protocol: the IP protocol to be checked.
-    :return: True if both in and out access are allowed
-    :raise: ClientError if a given security group doesn't exist
+    The index is built once per validation and shared by all the validators checking the access to the storages,
+    so that every combination of security groups, port, protocol and subnets is evaluated only once.
     """
-    in_access = False
-    out_access = False
-    src_ip_ranges = []
-    dst_ip_ranges = []
-    src_security_groups = set()
-    dst_security_groups = set()
-
-    for sec_group in AWSApi.instance().ec2.describe_security_groups(security_groups_ids):
-        # Check all inbound rules
-        for rule in sec_group.get("IpPermissions"):
-            if in_access:
-                break
-            if _is_port_allowed_by_sg_rule(rule, port, protocol):
-                in_access = _populate_allowed_src_or_dst(rule, src_ip_ranges, src_security_groups)
-
-        # Check all outbound rules
-        for rule in sec_group.get("IpPermissionsEgress"):
-            if out_access:
-                break
-            if _is_port_allowed_by_sg_rule(rule, port, protocol):
-                out_access = _populate_allowed_src_or_dst(rule, dst_ip_ranges, dst_security_groups)
-
-        if in_access and out_access:
-            return True
-    # If in_access or out_access is still False, check allowed ip ranges and security groups.
-    # The in_access or out_access could only have been true, if previous logics had found prefix list in SG rules.
-    # Rules of ip ranges have to be checked at the end because the union of all ip ranges may cover the subnets,
-    # even when individual ip ranges do not cover the subnets. The same reason applies to allowed security groups.
-    in_access = in_access or _are_ip_ranges_and_sg_accessible(
-        security_groups_by_nodes, src_ip_ranges, src_security_groups, subnets
-    )
-    out_access = out_access or _are_ip_ranges_and_sg_accessible(
-        security_groups_by_nodes, dst_ip_ranges, dst_security_groups, subnets
-    )
-    return in_access and out_access
-
-
-def _are_ip_ranges_and_sg_accessible(security_groups_by_nodes, allowed_ip_ranges, allowed_security_groups, subnets):
-    # For all cluster nodes, at least one of the security groups attached need to be in the UserIdGroupPairs.
-    return all(
-        node_security_groups & allowed_security_groups for node_security_groups in security_groups_by_nodes
-    ) or _are_subnets_covered_by_cidrs(allowed_ip_ranges, subnets)
+
+    def __init__(self, security_groups_by_nodes):
+        """
+        Initialize the index.
+
+        :param security_groups_by_nodes: all security groups from cluster. This is a set of frozen sets.
+        Each frozen set contains sg combination of a queue.
+        """
+        self.__security_groups_by_nodes = security_groups_by_nodes
+        self.__access_allowed = {}
+
+    def prefetch_security_groups(self, security_groups_ids):
+        """Describe the given security groups with a single call, so that the next checks are served from memory."""
+        security_groups_ids = list(dict.fromkeys(security_groups_ids))
+        if security_groups_ids:
+            AWSApi.instance().ec2.describe_security_groups(security_groups_ids)
+
+    def is_access_allowed(self, security_groups_ids, subnets, port, protocol="tcp"):
+        """
+        Verify given list of security groups to check if they allow in and out access on the given port.
+
+        :param security_groups_ids: list of security groups to verify
+        :param subnets: subnets of the cluster nodes that need to access the port
+        :param port: port to verify
+        :param protocol: the IP protocol to be checked.
+        :return: True if both in and out access are allowed
+        :raise: ClientError if a given security group doesn't exist
+        """
+        key = (frozenset(security_groups_ids), frozenset(subnets), port, protocol)
+        if key not in self.__access_allowed:
+            security_groups = AWSApi.instance().ec2.describe_security_groups(list(dict.fromkeys(security_groups_ids)))
+            self.__access_allowed[key] = self._is_traffic_allowed(
+                security_groups, "IpPermissions", subnets, port, protocol
+            ) and self._is_traffic_allowed(security_groups, "IpPermissionsEgress", subnets, port, protocol)
+        return self.__access_allowed[key]
+
+    def _is_traffic_allowed(self, security_groups, permissions_key, subnets, port, protocol):
+        """Verify if the rules of the security groups in the given direction allow the traffic of the cluster nodes."""
+        allowed_ip_ranges = []
+        allowed_security_groups = set()
+        for sec_group in security_groups:
+            for rule in sec_group.get(permissions_key):
+                if _is_port_allowed_by_sg_rule(rule, port, protocol) and _populate_allowed_src_or_dst(
+                    rule, allowed_ip_ranges, allowed_security_groups
+                ):
+                    return True
+        # Rules of ip ranges have to be checked at the end because the union of all ip ranges may cover the subnets,
+        # even when individual ip ranges do not cover the subnets. The same reason applies to allowed security groups.
+        # For all cluster nodes, at least one of the security groups attached need to be in the UserIdGroupPairs.
+        return all(
+            node_security_groups & allowed_security_groups for node_security_groups in self.__security_groups_by_nodes
+        ) or _are_subnets_covered_by_cidrs(allowed_ip_ranges, subnets)
 
 
 def _populate_allowed_src_or_dst(rule, ip_ranges, allowed_security_groups):
@@ -529,21 +535,37 @@ def _is_port_allowed_by_sg_rule(rule, port_to_check, protocol):
     return False
 
 
+class _CidrIntervals:
+    """Union of CIDR blocks, stored as sorted and disjoint intervals of addresses for each IP version."""
+
+    def __init__(self, cidrs):
+        self.__intervals = defaultdict(list)
+        for network in sorted(
+            (ip_network(cidr) for cidr in cidrs), key=lambda net: (net.version, int(net.network_address))
+        ):
+            first, last = int(network.network_address), int(network.broadcast_address)
+            intervals = self.__intervals[network.version]
+            if intervals and first <= intervals[-1][1] + 1:
+                # Overlapping or adjacent blocks are merged, as done by ipaddress.collapse_addresses
+                intervals[-1][1] = max(intervals[-1][1], last)
+            else:
+                intervals.append([first, last])
+        self.__starts = {version: [first for first, _ in intervals] for version, intervals in self.__intervals.items()}
+
+    def covers(self, network):
+        """Return True if all the addresses of the given network are in the union of the CIDR blocks."""
+        starts = self.__starts.get(network.version)
+        if not starts:
+            return False
+        index = bisect_right(starts, int(network.network_address)) - 1
+        return index >= 0 and self.__intervals[network.version][index][1] >= int(network.broadcast_address)
+
+
 def _are_subnets_covered_by_cidrs(ip_ranges, subnets):
     """Verify given list of security groups to check if they allow in and out access on cluster subnet CIDRs."""
-    # Collapse ip ranges for better performance and correctness
-    collapsed_ip_ranges = list(collapse_addresses([ip_network(ip_range["CidrIp"]) for ip_range in ip_ranges]))
-
-    for subnet in subnets:
-        subnet_cidr = ip_network(AWSApi.instance().ec2.get_subnet_cidr(subnet))
-        covered = False
-        for ip_range in collapsed_ip_ranges:
-            if ip_range.supernet_of(subnet_cidr):
-                covered = True
-                break
-        if not covered:
-            return False
-    return True
+    # Merge ip ranges into intervals for better performance and correctness
+    cidr_intervals = _CidrIntervals(ip_range["CidrIp"] for ip_range in ip_ranges)
+    return all(cidr_intervals.covers(ip_network(AWSApi.instance().ec2.get_subnet_cidr(subnet))) for subnet in subnets)
 
 
 class ExistingFsxNetworkingValidator(Validator):
@@ -567,22 +589,29 @@ class ExistingFsxNetworkingValidator(Validator):
         else:
             return {}
 
-    def _validate(self, file_storage_ids, subnet_ids, security_groups_by_nodes):
+    def _validate(self, file_storage_ids, subnet_ids, security_groups_reachability: SecurityGroupsReachability):
         try:
             file_cache_ids = [file_cache_id for file_cache_id in file_storage_ids if file_cache_id.startswith("fc-")]
             if file_cache_ids:
                 file_storage_ids = [id for id in file_storage_ids if id not in file_cache_ids]
                 file_caches = AWSApi.instance().fsx.describe_file_caches(file_cache_ids)
-                self._check_file_storage(security_groups_by_nodes, file_caches, subnet_ids)
+                self._check_file_storage(security_groups_reachability, file_caches, subnet_ids)
 
             file_systems = AWSApi.instance().fsx.get_file_systems_info(file_storage_ids)
-            self._check_file_storage(security_groups_by_nodes, file_systems, subnet_ids)
+            self._check_file_storage(security_groups_reachability, file_systems, subnet_ids)
         except AWSClientError as e:
             self._add_failure(str(e), FailureLevel.ERROR)
 
-    def _check_file_storage(self, security_groups_by_nodes, file_storages, subnet_ids):
+    def _check_file_storage(self, security_groups_reachability, file_storages, subnet_ids):
         vpc_id = AWSApi.instance().ec2.get_subnet_vpc(subnet_ids[0])
         network_interfaces_data = self._describe_network_interfaces(file_storages)
+        # Describe the security groups of all the file storages together
+        security_groups_reachability.prefetch_security_groups(
+            security_group.get("GroupId")
+            for network_interface in network_interfaces_data.values()
+            if network_interface.get("VpcId") == vpc_id
+            for security_group in network_interface.get("Groups")
+        )
         for file_storage in file_storages:
             # Check to see if fs is in the same VPC as the stack
             file_storage_id = file_storage.file_system_id if file_storage.file_system_id else file_storage.file_cache_id
@@ -610,7 +639,7 @@ class ExistingFsxNetworkingValidator(Validator):
 
                 for protocol, ports in FSX_PORTS[file_storage.file_storage_type].items():
                     missing_ports = self._get_missing_ports(
-                        security_groups_by_nodes, subnet_ids, network_interfaces, ports, protocol
+                        security_groups_reachability, subnet_ids, network_interfaces, ports, protocol
                     )
 
                     if missing_ports:
@@ -622,20 +651,14 @@ class ExistingFsxNetworkingValidator(Validator):
                             FailureLevel.ERROR,
                         )
 
-    def _get_missing_ports(self, security_groups_by_nodes, subnet_ids, network_interfaces, ports, protocol):
+    def _get_missing_ports(self, security_groups_reachability, subnet_ids, network_interfaces, ports, protocol):
         missing_ports = []
         for port in ports:
             fs_access = False
             for network_interface in network_interfaces:
                 # Get list of security group IDs
                 sg_ids = [sg.get("GroupId") for sg in network_interface.get("Groups")]
-                if _is_access_allowed(
-                    sg_ids,
-                    subnet_ids,
-                    port=port,
-                    security_groups_by_nodes=security_groups_by_nodes,
-                    protocol=protocol,
-                ):
+                if security_groups_reachability.is_access_allowed(sg_ids, subnet_ids, port=port, protocol=protocol):
                     fs_access = True
                     break
             if not fs_access:
@@ -809,7 +832,7 @@ class EfsIdValidator(Validator):  # TODO add tests
     Validate if there are existing mount target in the cluster (head and computes) availability zone
     """
 
-    def _validate(self, efs_id, avail_zones_mapping: dict, security_groups_by_nodes):
+    def _validate(self, efs_id, avail_zones_mapping: dict, security_groups_reachability: SecurityGroupsReachability):
         availability_zones = avail_zones_mapping.keys()
         if len(availability_zones) > 1 and not AWSApi.instance().efs.is_efs_standard(efs_id):
             self._add_failure(
@@ -819,16 +842,27 @@ class EfsIdValidator(Validator):  # TODO add tests
                 FailureLevel.ERROR,
             )
 
+        mount_targets = {
+            avail_zone: AWSApi.instance().efs.get_efs_mount_target_id(efs_id, avail_zone)
+            for avail_zone in availability_zones
+        }
+        # Get list of security group IDs of the mount targets and describe them together
+        mount_targets_security_groups = {
+            mount_target_id: AWSApi.instance().efs.get_efs_mount_target_security_groups(mount_target_id)
+            for mount_target_id in mount_targets.values()
+            if mount_target_id
+        }
+        security_groups_reachability.prefetch_security_groups(
+            sg_id for sg_ids in mount_targets_security_groups.values() for sg_id in sg_ids
+        )
+
         avail_zones_missing_mount_target_for_efs_standard = []
         for avail_zone, subnets in avail_zones_mapping.items():
-            head_node_target_id = AWSApi.instance().efs.get_efs_mount_target_id(efs_id, avail_zone)
+            head_node_target_id = mount_targets[avail_zone]
             # If there is an existing mt in the az, need to check the inbound and outbound rules of the security groups
             if head_node_target_id:
-                # Get list of security group IDs of the mount target
-                sg_ids = AWSApi.instance().efs.get_efs_mount_target_security_groups(head_node_target_id)
-                if not _is_access_allowed(
-                    sg_ids, subnets, port=EFS_PORT, security_groups_by_nodes=security_groups_by_nodes
-                ):
+                sg_ids = mount_targets_security_groups[head_node_target_id]
+                if not security_groups_reachability.is_access_allowed(sg_ids, subnets, port=EFS_PORT):
                     self._add_failure(
                         "There is an existing Mount Target {0} in the Availability Zone {1} for EFS {2}, "
                         "but it does not have a security group that allows inbound and outbound rules to support NFS. "
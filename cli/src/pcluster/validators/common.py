@@ -14,11 +14,22 @@
 #
 import asyncio
 import functools
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from enum import Enum
 from typing import List
 
+from pcluster.aws.common import AWSUsageCounter
+
 ASYNC_TIMED_VALIDATORS_DEFAULT_TIMEOUT_SEC = 10
+# Maximum time a single sync validator can run before being reported as timed out
+SYNC_VALIDATORS_DEFAULT_TIMEOUT_SEC = 120
+# Maximum time to wait for all the validators of a resource and its children
+VALIDATION_DEFAULT_TIMEOUT_SEC = 600
+# Maximum number of sync validators executed concurrently
+VALIDATORS_MAX_WORKERS = 16
 
 
 class FailureLevel(Enum):
@@ -44,11 +55,118 @@ class ValidationResult:
         return f"ValidationResult(level={self.level}, message={self.message})"
 
 
+class ValidatorExecutionStats:
+    """Execution statistics of a validator for a specific resource."""
+
+    def __init__(self, validator_type: str, resource_path: str):
+        self.validator_type = validator_type
+        self.resource_path = resource_path
+        self.wall_time = None
+        self.usage = AWSUsageCounter()
+
+    @contextmanager
+    def measure(self):
+        """Measure the wall time, the AWS calls and the cache hits of the code executed in the context."""
+        start_time = time.monotonic()
+        try:
+            with self.usage.track():
+                yield
+        finally:
+            self.wall_time = time.monotonic() - start_time
+
+    def to_dict(self):
+        """Return the statistics as a dict."""
+        return {
+            "validator": self.validator_type,
+            "resourcePath": self.resource_path,
+            "completed": self.wall_time is not None,
+            "wallTime": round(self.wall_time, 3) if self.wall_time is not None else None,
+            "awsCalls": self.usage.aws_calls,
+            "cacheHits": self.usage.cache_hits,
+        }
+
+
+class ValidationProfile:
+    """
+    Collect the execution statistics of all the validators executed while the profile is active.
+
+    Only one profile can be active at a time; it is shared by all the threads running validators.
+    """
+
+    _active = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.executions: List[ValidatorExecutionStats] = []
+        self.wall_time = None
+
+    @staticmethod
+    def active():
+        """Return the active profile, if any."""
+        return ValidationProfile._active
+
+    @contextmanager
+    def activate(self):
+        """Make this profile the active one while the context manager is active."""
+        ValidationProfile._active = self
+        start_time = time.monotonic()
+        try:
+            yield self
+        finally:
+            self.wall_time = time.monotonic() - start_time
+            ValidationProfile._active = None
+
+    def add_execution(self, validator_type: str, resource_path: str) -> ValidatorExecutionStats:
+        """Register a new validator execution and return the object collecting its statistics."""
+        stats = ValidatorExecutionStats(validator_type, resource_path)
+        with self._lock:
+            self.executions.append(stats)
+        return stats
+
+    def _aggregate(self, group_name: str, group_key):
+        groups = {}
+        for stats in self.executions:
+            key = group_key(stats)
+            group = groups.setdefault(
+                key,
+                {group_name: key, "executions": 0, "wallTime": 0.0, "maxWallTime": 0.0, "awsCalls": 0, "cacheHits": 0},
+            )
+            wall_time = stats.wall_time or 0.0
+            group["executions"] += 1
+            group["wallTime"] += wall_time
+            group["maxWallTime"] = max(group["maxWallTime"], wall_time)
+            group["awsCalls"] += stats.usage.aws_calls
+            group["cacheHits"] += stats.usage.cache_hits
+        for group in groups.values():
+            group["wallTime"] = round(group["wallTime"], 3)
+            group["maxWallTime"] = round(group["maxWallTime"], 3)
+        return sorted(groups.values(), key=lambda group: group["wallTime"], reverse=True)
+
+    def report(self):
+        """
+        Return the profile report.
+
+        Statistics are aggregated by validator type and by resource path, sorted by decreasing wall time.
+        Since validators run concurrently, the sum of their wall times can exceed the total wall time.
+        """
+        return {
+            "wallTime": round(self.wall_time, 3) if self.wall_time is not None else None,
+            "validatorsWallTime": round(sum(stats.wall_time or 0.0 for stats in self.executions), 3),
+            "awsCalls": sum(stats.usage.aws_calls for stats in self.executions),
+            "cacheHits": sum(stats.usage.cache_hits for stats in self.executions),
+            "validators": self._aggregate("validator", lambda stats: stats.validator_type),
+            "resources": self._aggregate("resourcePath", lambda stats: stats.resource_path),
+            "executions": [stats.to_dict() for stats in self.executions],
+        }
+
+
 class Validator(ABC):
     """Abstract validator. The children must implement the _validate method."""
 
     def __init__(self):
         self._failures = []
+        # Statistics of the execution, collected only when a ValidationProfile is active
+        self.stats: ValidatorExecutionStats = None
 
     def _add_failure(self, message: str, level: FailureLevel):
         result = ValidationResult(message, level, self.type)
@@ -59,9 +177,13 @@ class Validator(ABC):
         """Identify the type of validator."""
         return self.__class__.__name__
 
+    def _measured(self):
+        return self.stats.measure() if self.stats else nullcontext()
+
     def execute(self, *arg, **kwargs) -> List[ValidationResult]:
         """Entry point of all validators to verify all input params are valid."""
-        self._validate(*arg, **kwargs)
+        with self._measured():
+            self._validate(*arg, **kwargs)
         return self._failures
 
     @abstractmethod
@@ -86,7 +208,8 @@ class AsyncValidator(Validator):
 
     async def execute_async(self, *arg, **kwargs) -> List[ValidationResult]:
         """Entry point of all async validators to verify all input params are valid."""
-        await self._validate_async(*arg, **kwargs)
+        with self._measured():
+            await self._validate_async(*arg, **kwargs)
         return self._failures
 
     @abstractmethod
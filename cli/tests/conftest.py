@@ -3,6 +3,7 @@ This module loads pytest fixtures and plugins needed by all tests.
 
 It's very useful for fixtures that need to be shared among all tests.
 """
+
 import logging
 import os
 import sys
@@ -39,6 +40,15 @@ def reset_aws_api():
     AWSApi._instance = None
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear cached results to remove dependencies between tests, process scoped results do not depend on clients."""
+    from pcluster.aws.common import Boto3ClientPool, Cache
+
+    Cache.clear_all()
+    Boto3ClientPool.deactivate()
+
+
 @pytest.fixture
 def failed_with_message(capsys):
     """Assert that the command exited with a specific error message."""
@@ -215,7 +215,14 @@ class TestDeleteClusterInstances:
                 side_effect=StackNotFoundError(function_name="describestack", stack_name="stack_name"),
             )
         instance_ids = ["fakeinstanceid1", "fakeinstanceid2"]
-        mocker.patch("pcluster.aws.ec2.Ec2Client.list_instance_ids", return_value=instance_ids)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            return_value=([{"InstanceId": instance_id} for instance_id in instance_ids], None),
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.get_instance_states",
+            return_value={instance_id: "shutting-down" for instance_id in instance_ids},
+        )
         terminate_instance_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances")
         response = self._send_test_request(client, force=force)
         with soft_assertions():
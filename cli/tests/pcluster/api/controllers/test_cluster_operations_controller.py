@@ -23,6 +23,7 @@ from pcluster.config.update_policy import UpdatePolicy
 from pcluster.models.cluster import (
     BadRequestClusterActionError,
     ClusterActionError,
+    ClusterDescribeSnapshot,
     ClusterUpdateError,
     ConflictClusterActionError,
     LimitExceededClusterActionError,
@@ -891,6 +892,29 @@ class TestDescribeCluster:
                 }
             )
 
+    @pytest.mark.parametrize(
+        "error_type, error_code",
+        [(LimitExceededClusterActionError, 429), (BadRequestClusterActionError, 400), (ClusterActionError, 500)],
+    )
+    def test_compute_fleet_status_error(self, client, mocker, error_type, error_code):
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", return_value=cfn_describe_stack_mock_response())
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], ""))
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = error_type("error message")
+
+        response = self._send_test_request(client)
+
+        expected_response = {"message": "error message"}
+        if error_type == BadRequestClusterActionError:
+            expected_response["message"] = "Bad Request: " + expected_response["message"]
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(error_code)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
     @pytest.mark.parametrize(
         "cfn_stack_status, get_stack_events_response, expected_failures",
         [
@@ -1100,6 +1124,30 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_cluster_creation_failure_error(self, client, mocker):
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response({"StackStatus": "ROLLBACK_COMPLETE"}),
+        )
+        mocker.patch(
+            "pcluster.models.cluster_resources.get_all_stack_events",
+            side_effect=LimitExceededError("describe_stack_events", "Rate exceeded"),
+        )
+        mocker.patch("pcluster.aws.ec2.Ec2Client.describe_instances", return_value=([], None))
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).return_value = ComputeFleetStatus.RUNNING
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+
+        response = self._send_test_request(client)
+
+        # The request fails rather than omitting the failures of a cluster whose creation failed
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(429)
+            assert_that(response.get_json()).is_equal_to({"message": "Rate exceeded"})
+
     @pytest.mark.parametrize(
         "error_type, error_code, http_code",
         [
@@ -1352,6 +1400,172 @@ class TestListClusters:
             assert_that(response.get_json()).is_equal_to(expected_response)
 
 
+class TestDescribeClusters:
+    url = "/v3/cluster-descriptions"
+    method = "GET"
+
+    def _send_test_request(self, client, region="us-east-1", cluster_names=None, next_token=None):
+        query_string = []
+        if region:
+            query_string.append(("region", region))
+        if cluster_names:
+            query_string.extend([("clusterNames", cluster_name) for cluster_name in cluster_names])
+        if next_token:
+            query_string.append(("nextToken", next_token))
+        headers = {"Accept": "application/json"}
+        return client.open(self.url, method=self.method, headers=headers, query_string=query_string)
+
+    @staticmethod
+    def _describe_snapshots(clusters, include_creation_failure):
+        snapshots = []
+        for cluster in clusters:
+            results = {
+                "compute_fleet_status": ComputeFleetStatus.RUNNING,
+                "config_presigned_url": f"presigned-url-{cluster.name}",
+                "plugin_metadata": None,
+            }
+            if include_creation_failure(cluster.stack):
+                results["creation_failure"] = ("ClusterCreationFailure", "Failed to create the cluster.")
+            errors = {"head_node_instance": ClusterActionError("Unable to retrieve head node information.")}
+            snapshots.append(ClusterDescribeSnapshot(cluster.stack, results, errors))
+        return snapshots
+
+    def test_successful_request(self, mocker, client):
+        stacks = [
+            cfn_describe_stack_mock_response({"StackName": "cluster1"}),
+            cfn_describe_stack_mock_response({"StackName": "cluster2", "StackStatus": "ROLLBACK_COMPLETE"}),
+            cfn_describe_stack_mock_response(
+                {"StackName": "cluster3", "Tags": [{"Key": "parallelcluster:version", "Value": "2.0.0"}]}
+            ),
+        ]
+        describe_stacks_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_pcluster_stacks", return_value=stacks)
+        describe_snapshots_mock = mocker.patch(
+            "pcluster.models.cluster.Cluster.describe_snapshots", side_effect=self._describe_snapshots
+        )
+
+        response = self._send_test_request(client, cluster_names=["cluster1", "cluster2", "cluster3", "cluster4"])
+
+        common_response = {
+            "cloudformationStackArn": "arn:aws:cloudformation:us-east-1:123:stack/pcluster3-2/123",
+            "computeFleetStatus": "RUNNING",
+            "creationTime": to_iso_timestr(datetime(2021, 4, 30)),
+            "lastUpdatedTime": to_iso_timestr(datetime(2021, 4, 30)),
+            "region": "us-east-1",
+            "tags": [
+                {"key": "parallelcluster:version", "value": get_installed_version()},
+                {"key": "parallelcluster:s3_bucket", "value": "bucket_name"},
+                {
+                    "key": "parallelcluster:cluster_dir",
+                    "value": "parallelcluster/3.0.0/clusters/pcluster3-2-smkloc964uzpm12m",
+                },
+            ],
+            "version": get_installed_version(),
+            "scheduler": {"type": "slurm"},
+        }
+        expected_response = {
+            "clusters": [
+                {
+                    **common_response,
+                    "clusterName": "cluster1",
+                    "cloudFormationStackStatus": "CREATE_COMPLETE",
+                    "clusterStatus": "CREATE_COMPLETE",
+                    "clusterConfiguration": {"url": "presigned-url-cluster1"},
+                },
+                {
+                    **common_response,
+                    "clusterName": "cluster2",
+                    "cloudFormationStackStatus": "ROLLBACK_COMPLETE",
+                    "clusterStatus": "CREATE_FAILED",
+                    "clusterConfiguration": {"url": "presigned-url-cluster2"},
+                    "failures": [
+                        {"failureCode": "ClusterCreationFailure", "failureReason": "Failed to create the cluster."}
+                    ],
+                },
+            ],
+            "notFoundClusterNames": ["cluster4"],
+            "incompatibleClusterNames": ["cluster3"],
+        }
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+        describe_stacks_mock.assert_called_with(stack_names=["cluster1", "cluster2", "cluster3", "cluster4"])
+        # Clusters belonging to an incompatible version are not described
+        assert_that([cluster.name for cluster in describe_snapshots_mock.call_args[0][0]]).is_equal_to(
+            ["cluster1", "cluster2"]
+        )
+
+    @pytest.mark.parametrize("next_token", [None, "stacks:token1"])
+    def test_successful_request_without_cluster_names(self, mocker, client, next_token):
+        stacks = [cfn_describe_stack_mock_response({"StackName": "cluster1"})]
+        list_stacks_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_pcluster_stacks", return_value=(stacks, "stacks:token2")
+        )
+        describe_stacks_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_pcluster_stacks")
+        mocker.patch("pcluster.models.cluster.Cluster.describe_snapshots", side_effect=self._describe_snapshots)
+
+        response = self._send_test_request(client, next_token=next_token)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()["nextToken"]).is_equal_to("stacks:token2")
+            assert_that([cluster["clusterName"] for cluster in response.get_json()["clusters"]]).is_equal_to(
+                ["cluster1"]
+            )
+            assert_that(response.get_json()["notFoundClusterNames"]).is_empty()
+        # All the clusters are described one page at a time
+        list_stacks_mock.assert_called_with(next_token=next_token)
+        describe_stacks_mock.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "region, cluster_names, expected_response",
+        [
+            ("us-east-", None, {"message": "Bad Request: invalid or unsupported region 'us-east-'"}),
+            (None, None, {"message": "Bad Request: region needs to be set"}),
+            (
+                "us-east-1",
+                ["aaaaa.aaa"],
+                {"message": "Bad Request: 'aaaaa.aaa' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"},
+            ),
+        ],
+        ids=["bad_region", "unset_region", "invalid_cluster_name"],
+    )
+    def test_malformed_request(self, client, region, cluster_names, expected_response):
+        response = self._send_test_request(client, region, cluster_names)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+    def test_next_token_with_cluster_names(self, client):
+        response = self._send_test_request(client, cluster_names=["cluster1"], next_token="stacks:token")
+        expected_response = {"message": "Bad Request: nextToken cannot be used together with clusterNames."}
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+    @pytest.mark.parametrize(
+        "error_type, error_code, http_code",
+        [
+            (BadRequestError, AWSClientError.ErrorCode.VALIDATION_ERROR.value, 400),
+            (LimitExceededError, AWSClientError.ErrorCode.THROTTLING_EXCEPTION.value, 429),
+        ],
+    )
+    def test_error_conversion(self, client, mocker, error_type, error_code, http_code):
+        error = error_type("describe_stacks", "error message", error_code)
+        mocker.patch("pcluster.aws.cfn.CfnClient.describe_pcluster_stacks", side_effect=error)
+
+        response = self._send_test_request(client, "us-east-1", cluster_names=["cluster1"])
+
+        expected_response = {"message": "error message"}
+        if error_type == BadRequestError:
+            expected_response["message"] = "Bad Request: " + expected_response["message"]
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(http_code)
+            assert_that(response.get_json()).is_equal_to(expected_response)
+
+
 class TestUpdateCluster:
     url = "/v3/clusters/{cluster_name}"
     method = "PUT"
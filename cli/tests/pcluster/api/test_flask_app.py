@@ -14,7 +14,8 @@ from werkzeug.exceptions import InternalServerError, MethodNotAllowed
 
 from pcluster.api.errors import BadRequestException, InternalServiceException
 from pcluster.api.flask_app import ParallelClusterFlaskApp
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, Boto3ClientPool
+from pcluster.aws.sts import StsClient
 
 
 class TestParallelClusterFlaskApp:
@@ -190,3 +191,20 @@ class TestParallelClusterFlaskApp:
             "'Unsupported Media Type: Invalid Content-type (text/plain), expected JSON data'}"
         )
         assert_that(caplog.records[2].exc_info).is_false()
+
+    def test_clients_and_immutable_data_reused_across_requests(self, mocker):
+        create_client_mock = mocker.patch("pcluster.aws.common._create_client")
+        create_client_mock.return_value.get_caller_identity.return_value = {"Account": "123456789012"}
+        mocker.patch("pcluster.aws.common._session_identity", return_value=("us-east-1", "credentials"))
+        flask_app = ParallelClusterFlaskApp(swagger_ui=False, validate_responses=True).flask_app
+        flask_app.add_url_rule("/account", "account", view_func=lambda: {"account": StsClient().get_account_id()})
+
+        with flask_app.test_client() as client:
+            for _ in range(2):
+                response = client.get("/account")
+                self._assert_response(response, body={"account": "123456789012"}, code=200)
+
+        create_client_mock.assert_called_once_with("sts", None)
+        create_client_mock.return_value.get_caller_identity.assert_called_once()
+        # Clients are pooled only while serving requests
+        assert_that(Boto3ClientPool.active()).is_none()
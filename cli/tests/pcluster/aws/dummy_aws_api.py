@@ -131,6 +131,9 @@ class _DummyEc2Client(Ec2Client):
         }
         self.security_groups_cache = {}
 
+    def describe_instance_types(self, instance_types):
+        return []
+
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
 
@@ -139,9 +142,10 @@ class _DummyEc2Client(Ec2Client):
             {
                 "AvailabilityZone": "string",
                 "AvailabilityZoneId": "string",
-                "SubnetId": "subnet-123",
+                "SubnetId": subnet_id,
                 "VpcId": "vpc-123",
-            },
+            }
+            for subnet_id in subnet_ids
         ]
 
     def describe_volume(self, volume_id):
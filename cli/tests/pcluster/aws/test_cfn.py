@@ -11,7 +11,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster import utils as utils
-from pcluster.aws.cfn import CfnClient
+from pcluster.aws.cfn import DESCRIBE_STACKS_TOKEN_PREFIX, CfnClient
 from pcluster.aws.common import AWSClientError
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
@@ -22,6 +22,87 @@ def boto3_stubber_path():
     return "pcluster.aws.common.boto3"
 
 
+def _tagging_api_access_denied_request(tag, next_token=None):
+    expected_params = {"TagFilters": [{"Key": tag}], "ResourceTypeFilters": ["cloudformation:stack"]}
+    if next_token:
+        expected_params["PaginationToken"] = next_token
+    return MockedBoto3Request(
+        method="get_resources",
+        response="Access denied",
+        expected_params=expected_params,
+        generate_error=True,
+        error_code="AccessDeniedException",
+    )
+
+
+def _get_resources_request(tag, stack_names, next_token=None, response_next_token="", tags=None):
+    expected_params = {"TagFilters": [{"Key": tag}], "ResourceTypeFilters": ["cloudformation:stack"]}
+    if next_token:
+        expected_params["PaginationToken"] = next_token
+    tags = tags or {}
+    return MockedBoto3Request(
+        method="get_resources",
+        response={
+            "ResourceTagMappingList": [
+                {
+                    "ResourceARN": f"arn:aws:cloudformation:us-east-1:123456789012:stack/{stack_name}/id",
+                    "Tags": tags.get(stack_name, [{"Key": tag, "Value": "3.7.0"}]),
+                }
+                for stack_name in stack_names
+            ],
+            "PaginationToken": response_next_token,
+        },
+        expected_params=expected_params,
+    )
+
+
+def _describe_stacks_page_request(stack_names, next_token, response_next_token=None):
+    response = {
+        "Stacks": [
+            {
+                "StackName": stack_name,
+                "CreationTime": datetime.now(),
+                "StackStatus": "CREATE_COMPLETE",
+                "Tags": (
+                    [{"Key": "parallelcluster:version", "Value": "3.7.0"}] if stack_name.startswith("cluster") else []
+                ),
+            }
+            for stack_name in stack_names
+        ]
+    }
+    if response_next_token:
+        response["NextToken"] = response_next_token
+    return MockedBoto3Request(
+        method="describe_stacks",
+        response=response,
+        expected_params={"NextToken": next_token} if next_token else {},
+    )
+
+
+def _describe_stack_request(stack_name, tags=None, **kwargs):
+    stack_arn = f"arn:aws:cloudformation:us-east-1:123456789012:stack/{stack_name}/id"
+    if kwargs.get("generate_error"):
+        return MockedBoto3Request(
+            method="describe_stacks",
+            response=f"Stack with id {stack_arn} does not exist",
+            expected_params={"StackName": stack_arn},
+            generate_error=True,
+            error_code="ValidationError",
+        )
+    stack = {
+        "StackName": stack_name,
+        "StackId": stack_arn,
+        "CreationTime": datetime.now(),
+        "StackStatus": kwargs.get("status", "CREATE_COMPLETE"),
+        "Tags": tags or [{"Key": "parallelcluster:version", "Value": "3.7.0"}],
+    }
+    if kwargs.get("parent_id"):
+        stack["ParentId"] = kwargs["parent_id"]
+    return MockedBoto3Request(
+        method="describe_stacks", response={"Stacks": [stack]}, expected_params={"StackName": stack_arn}
+    )
+
+
 class TestCfnClient:
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -73,10 +154,18 @@ class TestCfnClient:
             ("invalid", Exception(), set()),
         ],
     )
-    def test_list_pcluster_stacks(self, set_env, boto3_stubber, next_token, describe_stacks_response, expected_stacks):
+    def test_list_pcluster_stacks(
+        self, set_env, boto3_stubber, mocker, next_token, describe_stacks_response, expected_stacks
+    ):
         set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_PAGE_SIZE", 1)
 
         expected_describe_stacks_params = {} if not next_token else {"NextToken": next_token}
+        if next_token:
+            # The token of a DescribeStacks page is used without calling the Tagging API
+            next_token = DESCRIBE_STACKS_TOKEN_PREFIX + next_token
+        else:
+            boto3_stubber("resourcegroupstaggingapi", _tagging_api_access_denied_request("parallelcluster:version"))
         generate_error = isinstance(describe_stacks_response, Exception)
         mocked_requests = [
             MockedBoto3Request(
@@ -91,13 +180,147 @@ class TestCfnClient:
 
         if not generate_error:
             stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
+            expected_next_token = describe_stacks_response.get("NextToken")
+            assert_that(next_token).is_equal_to(
+                expected_next_token and DESCRIBE_STACKS_TOKEN_PREFIX + expected_next_token
+            )
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
 
+    def test_list_pcluster_stacks_with_tagging_api(self, set_env, boto3_stubber, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_PAGE_SIZE", 2)
+        # Stacks are described sequentially to match the order of the stubbed requests
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_DESCRIBE_MAX_WORKERS", 1)
+        tag = "parallelcluster:version"
+        image_tags = [{"Key": tag, "Value": "3.7.0"}, {"Key": "parallelcluster:image_id", "Value": "image"}]
+        boto3_stubber(
+            "resourcegroupstaggingapi",
+            [
+                _get_resources_request(
+                    tag,
+                    ["cluster1", "nested", "image", "deleted"],
+                    response_next_token="page2",
+                    tags={
+                        "nested": [
+                            {"Key": tag, "Value": "3.7.0"},
+                            {"Key": "aws:cloudformation:stack-id", "Value": "cluster1-id"},
+                        ],
+                        "image": image_tags,
+                    },
+                ),
+                _get_resources_request(tag, ["gone", "cluster2", "cluster3"], next_token="page2"),
+            ],
+        )
+        boto3_stubber(
+            "cloudformation",
+            [
+                # Nested stacks and stacks discarded because of their tags are not described
+                _describe_stack_request("cluster1"),
+                _describe_stack_request("deleted", status="DELETE_COMPLETE"),
+                # Second page of tagged stacks is retrieved to fill the page
+                _describe_stack_request("gone", generate_error=True),
+                _describe_stack_request("cluster2"),
+                _describe_stack_request("cluster3"),
+            ],
+        )
+
+        stacks, next_token = CfnClient().list_pcluster_stacks()
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(["cluster1", "cluster2", "cluster3"])
+        assert_that(next_token).is_none()
+
+    def test_list_pcluster_stacks_page_filling(self, set_env, boto3_stubber, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_PAGE_SIZE", 2)
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_MAX_SCANNED_PAGES", 3)
+        boto3_stubber("resourcegroupstaggingapi", _tagging_api_access_denied_request("parallelcluster:version"))
+
+        boto3_stubber(
+            "cloudformation",
+            [
+                # Pages are read until they contain enough clusters
+                _describe_stacks_page_request(["other1", "cluster1"], None, "token1"),
+                _describe_stacks_page_request(["other2", "other3"], "token1", "token2"),
+                _describe_stacks_page_request(["cluster2", "other4"], "token2", "token3"),
+                # Pages are read up to the maximum number of scanned pages, even if empty
+                _describe_stacks_page_request(["other5"], "token3", "token4"),
+                _describe_stacks_page_request(["other6"], "token4", "token5"),
+                _describe_stacks_page_request(["other7"], "token5", "token6"),
+            ],
+        )
+
+        cfn_client = CfnClient()
+        stacks, next_token = cfn_client.list_pcluster_stacks()
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(["cluster1", "cluster2"])
+        assert_that(next_token).is_equal_to("stacks:token3")
+
+        # The scan is continued from the DescribeStacks token
+        stacks, next_token = cfn_client.list_pcluster_stacks(next_token=next_token)
+        assert_that(stacks).is_empty()
+        assert_that(next_token).is_equal_to("stacks:token6")
+
+    def test_list_pcluster_stacks_tagging_api_token(self, set_env, boto3_stubber, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_PAGE_SIZE", 1)
+        tag = "parallelcluster:version"
+        boto3_stubber(
+            "resourcegroupstaggingapi",
+            [
+                _get_resources_request(tag, ["cluster1"], response_next_token="page2"),
+                _get_resources_request(tag, ["cluster2"], next_token="page2"),
+                _tagging_api_access_denied_request(tag, next_token="page3"),
+            ],
+        )
+        boto3_stubber("cloudformation", [_describe_stack_request("cluster1"), _describe_stack_request("cluster2")])
+
+        cfn_client = CfnClient()
+        stacks, next_token = cfn_client.list_pcluster_stacks()
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(["cluster1"])
+        assert_that(next_token).is_equal_to("tagging:page2")
+
+        stacks, next_token = cfn_client.list_pcluster_stacks(next_token=next_token)
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(["cluster2"])
+        assert_that(next_token).is_none()
+
+        # A Tagging API token cannot be used to continue the listing by scanning the stacks
+        with pytest.raises(AWSClientError) as e:
+            cfn_client.list_pcluster_stacks(next_token="tagging:page3")
+        assert_that(e.value.error_code).is_equal_to("AccessDeniedException")
+
+    def test_list_pcluster_stacks_unprefixed_token(self, set_env, boto3_stubber):
+        """Verify that tokens returned by previous versions continue the scan of the stacks."""
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        boto3_stubber("cloudformation", [_describe_stacks_page_request(["other1", "cluster1"], "token")])
+
+        stacks, next_token = CfnClient().list_pcluster_stacks(next_token="token")
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(["cluster1"])
+        assert_that(next_token).is_none()
+
+    @pytest.mark.parametrize(
+        "stack_names, expected_pages, expected_stack_names",
+        [
+            (None, 3, ["cluster1", "cluster2", "cluster3"]),
+            (["cluster2", "cluster1"], 2, ["cluster1", "cluster2"]),
+            (["cluster4"], 3, []),
+            ([], 0, []),
+        ],
+        ids=["all_clusters", "stops_when_all_found", "not_found", "no_clusters"],
+    )
+    def test_describe_pcluster_stacks(self, set_env, boto3_stubber, stack_names, expected_pages, expected_stack_names):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        pages = [
+            _describe_stacks_page_request(["other1", "cluster1"], None, "token1"),
+            _describe_stacks_page_request(["cluster2", "other2"], "token1", "token2"),
+            _describe_stacks_page_request(["cluster3"], "token2"),
+        ]
+        boto3_stubber("cloudformation", pages[:expected_pages])
+
+        stacks = CfnClient().describe_pcluster_stacks(stack_names)
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(expected_stack_names)
+
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         expected_events = [_generate_stack_event()]
@@ -145,7 +368,10 @@ class TestCfnClient:
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         mocker.patch(
             "pcluster.aws.cfn.CfnClient.describe_stack",
-            side_effect=[{"StackStatus": "CREATE_IN_PROGRESS"}, {"StackStatus": "CREATE_FAILED"}],
+            side_effect=[
+                {"StackId": FAKE_NAME, "StackStatus": "CREATE_IN_PROGRESS"},
+                {"StackId": FAKE_NAME, "StackStatus": "CREATE_FAILED"},
+            ],
         )
         mocked_requests = [
             MockedBoto3Request(
@@ -155,16 +381,18 @@ class TestCfnClient:
                 generate_error=True,
                 error_code="Throttling",
             ),
+        ] + [
             MockedBoto3Request(
                 method="describe_stack_events",
                 response={"StackEvents": [_generate_stack_event()]},
                 expected_params={"StackName": FAKE_NAME},
-            ),
-        ]
+            )
+        ] * 3
         boto3_stubber("cloudformation", mocked_requests)
         verified = utils.verify_stack_status(FAKE_NAME, ["CREATE_IN_PROGRESS"], "CREATE_COMPLETE")
         assert_that(verified).is_false()
-        sleep_mock.assert_called_with(5)
+        # The throttled request is retried after 5 seconds, the stack is polled again after 2 seconds
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([5, 2])
 
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -217,11 +445,17 @@ class TestCfnClient:
         ],
     )
     def test_get_imagebuilder_stacks(
-        self, set_env, boto3_stubber, next_token, describe_stacks_response, expected_stacks
+        self, set_env, boto3_stubber, mocker, next_token, describe_stacks_response, expected_stacks
     ):
         set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_PAGE_SIZE", 1)
 
         expected_describe_stacks_params = {} if not next_token else {"NextToken": next_token}
+        if next_token:
+            # The token of a DescribeStacks page is used without calling the Tagging API
+            next_token = DESCRIBE_STACKS_TOKEN_PREFIX + next_token
+        else:
+            boto3_stubber("resourcegroupstaggingapi", _tagging_api_access_denied_request("parallelcluster:image_id"))
         generate_error = isinstance(describe_stacks_response, Exception)
         mocked_requests = [
             MockedBoto3Request(
@@ -236,9 +470,12 @@ class TestCfnClient:
 
         if not generate_error:
             stacks, next_token = CfnClient().get_imagebuilder_stacks(next_token=next_token)
-            assert_that(next_token).is_equal_to(describe_stacks_response.get("NextToken"))
+            expected_next_token = describe_stacks_response.get("NextToken")
+            assert_that(next_token).is_equal_to(
+                expected_next_token and DESCRIBE_STACKS_TOKEN_PREFIX + expected_next_token
+            )
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
+                CfnClient().get_imagebuilder_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
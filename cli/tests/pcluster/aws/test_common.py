@@ -0,0 +1,253 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSUsageCounter, Boto3Client, Boto3ClientPool, Cache
+from pcluster.aws.persistent_cache import PersistentCache
+
+
+@pytest.fixture()
+def persistent_cache_file(tmp_path, set_env):
+    cache_file = str(tmp_path / "cache" / "aws-cache.db")
+    set_env("PCLUSTER_PERSISTENT_CACHE_FILE", cache_file)
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    return cache_file
+
+
+def test_persistent_cache_get_put(persistent_cache_file, mocker):
+    time_mock = mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1000)
+    persistent_cache = PersistentCache()
+
+    assert_that(persistent_cache.get("key1")).is_equal_to((False, None))
+    persistent_cache.put("key1", "function1", "us-east-1", {"value": [1, 2]}, ttl=60)
+    assert_that(persistent_cache.get("key1")).is_equal_to((True, {"value": [1, 2]}))
+
+    # Expired entries are not returned
+    time_mock.return_value = 1060
+    assert_that(persistent_cache.get("key1")).is_equal_to((False, None))
+
+
+def test_persistent_cache_lru_eviction(persistent_cache_file, mocker):
+    time_mock = mocker.patch("pcluster.aws.persistent_cache.time.time", return_value=1000)
+    persistent_cache = PersistentCache(max_entries=2)
+
+    persistent_cache.put("key1", "function1", "us-east-1", 1, ttl=600)
+    time_mock.return_value = 1001
+    persistent_cache.put("key2", "function1", "us-east-1", 2, ttl=600)
+    time_mock.return_value = 1002
+    # Accessing key1 makes key2 the least recently used entry
+    assert_that(persistent_cache.get("key1")).is_equal_to((True, 1))
+    time_mock.return_value = 1003
+    persistent_cache.put("key3", "function2", "eu-west-1", 3, ttl=600)
+
+    assert_that(persistent_cache.get("key1")).is_equal_to((True, 1))
+    assert_that(persistent_cache.get("key2")).is_equal_to((False, None))
+    assert_that(persistent_cache.get("key3")).is_equal_to((True, 3))
+
+
+def test_persistent_cache_stats_and_clear(persistent_cache_file):
+    persistent_cache = PersistentCache()
+    assert_that(persistent_cache.stats()).contains_entry({"entries": 0}, {"functions": {}})
+    assert_that(persistent_cache.clear()).is_equal_to(0)
+
+    persistent_cache.put("key1", "function1", "us-east-1", 1, ttl=600)
+    persistent_cache.put("key2", "function1", "us-east-1", 2, ttl=600)
+    persistent_cache.put("key3", "function2", "eu-west-1", 3, ttl=600)
+    persistent_cache.get("key1")
+    persistent_cache.get("key1")
+
+    stats = persistent_cache.stats()
+    assert_that(stats).contains_entry({"path": persistent_cache_file}, {"entries": 3}, {"hits": 2})
+    assert_that(stats["functions"]).is_equal_to(
+        {
+            "function1": {"entries": 2, "expiredEntries": 0, "hits": 2},
+            "function2": {"entries": 1, "expiredEntries": 0, "hits": 0},
+        }
+    )
+    assert_that(persistent_cache.stats(region="eu-west-1")).contains_entry({"entries": 1})
+
+    assert_that(persistent_cache.clear(region="us-east-1")).is_equal_to(2)
+    assert_that(persistent_cache.clear()).is_equal_to(1)
+
+
+@pytest.mark.parametrize("persistent_cache_enabled", [True, False])
+def test_cached_with_persistent_ttl(persistent_cache_file, set_env, mocker, persistent_cache_enabled):
+    if not persistent_cache_enabled:
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "")
+    mocker.patch("pcluster.aws.common.get_region", return_value="us-east-1")
+    session_mock = mocker.patch("pcluster.aws.common.boto3.session.Session")
+    mocker.patch("pcluster.aws.common._session_identity", return_value=("us-east-1", "credentials"))
+    expensive_call = mocker.MagicMock(side_effect=lambda value: {"result": value})
+
+    class _Client:
+        @Cache.cached(persistent_ttl=600)
+        def get_value(self, value):
+            return expensive_call(value)
+
+    assert_that(_Client().get_value("a")).is_equal_to({"result": "a"})
+    assert_that(_Client().get_value("b")).is_equal_to({"result": "b"})
+    assert_that(expensive_call.call_count).is_equal_to(2)
+
+    # A new process has an empty in-memory cache and a different client instance
+    Cache.clear_all()
+    assert_that(_Client().get_value("a")).is_equal_to({"result": "a"})
+    assert_that(expensive_call.call_count).is_equal_to(2 if persistent_cache_enabled else 3)
+    # The key reuses the identity of the default session, no session is created at every cache miss
+    session_mock.assert_not_called()
+
+
+def test_cached_lru_eviction_and_stats(mocker):
+    expensive_call = mocker.MagicMock(side_effect=lambda value: value * 2)
+
+    @Cache.cached(max_entries=2)
+    def get_value(value):
+        return expensive_call(value)
+
+    cache_name = get_value.__qualname__
+    assert_that([get_value(1), get_value(2), get_value(1), get_value(3)]).is_equal_to([2, 4, 2, 6])
+    # 2 is the least recently used entry so it has been evicted, while 1 is still cached
+    assert_that(get_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(3)
+    assert_that(get_value(2)).is_equal_to(4)
+    assert_that(expensive_call.call_count).is_equal_to(4)
+
+    assert_that(Cache.stats()[cache_name]).is_equal_to(
+        {"entries": 2, "maxEntries": 2, "hits": 2, "misses": 4, "evictions": 2, "waits": 0, "inFlight": 0}
+    )
+
+    Cache.clear_all()
+    assert_that(Cache.stats()[cache_name]).contains_entry({"entries": 0}, {"hits": 2})
+    Cache.reset_stats()
+    assert_that(Cache.stats()[cache_name]).contains_entry({"hits": 0}, {"misses": 0}, {"evictions": 0})
+
+
+def test_cached_concurrent_invocations(mocker):
+    started = threading.Event()
+    release = threading.Event()
+    expensive_call = mocker.MagicMock(return_value="value")
+
+    @Cache.cached
+    def get_value(key):
+        started.set()
+        release.wait(5)
+        return expensive_call(key)
+
+    first_call = threading.Thread(target=get_value, args=("key",))
+    first_call.start()
+    started.wait(5)
+    second_call = threading.Thread(target=get_value, args=("key",))
+    second_call.start()
+    while Cache.stats()[get_value.__qualname__]["waits"] == 0:
+        time.sleep(0.01)
+    release.set()
+    first_call.join()
+    second_call.join()
+
+    # The second invocation waited for the first one and then used its result
+    expensive_call.assert_called_once_with("key")
+    assert_that(Cache.stats()[get_value.__qualname__]).contains_entry(
+        {"hits": 1}, {"misses": 1}, {"waits": 1}, {"inFlight": 0}
+    )
+
+
+def test_aws_usage_counter():
+    @Cache.cached
+    def get_value(value):
+        AWSUsageCounter.add_aws_call()
+        return value
+
+    counter = AWSUsageCounter()
+    with counter.track():
+        get_value(1)
+        get_value(1)
+        get_value(2)
+        # Calls performed by other threads are not counted
+        other_thread = threading.Thread(target=get_value, args=(3,))
+        other_thread.start()
+        other_thread.join()
+    get_value(4)
+
+    assert_that(counter.aws_calls).is_equal_to(2)
+    assert_that(counter.cache_hits).is_equal_to(1)
+
+
+def test_process_scoped_cache(mocker):
+    session_identity_mock = mocker.patch(
+        "pcluster.aws.common._session_identity", return_value=("us-east-1", "credentials")
+    )
+    monotonic_mock = mocker.patch("pcluster.aws.common.time.monotonic", return_value=1000)
+    expensive_call = mocker.MagicMock(side_effect=lambda value: value * 2)
+
+    class _Client:
+        @Cache.cached(process_ttl=60)
+        def get_immutable_value(self, value):
+            return expensive_call(value)
+
+        @Cache.cached
+        def get_value(self, value):
+            return expensive_call(value)
+
+    # Process scoped results are shared by different client instances and they are kept across requests
+    assert_that(_Client().get_immutable_value(1)).is_equal_to(2)
+    Cache.clear_request_scoped()
+    assert_that(_Client().get_immutable_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(1)
+
+    # Request scoped results are removed at every request
+    client = _Client()
+    assert_that(client.get_value(1)).is_equal_to(2)
+    assert_that(client.get_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(2)
+    Cache.clear_request_scoped()
+    assert_that(client.get_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(3)
+
+    # Process scoped results depend on region and credentials
+    session_identity_mock.return_value = ("eu-west-1", "credentials")
+    assert_that(_Client().get_immutable_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(4)
+
+    # Process scoped results expire
+    monotonic_mock.return_value = 1060
+    assert_that(_Client().get_immutable_value(1)).is_equal_to(2)
+    assert_that(expensive_call.call_count).is_equal_to(5)
+
+
+def test_boto3_client_pool(mocker):
+    create_client_mock = mocker.patch(
+        "pcluster.aws.common._create_client", side_effect=lambda *args: mocker.MagicMock()
+    )
+    session_identity_mock = mocker.patch(
+        "pcluster.aws.common._session_identity", return_value=("us-east-1", "credentials")
+    )
+
+    # Clients are not reused when the pool is not active
+    assert_that(Boto3Client("ec2")._client).is_not_same_as(Boto3Client("ec2")._client)
+    assert_that(create_client_mock.call_count).is_equal_to(2)
+
+    client_pool = Boto3ClientPool()
+    client_pool.activate()
+    try:
+        ec2_client = Boto3Client("ec2")._client
+        assert_that(Boto3Client("ec2")._client).is_same_as(ec2_client)
+        assert_that(
+            Boto3Client("ec2", botocore_config_kwargs={"retries": {"max_attempts": 10}})._client
+        ).is_not_same_as(ec2_client)
+        assert_that(Boto3Client("s3")._client).is_not_same_as(ec2_client)
+        session_identity_mock.return_value = ("eu-west-1", "credentials")
+        assert_that(Boto3Client("ec2")._client).is_not_same_as(ec2_client)
+        assert_that(client_pool.size()).is_equal_to(4)
+    finally:
+        Boto3ClientPool.deactivate()
@@ -10,6 +10,7 @@
 # limitations under the License.
 
 import pytest
+from assertpy import assert_that
 from boto3.dynamodb.conditions import Attr
 
 from pcluster.aws.dynamo import DynamoResource
@@ -66,3 +67,25 @@ class TestDynamoDBResource:
             ExpressionAttributeValues=expression_attribute_values,
             ConditionExpression=condition_expression,
         )
+
+    def test_batch_get_item(self, set_env, mocker):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        mocker.patch("pcluster.aws.dynamo.time.sleep")
+        batch_get_item_mock = mocker.patch("boto3.resource").return_value.batch_get_item
+        batch_get_item_mock.side_effect = [
+            {
+                "Responses": {"table1": [{"Id": "MyKey", "Status": "RUNNING"}], "table2": []},
+                "UnprocessedKeys": {"table3": {"Keys": [{"Id": "MyKey"}], "ConsistentRead": True}},
+            },
+            {"Responses": {"table3": [{"Id": "MyKey", "Status": "STOPPED"}]}, "UnprocessedKeys": {}},
+        ]
+
+        items = DynamoResource().batch_get_item({table: {"Id": "MyKey"} for table in ["table1", "table2", "table3"]})
+
+        # Tables without the item are not returned, unprocessed keys are retried
+        assert_that(items).is_equal_to(
+            {"table1": {"Id": "MyKey", "Status": "RUNNING"}, "table3": {"Id": "MyKey", "Status": "STOPPED"}}
+        )
+        assert_that(batch_get_item_mock.call_args_list[1]).is_equal_to(
+            mocker.call(RequestItems={"table3": {"Keys": [{"Id": "MyKey"}], "ConsistentRead": True}})
+        )
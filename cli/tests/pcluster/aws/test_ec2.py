@@ -324,6 +324,29 @@ def test_get_official_image_id(boto3_stubber, os, architecture, filters, boto3_r
         assert_that(ami_id).is_equal_to(expected_ami_id)
 
 
+def test_get_official_image_id_cache_key(boto3_stubber):
+    """Verify that the cached official image is looked up by the values of the search filters."""
+    boto3_response = {"Images": [{"ImageId": "ami-00e87074e52e6", "CreationDate": "2018-11-09T01:21:00.000Z"}]}
+    name_filter = {"Name": "name", "Values": [f"aws-parallelcluster-{get_installed_version()}-amzn2-hvm-x86_64*"]}
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_images",
+            expected_params={
+                "Filters": [name_filter, {"Name": "tag:key1", "Values": [value]}],
+                "Owners": ["self"],
+                "IncludeDeprecated": True,
+            },
+            response=boto3_response,
+        )
+        for value in ["value1", "value2"]
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    for value in ["value1", "value1", "value2"]:
+        filters = AmiSearchFilters(owner="self", tags=[Tag("key1", value)])
+        assert_that(Ec2Client().get_official_image_id("alinux2", "x86_64", filters)).is_equal_to("ami-00e87074e52e6")
+
+
 @pytest.mark.parametrize(
     "boto3_response, expected_ami_id",
     [
@@ -504,14 +527,20 @@ def test_describe_subnets_cache(boto3_stubber):
 
 def test_get_subnet_ids_az_mapping(boto3_stubber):
     subnet_ids = ["subnet-123", "subnet-456"]
-    avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"}
+    avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b", "subnet-789": "us-east-1c"}
+    # All the subnets are described with a single call and then served from the subnets index
     mocked_requests = [
-        get_describe_subnets_mocked_request([subnet_id], "available", avail_zones) for subnet_id in subnet_ids
+        get_describe_subnets_mocked_request(subnet_ids, "available", avail_zones),
+        get_describe_subnets_mocked_request(["subnet-789"], "available", avail_zones),
     ]
     boto3_stubber("ec2", mocked_requests)
     response = AWSApi.instance().ec2.get_subnets_az_mapping(subnet_ids)
-    assert_that(response["subnet-123"]).is_equal_to("us-east-1a")
-    assert_that(response["subnet-456"]).is_equal_to("us-east-1b")
+    assert_that(response).is_equal_to({"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"})
+    assert_that(AWSApi.instance().ec2.get_subnet_avail_zone("subnet-456")).is_equal_to("us-east-1b")
+
+    # Only the subnet not in the index is described
+    response = AWSApi.instance().ec2.get_subnets_az_mapping(["subnet-123", "subnet-789", "subnet-123"])
+    assert_that(response).is_equal_to({"subnet-123": "us-east-1a", "subnet-789": "us-east-1c"})
 
 
 def get_describe_capacity_reservation_mocked_request(capacity_reservations, state):
@@ -561,6 +590,31 @@ def test_describe_capacity_reservations_cache(boto3_stubber):
     )
 
 
+def test_describe_instance_types_cache(boto3_stubber, mocker):
+    mocker.patch("pcluster.aws.ec2.DESCRIBE_INSTANCE_TYPES_BATCH_SIZE", 2)
+    instance_types = ["c5.xlarge", "t2.micro", "m6g.xlarge"]
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_types",
+            response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in batch]},
+            expected_params={"InstanceTypes": batch},
+        )
+        for batch in [["c5.xlarge", "t2.micro"], ["m6g.xlarge"]]
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    ec2_client = AWSApi.instance().ec2
+    ec2_client.additional_instance_types_data = {"custom.type": {"InstanceType": "custom.type"}}
+
+    # Instance types are described with batched calls, duplicates and additional instance types are skipped
+    response = ec2_client.describe_instance_types(instance_types + ["t2.micro", "custom.type"])
+    assert_that([instance_type["InstanceType"] for instance_type in response]).is_equal_to(instance_types)
+
+    # Further calls are served from cache, without any boto3 call
+    assert_that(ec2_client.describe_instance_types(["m6g.xlarge"])).is_length(1)
+    for instance_type in instance_types + ["custom.type"]:
+        assert_that(ec2_client.get_instance_type_info(instance_type).instance_type()).is_equal_to(instance_type)
+
+
 def get_describe_security_groups_mocked_request(security_groups, ip_permissions):
     return MockedBoto3Request(
         method="describe_security_groups",
@@ -619,3 +673,29 @@ def test_describe_volume(boto3_stubber):
     response = AWSApi.instance().ec2.describe_volume(volume_id)
 
     assert_that(response["AvailabilityZone"] == az).is_true()
+
+
+def test_get_instance_states(boto3_stubber):
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_instance_status",
+            response={
+                "InstanceStatuses": [
+                    {"InstanceId": "i-1", "InstanceState": {"Code": 32, "Name": "shutting-down"}},
+                    {"InstanceId": "i-2", "InstanceState": {"Code": 16, "Name": "running"}},
+                ],
+                "NextToken": "token",
+            },
+            expected_params={"InstanceIds": ["i-1", "i-2", "i-3"], "IncludeAllInstances": True},
+        ),
+        MockedBoto3Request(
+            method="describe_instance_status",
+            response={"InstanceStatuses": [{"InstanceId": "i-3", "InstanceState": {"Code": 48, "Name": "terminated"}}]},
+            expected_params={"InstanceIds": ["i-1", "i-2", "i-3"], "IncludeAllInstances": True, "NextToken": "token"},
+        ),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+
+    assert_that(AWSApi.instance().ec2.get_instance_states(("i-1", "i-2", "i-3"))).is_equal_to(
+        {"i-1": "shutting-down", "i-2": "running", "i-3": "terminated"}
+    )
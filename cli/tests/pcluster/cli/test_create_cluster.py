@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import itertools
+import json
 
 import pytest
 from assertpy import assert_that
@@ -13,6 +14,7 @@ from assertpy import assert_that
 from pcluster.api.models import CreateClusterResponseContent, DescribeClusterResponseContent
 from pcluster.cli.entrypoint import run
 from pcluster.cli.exceptions import APIOperationException
+from pcluster.validators.common import ValidationProfile
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.utils import wire_translate
 
@@ -100,7 +102,8 @@ class TestCreateClusterCommand:
         describe_cluster_mock = mocker.patch(
             "pcluster.api.controllers.cluster_operations_controller.describe_cluster", return_value=response
         )
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        stack_waiter_mock = mocker.patch("pcluster.cli.middleware.StackWaiter")
+        stack_waiter_mock.return_value.wait.return_value = "CREATE_COMPLETE"
         mock_aws_api(mocker)
 
         path = str(test_datadir / "config.yaml")
@@ -119,7 +122,7 @@ class TestCreateClusterCommand:
             "create_cluster_request_content": {"clusterName": "cluster", "clusterConfiguration": ""},
         }
         create_cluster_mock.assert_called_with(**expected_args)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(stack_waiter_mock.call_args[0]).is_equal_to(("cluster",))
         describe_cluster_mock.assert_called_with(cluster_name="cluster")
 
     @pytest.mark.parametrize("cluster_name_arg, region_arg", [("--cluster-name", "--region"), ("-n", "-r")])
@@ -158,6 +161,52 @@ class TestCreateClusterCommand:
         }
         create_cluster_mock.assert_called_with(**expected_args)
 
+    def test_execute_with_validation_profile(self, mocker, test_datadir, tmpdir):
+        response_dict = {
+            "cluster": {
+                "clusterName": "cluster",
+                "cloudformationStackStatus": "CREATE_IN_PROGRESS",
+                "cloudformationStackArn": "arn:aws:cloudformation:us-east-2:000000000000:stack/cluster/aa",
+                "region": "eu-west-1",
+                "version": "3.0.0",
+                "clusterStatus": "CREATE_IN_PROGRESS",
+            }
+        }
+
+        def _create_cluster(**kwargs):
+            ValidationProfile.active().add_execution("FakeValidator", "SlurmClusterConfig/head_node")
+            return CreateClusterResponseContent().from_dict(response_dict)
+
+        create_cluster_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.create_cluster",
+            side_effect=_create_cluster,
+            autospec=True,
+        )
+
+        profile_path = str(tmpdir / "profile.json")
+        path = str(test_datadir / "config.yaml")
+        out = run(
+            ["create-cluster", "-n", "cluster", "-c", path, "-r", "eu-west-1", "--validation-profile", profile_path]
+        )
+        assert_that(out).is_equal_to(response_dict)
+        assert_that(create_cluster_mock.call_args[1]).does_not_contain_key("validation_profile")
+        assert_that(ValidationProfile.active()).is_none()
+
+        with open(profile_path, encoding="utf-8") as profile_file:
+            profile = json.load(profile_file)
+        assert_that(profile["executions"]).is_equal_to(
+            [
+                {
+                    "validator": "FakeValidator",
+                    "resourcePath": "SlurmClusterConfig/head_node",
+                    "completed": False,
+                    "wallTime": None,
+                    "awsCalls": 0,
+                    "cacheHits": 0,
+                }
+            ]
+        )
+
     def test_error(self, mocker, test_datadir):
         api_response = {"message": "error"}, 400
         mocker.patch(
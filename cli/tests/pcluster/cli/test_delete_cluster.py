@@ -5,6 +5,8 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+from datetime import datetime, timezone
+
 import pytest
 from assertpy import assert_that
 
@@ -62,7 +64,8 @@ class TestDeleteClusterCommand:
             autospec=True,
         )
 
-        cf_waiter_mock = mocker.patch("botocore.waiter.Waiter.wait")
+        stack_waiter_mock = mocker.patch("pcluster.cli.middleware.StackWaiter")
+        stack_waiter_mock.return_value.wait.return_value = "DELETE_COMPLETE"
         mock_aws_api(mocker)
 
         command = ["delete-cluster", "--cluster-name", "cluster", "--wait"]
@@ -72,7 +75,50 @@ class TestDeleteClusterCommand:
         assert_that(delete_cluster_mock.call_args).is_length(2)
         args_expected = {"region": None, "cluster_name": "cluster"}
         delete_cluster_mock.assert_called_with(**args_expected)
-        assert_that(cf_waiter_mock.call_args[1]).is_equal_to({"StackName": "cluster"})
+        assert_that(stack_waiter_mock.call_args[0]).is_equal_to(("cluster",))
+
+    def test_execute_with_wait_failure(self, mocker, capfd):
+        response_dict = {
+            "cluster": {
+                "clusterName": "cluster",
+                "cloudformationStackStatus": "DELETE_IN_PROGRESS",
+                "cloudformationStackArn": "arn:aws:cloudformation:us-east-2:000000000000:stack/cluster/aa",
+                "region": "eu-west-1",
+                "version": "3.0.0",
+                "clusterStatus": "DELETE_IN_PROGRESS",
+            }
+        }
+        mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.delete_cluster",
+            return_value=DeleteClusterResponseContent().from_dict(response_dict),
+            autospec=True,
+        )
+        stack_waiter_mock = mocker.patch("pcluster.cli.middleware.StackWaiter")
+
+        def _wait(timeout):
+            stack_waiter_mock.call_args[1]["on_event"](
+                {
+                    "StackName": "cluster-QueuesStack-ABC",
+                    "Timestamp": datetime(2023, 1, 1, tzinfo=timezone.utc),
+                    "ResourceStatus": "DELETE_FAILED",
+                    "ResourceType": "AWS::EC2::LaunchTemplate",
+                    "LogicalResourceId": "LaunchTemplate",
+                    "ResourceStatusReason": "Access denied",
+                }
+            )
+            return "DELETE_FAILED"
+
+        stack_waiter_mock.return_value.wait.side_effect = _wait
+        mock_aws_api(mocker)
+
+        with pytest.raises(APIOperationException) as exc_info:
+            run(["delete-cluster", "--cluster-name", "cluster", "--wait"])
+        assert_that(exc_info.value.data).is_equal_to({"message": "Failed when deleting cluster 'cluster'."})
+        # The stack events are printed to stderr while waiting, prefixed by the name of nested stacks
+        assert_that(capfd.readouterr().err).contains(
+            "cluster-QueuesStack-ABC 2023-01-01T00:00:00+00:00 DELETE_FAILED AWS::EC2::LaunchTemplate LaunchTemplate "
+            "Access denied"
+        )
 
     def test_execute(self, mocker):
         response_dict = {
@@ -5,9 +5,13 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import json
+
 import pytest
 from assertpy import assert_that
 
+from pcluster.api.models import DescribeClusterInstancesResponseContent
+
 
 class TestDescribeClusterInstancesCommand:
     def test_helper(self, test_datadir, run_cli, assert_out_err):
@@ -38,3 +42,29 @@ class TestDescribeClusterInstancesCommand:
 
         out, err = capsys.readouterr()
         assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "query, expected_lines",
+        [
+            (None, [{"instanceId": "i-1"}, {"instanceId": "i-2"}, {"instanceId": "i-3"}]),
+            ("instanceId", ["i-1", "i-2", "i-3"]),
+        ],
+    )
+    def test_execute_ndjson(self, mocker, run_cli, capsys, query, expected_lines):
+        pages = {
+            None: DescribeClusterInstancesResponseContent(instances=[{"instanceId": "i-1"}], next_token="token1"),
+            "token1": DescribeClusterInstancesResponseContent(instances=[], next_token="token2"),
+            "token2": DescribeClusterInstancesResponseContent(instances=[{"instanceId": "i-2"}, {"instanceId": "i-3"}]),
+        }
+        describe_cluster_instances_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_instances_controller.describe_cluster_instances",
+            side_effect=lambda **kwargs: pages[kwargs["next_token"]],
+            autospec=True,
+        )
+
+        command = ["pcluster", "describe-cluster-instances", "--cluster-name", "cluster", "--ndjson"]
+        run_cli(command + (["--query", query] if query else []), expect_failure=False)
+
+        out, _ = capsys.readouterr()
+        assert_that([json.loads(line) for line in out.splitlines()]).is_equal_to(expected_lines)
+        assert_that(describe_cluster_instances_mock.call_count).is_equal_to(3)
@@ -0,0 +1,112 @@
+#  Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+from unittest.mock import ANY
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.api.models import DescribeClustersResponseContent
+from pcluster.cli.entrypoint import run
+from pcluster.cli.exceptions import APIOperationException
+
+
+class TestDescribeClustersCommand:
+    def test_helper(self, test_datadir, run_cli, assert_out_err):
+        command = ["pcluster", "describe-clusters", "--help"]
+        run_cli(command, expect_failure=False)
+
+        assert_out_err(expected_out=(test_datadir / "pcluster-help.txt").read_text().strip(), expected_err="")
+
+    @pytest.mark.parametrize(
+        "args, error_message",
+        [
+            (["--invalid"], "Invalid arguments ['--invalid']"),
+            (["--region", "eu-west-"], "Bad Request: invalid or unsupported region 'eu-west-'"),
+            (["--cluster-names", "invalid.name"], "'invalid.name' does not match '^[a-zA-Z][a-zA-Z0-9-]+$'"),
+        ],
+    )
+    def test_invalid_args(self, args, error_message, run_cli, capsys):
+        command = ["pcluster", "describe-clusters"] + args
+        run_cli(command, expect_failure=True)
+
+        out, err = capsys.readouterr()
+        assert_that(out + err).contains(error_message)
+
+    @pytest.mark.parametrize(
+        "args, mocked_api_response, expected_cli_response",
+        [
+            (
+                {"cluster_names": ["cluster1", "cluster2"], "region": "us-east-1"},
+                DescribeClustersResponseContent(
+                    clusters=[], not_found_cluster_names=["cluster1", "cluster2"], incompatible_cluster_names=[]
+                ),
+                {"clusters": [], "notFoundClusterNames": ["cluster1", "cluster2"], "incompatibleClusterNames": []},
+            ),
+            (
+                {"region": "us-east-1", "next_token": "stacks:token1"},
+                DescribeClustersResponseContent(
+                    clusters=[], not_found_cluster_names=[], incompatible_cluster_names=[], next_token="stacks:token2"
+                ),
+                {
+                    "clusters": [],
+                    "notFoundClusterNames": [],
+                    "incompatibleClusterNames": [],
+                    "nextToken": "stacks:token2",
+                },
+            ),
+            (
+                {"region": "us-east-1"},
+                DescribeClustersResponseContent(clusters=[], not_found_cluster_names=[], incompatible_cluster_names=[]),
+                {"clusters": [], "notFoundClusterNames": [], "incompatibleClusterNames": []},
+            ),
+        ],
+        ids=["cluster_names", "next_token", "required"],
+    )
+    def test_execute(self, mocker, args, mocked_api_response, expected_cli_response):
+        describe_clusters_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.describe_clusters",
+            return_value=mocked_api_response,
+            autospec=True,
+        )
+
+        out = run(["describe-clusters"] + self._build_cli_args(args))
+        assert_that(out).is_equal_to(expected_cli_response)
+        assert_that(describe_clusters_mock.call_args).is_length(2)  # this is due to the decorator on describe_clusters
+        if "cluster_names" in args:
+            # Asserting the cluster_names list separately because the order is not preserved
+            assert_that(describe_clusters_mock.call_args[1].get("cluster_names")).contains_only(
+                *args.get("cluster_names")
+            )
+            args["cluster_names"] = ANY
+        base_args = {"region": None, "cluster_names": None, "next_token": None}
+        describe_clusters_mock.assert_called_with(**{**base_args, **args})
+
+    def test_error(self, mocker):
+        api_response = {"message": "error"}, 400
+        mocker.patch(
+            "pcluster.api.controllers.cluster_operations_controller.describe_clusters",
+            return_value=api_response,
+            autospec=True,
+        )
+
+        with pytest.raises(APIOperationException) as exc_info:
+            command = ["describe-clusters", "--region", "eu-west-1"]
+            run(command)
+        assert_that(exc_info.value.data).is_equal_to(api_response[0])
+
+    @staticmethod
+    def _build_cli_args(args):
+        cli_args = []
+        if "region" in args:
+            cli_args.extend(["--region", args["region"]])
+        if "cluster_names" in args:
+            cli_args.extend(["--cluster-names"])
+            cli_args.extend(args["cluster_names"])
+        if "next_token" in args:
+            cli_args.extend(["--next-token", args["next_token"]])
+        return cli_args
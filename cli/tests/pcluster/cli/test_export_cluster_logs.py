@@ -84,6 +84,7 @@ class TestExportClusterLogsCommand:
                 "end_time": "2021-06-07",
                 "filters": "Name=node-type,Values=HeadNode",
             },
+            {"start_time": "2021-06-02T00:00:00Z", "end_time": "2021-06-08T00:00:00Z", "export_windows": 4},
         ],
     )
     def test_execute(self, mocker, set_env, args):
@@ -110,6 +111,7 @@ class TestExportClusterLogsCommand:
             "filters": None,
             "start_time": None,
             "end_time": None,
+            "export_windows": 1,
         }
         expected_params.update(args)
         expected_params.update(
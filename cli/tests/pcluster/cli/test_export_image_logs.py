@@ -61,6 +61,7 @@ class TestExportImageLogsCommand:
                 "start_time": "2021-06-02T15:55:10+02:00",
                 "end_time": "2021-06-07",
             },
+            {"start_time": "2021-06-02T00:00:00Z", "end_time": "2021-06-08T00:00:00Z", "export_windows": 4},
         ],
     )
     def test_execute(self, mocker, set_env, args):
@@ -87,6 +88,7 @@ class TestExportImageLogsCommand:
             "keep_s3_objects": False,
             "start_time": None,
             "end_time": None,
+            "export_windows": 1,
         }
         expected_params.update(args)
         expected_params.update(
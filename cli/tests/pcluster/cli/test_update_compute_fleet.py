@@ -8,7 +8,7 @@
 import pytest
 from assertpy import assert_that
 
-from pcluster.api.models import UpdateComputeFleetResponseContent
+from pcluster.api.models import DescribeComputeFleetResponseContent, UpdateComputeFleetResponseContent
 from pcluster.cli.entrypoint import run
 from pcluster.cli.exceptions import APIOperationException
 from tests.utils import wire_translate
@@ -65,6 +65,43 @@ class TestUpdateComputeFleetCommand:
         }
         update_compute_fleet_status_mock.assert_called_with(**expected_args)
 
+    @pytest.mark.parametrize(
+        "requested_status, describe_statuses, expected_error",
+        [
+            ("START_REQUESTED", ["START_REQUESTED", "STARTING", "RUNNING"], None),
+            ("STOP_REQUESTED", ["STOPPING", "STOPPED"], None),
+            ("ENABLED", ["ENABLED"], None),
+            ("START_REQUESTED", ["STARTING", "STOPPED"], "Unexpected final compute fleet status STOPPED"),
+        ],
+    )
+    def test_execute_with_wait(self, mocker, requested_status, describe_statuses, expected_error):
+        mocker.patch(
+            "pcluster.api.controllers.cluster_compute_fleet_controller.update_compute_fleet",
+            return_value=UpdateComputeFleetResponseContent().from_dict({"status": requested_status}),
+            autospec=True,
+        )
+        describe_compute_fleet_mock = mocker.patch(
+            "pcluster.api.controllers.cluster_compute_fleet_controller.describe_compute_fleet",
+            side_effect=[DescribeComputeFleetResponseContent(status=status) for status in describe_statuses],
+            autospec=True,
+        )
+        sleep_mock = mocker.patch("pcluster.utils.time.sleep")
+        command = ["update-compute-fleet", "--cluster-name", "cluster", "--status", requested_status, "--wait"]
+
+        if expected_error:
+            with pytest.raises(APIOperationException) as exc_info:
+                run(command)
+            assert_that(exc_info.value.data["message"]).contains(expected_error)
+        else:
+            out = run(command)
+            assert_that(out).is_equal_to({"status": describe_statuses[-1]})
+        # The status is polled until the transition is completed, with increasing intervals
+        assert_that(describe_compute_fleet_mock.call_count).is_equal_to(len(describe_statuses))
+        assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to(
+            [1, 2, 4][: len(describe_statuses) - 1]
+        )
+        describe_compute_fleet_mock.assert_called_with(cluster_name="cluster", region=None)
+
     def test_error(self, mocker):
         api_response = {"message": "error"}, 400
         mocker.patch(
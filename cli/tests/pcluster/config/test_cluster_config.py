@@ -139,6 +139,36 @@ class TestBaseClusterConfig:
         cluster_config._register_validators()
         assert_that(cluster_config._validators).is_not_empty()
 
+    def test_instance_types_and_subnets_info_cached_on_init(self, aws_api_mock):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2"),
+            head_node=HeadNode("c5.xlarge", HeadNodeNetworking("subnet-head")),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name=f"queue{index}",
+                        networking=SlurmQueueNetworking(subnet_ids=[f"subnet-{index}", "subnet-head"]),
+                        compute_resources=[
+                            SlurmComputeResource(name="compute_resource_1", instance_type="t2.micro"),
+                            SlurmFlexibleComputeResource(
+                                [
+                                    FlexibleInstanceType(instance_type="c5.xlarge"),
+                                    FlexibleInstanceType(instance_type=f"c5n.{index + 1}xlarge"),
+                                ],
+                                name="compute_resource_2",
+                            ),
+                        ],
+                    )
+                    for index in range(2)
+                ]
+            ),
+        )
+        assert_that(cluster_config.instance_types).is_equal_to(["c5.xlarge", "t2.micro", "c5n.1xlarge", "c5n.2xlarge"])
+        aws_api_mock.ec2.describe_instance_types.assert_called_once_with(cluster_config.instance_types)
+        assert_that(cluster_config.subnet_ids).is_equal_to(["subnet-head", "subnet-0", "subnet-1"])
+        aws_api_mock.ec2.describe_subnets.assert_called_once_with(cluster_config.subnet_ids)
+
     def test_instances_in_slurm_queue(self):
         queue = SlurmQueue(
             name="queue0",
@@ -9,16 +9,20 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import threading
+import time
 from typing import List
 from unittest.mock import MagicMock
 
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSUsageCounter
 from pcluster.config.common import Resource, TypeMatchValidatorsSuppressor
 from pcluster.validators.common import (
     AsyncValidator,
     FailureLevel,
+    ValidationProfile,
     Validator,
     ValidatorContext,
     get_async_timed_validator_type_for,
@@ -64,6 +68,42 @@ class FakeAsyncMultiErrorValidator(AsyncValidator):
         self._add_failure(f"Error async 2 {param}.", FailureLevel.ERROR)
 
 
+class FakeBlockingValidator(Validator):
+    """Dummy validator that waits for the given event before completing."""
+
+    def _validate(self, param, event: threading.Event, wait_seconds: float = 5):
+        event.wait(wait_seconds)
+        self._add_failure(f"Blocking {param}.", FailureLevel.INFO)
+
+
+class FakeBarrierValidator(Validator):
+    """Dummy validator that completes only when all the parties of the given barrier are waiting."""
+
+    def _validate(self, param, barrier: threading.Barrier, delay: float = 0):
+        time.sleep(delay)
+        barrier.wait(5)
+        self._add_failure(f"Barrier {param}.", FailureLevel.ERROR)
+
+
+class FakeAwsCallsValidator(Validator):
+    """Dummy validator simulating AWS calls and cache hits."""
+
+    def _validate(self, aws_calls: int, cache_hits: int):
+        for _ in range(aws_calls):
+            AWSUsageCounter.add_aws_call()
+        for _ in range(cache_hits):
+            AWSUsageCounter.add_cache_hit()
+
+
+class FakeAsyncAwsCallsValidator(AsyncValidator):
+    """Dummy async validator simulating AWS calls."""
+
+    async def _validate_async(self, aws_calls: int):
+        await asyncio.sleep(0.1)
+        for _ in range(aws_calls):
+            AWSUsageCounter.add_aws_call()
+
+
 class FakeComplexValidator(Validator):
     """Dummy validator requiring multiple parameters as input."""
 
@@ -256,6 +296,164 @@ def test_async_resource_validation_with_timeout():
     assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value other-value.")
 
 
+def test_sync_resource_validation_concurrent():
+    """Verify that sync validators run concurrently and their results keep the registration order."""
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, name, barrier, delay=0):
+            super().__init__()
+            self.fake_attribute = f"fake-{name}"
+            self.barrier = barrier
+            self.delay = delay
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(
+                FakeBarrierValidator, param=self.fake_attribute, barrier=self.barrier, delay=self.delay
+            )
+
+    # Validators would fail with a broken barrier if they were executed serially
+    barrier = threading.Barrier(3)
+    fake_resource = FakeResource("root", barrier)
+    fake_resource.nested1 = FakeResource("nested1", barrier, delay=0.3)
+    fake_resource.nested2 = FakeResource("nested2", barrier)
+    validation_failures = fake_resource.validate()
+
+    assert_that(validation_failures).is_length(3)
+    assert_validation_result(validation_failures[0], FailureLevel.ERROR, "Barrier fake-nested1.")
+    assert_validation_result(validation_failures[1], FailureLevel.ERROR, "Barrier fake-nested2.")
+    assert_validation_result(validation_failures[2], FailureLevel.ERROR, "Barrier fake-root.")
+
+
+def test_sync_resource_validation_with_timeout(mocker):
+    """Verify that sync validators are reported as timed out without affecting the other validators."""
+    mocker.patch("pcluster.config.common.SYNC_VALIDATORS_DEFAULT_TIMEOUT_SEC", 0.2)
+    event = threading.Event()
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self):
+            super().__init__()
+            self.fake_attribute = "fake-value"
+            self.other_attribute = "other-value"
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeBlockingValidator, param=self.fake_attribute, event=event)
+            self._register_validator(FakeInfoValidator, param=self.other_attribute)
+
+    fake_resource = FakeResource()
+    try:
+        validation_failures = fake_resource.validate()
+    finally:
+        event.set()
+
+    assert_that(validation_failures).is_length(2)
+    assert_validation_result(validation_failures[0], FailureLevel.WARNING, "timed out after 0.2 seconds.")
+    assert_that(validation_failures[0].validator_type).is_equal_to("FakeBlockingValidator")
+    assert_validation_result(validation_failures[1], FailureLevel.INFO, "Wrong value other-value.")
+
+
+def test_resource_validation_with_overall_timeout(mocker):
+    """Verify that the overall validation timeout cascades to sync and async validators of nested resources."""
+    mocker.patch("pcluster.config.common.VALIDATION_DEFAULT_TIMEOUT_SEC", 0.3)
+    event = threading.Event()
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self, name, blocking):
+            super().__init__()
+            self.fake_attribute = f"fake-{name}"
+            self.blocking = blocking
+
+        def _register_validators(self, context: ValidatorContext = None):
+            if self.blocking:
+                self._register_validator(FakeBlockingValidator, param=self.fake_attribute, event=event)
+                self._register_validator(FakeAsyncErrorValidator, param=self.fake_attribute)
+            else:
+                self._register_validator(FakeErrorValidator, param=self.fake_attribute)
+                self._register_validator(FakeAsyncInfoValidator, param=self.fake_attribute)
+
+    fake_resource = FakeResource("root", blocking=False)
+    fake_resource.nested = FakeResource("nested", blocking=True)
+    try:
+        validation_failures = fake_resource.validate()
+    finally:
+        event.set()
+
+    assert_that(validation_failures).is_length(4)
+    assert_validation_result(validation_failures[0], FailureLevel.WARNING, "timed out after 0.3 seconds.")
+    assert_validation_result(validation_failures[1], FailureLevel.ERROR, "Error fake-root.")
+    assert_validation_result(validation_failures[2], FailureLevel.WARNING, "timed out after 0.3 seconds.")
+    assert_that(validation_failures[2].validator_type).is_equal_to("FakeAsyncErrorValidator")
+    assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value fake-root.")
+
+
+def test_validation_profile():
+    """Verify that the execution statistics of every validator are collected when a profile is active."""
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, name, aws_calls):
+            super().__init__()
+            self.name = name
+            self.aws_calls = aws_calls
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeAwsCallsValidator, aws_calls=self.aws_calls, cache_hits=1)
+            self._register_validator(FakeAsyncAwsCallsValidator, aws_calls=self.aws_calls)
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self):
+            super().__init__()
+            self.queues = [FakeNestedResource("queue1", 1), FakeNestedResource("queue2", 2)]
+            self.fake_attribute = "fake-value"
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeInfoValidator, param=self.fake_attribute)
+            self._register_validator(FakeAwsCallsValidator, aws_calls=0, cache_hits=3)
+
+    profile = ValidationProfile()
+    with profile.activate():
+        FakeResource().validate(suppressors=[TypeMatchValidatorsSuppressor({"FakeInfoValidator"})])
+    # Validators executed without an active profile are not profiled
+    FakeResource().validate()
+
+    report = profile.report()
+    assert_that(report).contains_entry({"awsCalls": 6}, {"cacheHits": 5})
+    assert_that(report["executions"]).is_length(5)
+    assert_that(report["executions"][0]).contains_entry(
+        {"validator": "FakeAwsCallsValidator"},
+        {"resourcePath": "FakeResource/queues[queue1]"},
+        {"completed": True},
+        {"awsCalls": 1},
+        {"cacheHits": 1},
+    )
+    assert_that(report["executions"][1]).contains_entry(
+        {"validator": "FakeAsyncAwsCallsValidator"},
+        {"resourcePath": "FakeResource/queues[queue1]"},
+        {"awsCalls": 1},
+    )
+    assert_that(report["executions"][1]["wallTime"]).is_greater_than_or_equal_to(0.1)
+
+    validators = {group["validator"]: group for group in report["validators"]}
+    assert_that(validators["FakeAwsCallsValidator"]).contains_entry(
+        {"executions": 3}, {"awsCalls": 3}, {"cacheHits": 5}
+    )
+    assert_that(validators["FakeAsyncAwsCallsValidator"]).contains_entry({"executions": 2}, {"awsCalls": 3})
+    # Async validators are the slowest ones, so they come first
+    assert_that(report["validators"][0]["validator"]).is_equal_to("FakeAsyncAwsCallsValidator")
+
+    resources = {group["resourcePath"]: group for group in report["resources"]}
+    assert_that(resources).contains_only("FakeResource", "FakeResource/queues[queue1]", "FakeResource/queues[queue2]")
+    assert_that(resources["FakeResource/queues[queue2]"]).contains_entry({"executions": 2}, {"awsCalls": 4})
+
+
 def test_dynamic_property_validate():
     """Verify that validators of dynamic parameters are working as expected."""
 
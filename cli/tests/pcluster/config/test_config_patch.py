@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import os
 import shutil
 
@@ -1004,3 +1005,73 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def _build_large_config(num_queues, num_compute_resources):
+    return {
+        "HeadNode": {"InstanceType": "t2.micro", "Networking": {"SubnetId": "subnet-12345678"}},
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue{queue_index}",
+                    "Networking": {"SubnetIds": ["subnet-12345678"]},
+                    "ComputeResources": [
+                        {"Name": f"compute{compute_index}", "InstanceType": "c5.xlarge", "MinCount": 0, "MaxCount": 10}
+                        for compute_index in range(num_compute_resources)
+                    ],
+                }
+                for queue_index in range(num_queues)
+            ],
+        },
+    }
+
+
+def test_large_config_patch(mocker):
+    num_queues = 100
+    base_conf = _build_large_config(num_queues=num_queues, num_compute_resources=10)
+    target_conf = copy.deepcopy(base_conf)
+    target_queues = target_conf["Scheduling"]["SlurmQueues"]
+    target_queues[50]["ComputeResources"][5]["MaxCount"] = 20
+    removed_queue = target_queues.pop()
+    added_queue = dict(copy.deepcopy(removed_queue), Name="queue-added")
+    target_queues.insert(0, added_queue)
+
+    compare_section_spy = mocker.spy(ConfigPatch, "_compare_section")
+    patch = ConfigPatch(dummy_cluster(), base_config=base_conf, target_config=target_conf)
+
+    _compare_changes(
+        patch.changes,
+        [
+            Change(
+                ["Scheduling", "SlurmQueues[queue50]", "ComputeResources[compute5]"],
+                "MaxCount",
+                10,
+                20,
+                UpdatePolicy.MAX_COUNT,
+                is_list=False,
+            ),
+            Change(
+                ["Scheduling"],
+                "SlurmQueues",
+                None,
+                added_queue,
+                UpdatePolicy.COMPUTE_FLEET_STOP_ON_REMOVE,
+                is_list=True,
+            ),
+            Change(
+                ["Scheduling"],
+                "SlurmQueues",
+                removed_queue,
+                None,
+                UpdatePolicy.COMPUTE_FLEET_STOP_ON_REMOVE,
+                is_list=True,
+            ),
+        ],
+    )
+    assert_that(patch.changes).is_length(3)
+    # Sections identical in the two configurations are not walked
+    assert_that(compare_section_spy.call_count).is_less_than(2 * num_queues)
+    # The compared configurations are not modified
+    assert_that(patch.base_config).is_equal_to(base_conf)
+    assert_that(patch.target_config).is_equal_to(target_conf)
@@ -10,6 +10,7 @@
 # limitations under the License.
 import datetime
 import json
+import threading
 from copy import deepcopy
 from io import BytesIO
 from unittest.mock import PropertyMock
@@ -29,6 +30,7 @@ from pcluster.config.update_policy import UpdatePolicy
 from pcluster.constants import (
     PCLUSTER_CLUSTER_NAME_TAG,
     PCLUSTER_NODE_TYPE_TAG,
+    PCLUSTER_QUEUE_NAME_TAG,
     PCLUSTER_S3_ARTIFACTS_DICT,
     PCLUSTER_VERSION_TAG,
 )
@@ -92,6 +94,249 @@ class TestCluster:
         instances, _ = cluster.describe_instances(node_type=node_type)
         assert_that(instances).is_length(expected_instances)
 
+    def test_iter_instances(self, cluster, mocker):
+        mock_aws_api(mocker)
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[
+                ([{"InstanceId": "i-1"}, {"InstanceId": "i-2"}], "token1"),
+                ([], "token2"),
+                ([{"InstanceId": "i-3"}], None),
+            ],
+        )
+
+        instances = cluster.iter_instances(node_type=NodeType.COMPUTE, page_size=2)
+        # Pages are retrieved only when needed
+        assert_that(describe_instances_mock.call_count).is_equal_to(0)
+        assert_that(next(instances).id).is_equal_to("i-1")
+        assert_that(describe_instances_mock.call_count).is_equal_to(1)
+        assert_that([instance.id for instance in instances]).is_equal_to(["i-2", "i-3"])
+
+        filters = cluster._get_instance_filters(NodeType.COMPUTE)
+        describe_instances_mock.assert_has_calls(
+            [
+                mocker.call(filters, None, max_results=2),
+                mocker.call(filters, "token1", max_results=2),
+                mocker.call(filters, "token2", max_results=2),
+            ]
+        )
+
+    def test_summarize_instances(self, cluster, mocker):
+        mock_aws_api(mocker)
+
+        def _instance(queue_name, state, instance_type):
+            return {
+                "InstanceId": "i-123",
+                "InstanceType": instance_type,
+                "State": {"Name": state},
+                "Tags": [{"Key": PCLUSTER_QUEUE_NAME_TAG, "Value": queue_name}],
+            }
+
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[
+                ([_instance("queue1", "running", "c5.xlarge"), _instance("queue1", "pending", "c5.xlarge")], "token"),
+                ([_instance("queue2", "running", "t3.micro")], None),
+            ],
+        )
+        instance_mock = mocker.patch("pcluster.models.cluster.ClusterInstance")
+
+        summary = cluster.summarize_instances(node_type=NodeType.COMPUTE)
+
+        assert_that(summary.to_dict()).is_equal_to(
+            {
+                "total": 3,
+                "queues": {"queue1": 2, "queue2": 1},
+                "states": {"running": 2, "pending": 1},
+                "instanceTypes": {"c5.xlarge": 2, "t3.micro": 1},
+            }
+        )
+        instance_mock.assert_not_called()
+
+    def test_get_running_capacity(self, cluster, mocker):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.models.cluster_resources.ClusterStack.scheduler", new_callable=PropertyMock, return_value="slurm"
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[([{"InstanceId": "i-1"}, {"InstanceId": "i-2"}], "token"), ([{"InstanceId": "i-3"}], None)],
+        )
+
+        # All the pages are counted
+        assert_that(cluster.get_running_capacity()).is_equal_to(3)
+
+    @pytest.mark.parametrize("terminate_error", [None, AWSClientError("terminate_instances", "Unauthorized.")])
+    def test_terminate_nodes(self, cluster, mocker, terminate_error):
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[
+                ([{"InstanceId": f"i-{index}"} for index in range(150)], "token"),
+                ([{"InstanceId": f"i-{index}"} for index in range(150, 160)], None),
+            ],
+        )
+        terminate_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=terminate_error
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.get_instance_states",
+            side_effect=lambda instance_ids: {instance_id: "shutting-down" for instance_id in instance_ids},
+        )
+
+        if terminate_error:
+            assert_that(cluster.terminate_nodes).raises(ClusterActionError).when_called_with().contains(
+                "Unable to terminate 160 instances: Unauthorized."
+            )
+        else:
+            cluster.terminate_nodes()
+        terminate_instances_mock.assert_has_calls(
+            [
+                mocker.call(tuple(f"i-{index}" for index in range(100))),
+                mocker.call(tuple(f"i-{index}" for index in range(100, 160))),
+            ],
+            any_order=True,
+        )
+
+    @pytest.mark.parametrize("include_creation_failure", [True, False])
+    def test_describe_snapshot(self, cluster, mocker, include_creation_failure):
+        lookups_started = threading.Barrier(4 + include_creation_failure, timeout=5)
+
+        def _lookup(value):
+            # Every lookup waits for the others to be started, so they succeed only if they run concurrently
+            lookups_started.wait()
+            return value
+
+        def _failing_lookup(error):
+            lookups_started.wait()
+            raise error
+
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=PropertyMock
+        ).side_effect = lambda: _lookup(ComputeFleetStatus.RUNNING)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=PropertyMock
+        ).side_effect = lambda: _lookup("presigned-url")
+        mocker.patch("pcluster.models.cluster.Cluster.get_plugin_metadata", side_effect=lambda: _lookup(None))
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.head_node_instance", new_callable=PropertyMock
+        ).side_effect = lambda: _failing_lookup(ClusterActionError("Head node not running"))
+        creation_failure_mock = mocker.patch(
+            "pcluster.models.cluster_resources.ClusterStack.get_cluster_creation_failure",
+            side_effect=lambda: _failing_lookup(AWSClientError("get_stack_events", "error")),
+        )
+
+        snapshot = cluster.describe_snapshot(include_creation_failure=include_creation_failure)
+
+        assert_that(snapshot.stack).is_same_as(cluster.stack)
+        assert_that(snapshot.get("compute_fleet_status")).is_equal_to(ComputeFleetStatus.RUNNING)
+        assert_that(snapshot.get("config_presigned_url")).is_equal_to("presigned-url")
+        assert_that(snapshot.get("plugin_metadata")).is_none()
+        # Failures are raised only when the corresponding result is accessed
+        assert_that(snapshot.get).raises(ClusterActionError).when_called_with("head_node_instance").contains(
+            "Head node not running"
+        )
+        if include_creation_failure:
+            assert_that(snapshot.get).raises(AWSClientError).when_called_with("creation_failure")
+            assert_that(snapshot.errors).contains_only("head_node_instance", "creation_failure")
+        else:
+            creation_failure_mock.assert_not_called()
+            assert_that(snapshot.errors).contains_only("head_node_instance")
+
+    def test_describe_snapshots(self, mocker):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.cluster.DESCRIBE_INSTANCES_MAX_FILTER_VALUES", 2)
+
+        def _cluster(name, status="CREATE_COMPLETE", scheduler="slurm", bucket="parallelcluster-bucket"):
+            parameters = {
+                "Scheduler": scheduler,
+                "ResourcesS3Bucket": bucket,
+                "ArtifactS3RootDirectory": f"parallelcluster/3.7.0/clusters/{name}-abc",
+                "ConfigVersion": "config-version",
+            }
+            return Cluster(
+                name,
+                stack=ClusterStack(
+                    {
+                        "StackName": name,
+                        "StackStatus": status,
+                        "Tags": [{"Key": PCLUSTER_VERSION_TAG, "Value": "3.7.0"}],
+                        "Parameters": [
+                            {"ParameterKey": key, "ParameterValue": value} for key, value in parameters.items()
+                        ],
+                    }
+                ),
+            )
+
+        clusters = [
+            _cluster("cluster1"),
+            _cluster("cluster2", scheduler="plugin"),
+            _cluster("cluster3", status="ROLLBACK_COMPLETE", bucket="unavailable-bucket"),
+        ]
+        get_statuses_mock = mocker.patch(
+            "pcluster.models.compute_fleet_status_manager.ComputeFleetStatusManager.get_statuses",
+            side_effect=lambda managers: [ComputeFleetStatus.RUNNING] * len(managers),
+        )
+        describe_instances_mock = mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=[
+                ([{"InstanceId": "i-1", "Tags": [{"Key": PCLUSTER_CLUSTER_NAME_TAG, "Value": "cluster1"}]}], "token"),
+                ([], None),
+                AWSClientError("describe_instances", "error"),
+            ],
+        )
+
+        def _head_bucket(bucket_name):
+            if bucket_name == "unavailable-bucket":
+                raise AWSClientError("head_bucket", "denied")
+
+        head_bucket_mock = mocker.patch("pcluster.aws.s3.S3Client.head_bucket", side_effect=_head_bucket)
+        mocker.patch(
+            "pcluster.aws.s3.S3Client.create_presigned_url",
+            side_effect=lambda bucket_name, object_name, version_id: f"https://{bucket_name}/{object_name}",
+        )
+        mocker.patch("pcluster.models.cluster.Cluster.get_plugin_metadata", return_value="plugin-metadata")
+        mocker.patch(
+            "pcluster.models.cluster_resources.ClusterStack.get_cluster_creation_failure",
+            return_value=("failure-code", "failure-reason"),
+        )
+
+        snapshots = Cluster.describe_snapshots(
+            clusters, include_creation_failure=lambda stack: stack.status == "ROLLBACK_COMPLETE"
+        )
+
+        assert_that([snapshot.stack.cluster_name for snapshot in snapshots]).is_equal_to(
+            ["cluster1", "cluster2", "cluster3"]
+        )
+        # Compute fleet statuses are retrieved together, only for clusters in a working status
+        assert_that(get_statuses_mock.call_args[0][0]).is_length(2)
+        assert_that([snapshot.get("compute_fleet_status") for snapshot in snapshots]).is_equal_to(
+            [ComputeFleetStatus.RUNNING, ComputeFleetStatus.RUNNING, ComputeFleetStatus.UNKNOWN]
+        )
+        # Head nodes are retrieved for multiple clusters with the same requests
+        assert_that(describe_instances_mock.call_args_list[0][0][0][0]["Values"]).is_equal_to(["cluster1", "cluster2"])
+        assert_that(describe_instances_mock.call_args_list[1][0][1]).is_equal_to("token")
+        assert_that(describe_instances_mock.call_args_list[2][0][0][0]["Values"]).is_equal_to(["cluster3"])
+        assert_that(snapshots[0].get("head_node_instance").id).is_equal_to("i-1")
+        assert_that(snapshots[1].get).raises(ClusterActionError).when_called_with("head_node_instance").contains(
+            "Unable to retrieve head node information"
+        )
+        assert_that(snapshots[2].get).raises(ClusterActionError).when_called_with("head_node_instance").contains(
+            "Failed to retrieve cluster instances"
+        )
+        # The access to each bucket is checked once
+        assert_that(head_bucket_mock.call_count).is_equal_to(2)
+        assert_that(snapshots[1].get("config_presigned_url")).is_equal_to(
+            "https://parallelcluster-bucket/parallelcluster/3.7.0/clusters/cluster2-abc/configs/cluster-config.yaml"
+        )
+        assert_that(snapshots[2].get).raises(ClusterActionError).when_called_with("config_presigned_url")
+        # Scheduler metadata are retrieved only for plugin clusters
+        assert_that([snapshot.get("plugin_metadata") for snapshot in snapshots]).is_equal_to(
+            [None, "plugin-metadata", None]
+        )
+        assert_that(snapshots[2].get("creation_failure")).is_equal_to(("failure-code", "failure-reason"))
+        assert_that(snapshots[0].errors).does_not_contain_key("creation_failure")
+
     @pytest.mark.parametrize(
         "existing_tags",
         [
@@ -191,12 +436,25 @@ class TestCluster:
         and UPDATE_COMPLETE_CLEANUP_IN_PROGRESS.
         use that to get expected call count for updated_status
         """
-        expected_call_count = len(stack_statuses)
+        expected_call_count = (
+            next(
+                index
+                for index, status in enumerate(stack_statuses)
+                if status not in {"UPDATE_IN_PROGRESS", "UPDATE_COMPLETE_CLEANUP_IN_PROGRESS"}
+            )
+            + 1
+        )
+        mock_aws_api(mocker)
         updated_status_mock = mocker.patch.object(cluster, "_get_updated_stack_status", side_effect=stack_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        get_stack_events_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.get_stack_events", return_value={"StackEvents": []}
+        )
+        mocker.patch("pcluster.models.stack_waiter.time.sleep")  # so we don't actually have to wait
 
         cluster._wait_for_stack_update()
         assert_that(updated_status_mock.call_count).is_equal_to(expected_call_count)
+        # The events of the stack are polled together with the status
+        assert_that(get_stack_events_mock.call_count).is_equal_to(expected_call_count + 1)
 
     @pytest.mark.parametrize(
         "template_body,error_message",
@@ -876,6 +1134,60 @@ Scheduling:
 
         assert_that(bucket_object_utils_dict.get("upload_config").call_count).is_equal_to(2)
 
+    @pytest.mark.parametrize(
+        "upload_resources_error, expected_error",
+        [
+            (None, None),
+            (
+                AWSClientError(function_name="upload_fileobj", message="Access denied"),
+                "Unable to upload cluster resources to the S3 bucket",
+            ),
+        ],
+    )
+    def test_create_uploads_resources_while_building_template(
+        self, mocker, cluster, upload_resources_error, expected_error
+    ):
+        mock_aws_api(mocker)
+        mock_bucket(mocker)
+        mock_bucket_utils(mocker)
+        resources_upload_started = threading.Event()
+
+        def _upload_resources(**kwargs):
+            resources_upload_started.set()
+            if upload_resources_error:
+                raise upload_resources_error
+
+        def _build_cluster_template(**kwargs):
+            # The template is built while the resources are uploaded
+            assert_that(resources_upload_started.wait(timeout=10)).is_true()
+            return {"Resources": {}}, []
+
+        bucket_object_utils_dict = mock_bucket_object_utils(mocker, upload_resources_side_effect=_upload_resources)
+        cluster.config = dummy_slurm_cluster_config(mocker)
+        mocker.patch.object(cluster.config, "get_instance_types_data", return_value={})
+        mocker.patch.object(cluster, "validate_create_request", return_value=[])
+        mocker.patch.object(cluster, "_generate_artifact_dir")
+        mocker.patch("pcluster.models.cluster.start_cdk_import")
+        mocker.patch(
+            "pcluster.models.cluster.CDKTemplateBuilder.build_cluster_template", side_effect=_build_cluster_template
+        )
+        create_stack_mock = mocker.patch(
+            "pcluster.aws.cfn.CfnClient.create_stack_from_url", return_value={"StackId": "stack-id"}
+        )
+
+        if expected_error:
+            with pytest.raises(ClusterActionError, match=expected_error):
+                cluster.create()
+            create_stack_mock.assert_not_called()
+            bucket_object_utils_dict.get("delete_s3_artifacts").assert_called_once()
+        else:
+            stack_id, _ = cluster.create()
+            assert_that(stack_id).is_equal_to("stack-id")
+            bucket_object_utils_dict.get("upload_cfn_template").assert_called_with(
+                {"Resources": {}}, "aws-parallelcluster.cfn.yaml"
+            )
+            assert_that(bucket_object_utils_dict.get("upload_resources").call_count).is_equal_to(1)
+
     @pytest.mark.parametrize(
         "changes, change_set",
         [
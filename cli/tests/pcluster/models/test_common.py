@@ -9,19 +9,23 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
+import io
 import os
 import time
+from types import SimpleNamespace
 
 import pytest
 from assertpy import assert_that
 
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, LimitExceededError
 from pcluster.models.common import (
     CloudWatchLogsExporter,
     FiltersParserError,
     LogGroupTimeFiltersParser,
     LogsExporterError,
 )
+from pcluster.utils import datetime_to_epoch
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
 
@@ -239,6 +243,7 @@ class TestCloudWatchLogsExporter:
             "log_group_name": "groupname",
             "bucket": "bucket_name",
             "output_dir": "output_dir",
+            "use_log_events_api": False,
         }
         kwargs.update(params)
         cw_logs_exporter = CloudWatchLogsExporter(**kwargs)
@@ -305,7 +310,7 @@ class TestCloudWatchLogsExporter:
         )
 
         expected_call_count = len(task_statuses)
-        mocker.patch("pcluster.models.cluster.time.sleep")  # so we don't actually have to wait
+        mocker.patch("pcluster.models.common.time.sleep")  # so we don't actually have to wait
 
         cw_logs_exporter._wait_for_task_completion("task_id")
         assert_that(wait_for_task_mock.call_count).is_equal_to(expected_call_count)
@@ -326,3 +331,331 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/stream1/000001.gz": b"stream1 second part\n",
+            f"{prefix}/stream1/000000.gz": b"stream1 first part\n",
+            f"{prefix}/stream2/000000.gz": b"stream2\n",
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[SimpleNamespace(key=key) for key in objects],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": io.BytesIO(gzip.compress(objects[key]))},
+        )
+
+        destdir = os.path.join(tmpdir, "cloudwatch-logs")
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", destdir)
+
+        assert_that(get_object_mock.call_count).is_equal_to(3)
+        # Objects of the same log stream are concatenated in key order
+        with open(os.path.join(destdir, "stream1"), "rb") as stream_file:
+            assert_that(stream_file.read()).is_equal_to(b"stream1 first part\nstream1 second part\n")
+        with open(os.path.join(destdir, "stream2"), "rb") as stream_file:
+            assert_that(stream_file.read()).is_equal_to(b"stream2\n")
+        assert_that(sorted(os.listdir(destdir))).is_equal_to(["stream1", "stream2"])
+
+    def test_download_s3_objects_with_prefix_failure(self, cw_logs_exporter, mocker, tmpdir):
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[SimpleNamespace(key=f"{prefix}/stream1/000000.gz")],
+        )
+        mocker.patch("pcluster.aws.s3.S3Client.get_object", return_value={"Body": io.BytesIO(b"not compressed")})
+
+        with pytest.raises(OSError):
+            cw_logs_exporter._download_s3_objects_with_prefix("task_id", os.path.join(tmpdir, "cloudwatch-logs"))
+
+    @pytest.mark.parametrize(
+        "export_windows, start_time, end_time, expected_windows",
+        [
+            (1, 1622592000000, 1622592003000, [(1622592000000, 1622592003000)]),
+            (
+                3,
+                1622592000000,
+                1622592003000,
+                [(1622592000000, 1622592000999), (1622592001000, 1622592001999), (1622592002000, 1622592003000)],
+            ),
+            (
+                2,
+                1622592000123,
+                1622592000456,
+                [(1622592000123, 1622592000288), (1622592000289, 1622592000456)],
+            ),
+            # Windows cannot be shorter than a millisecond
+            (5, 1622592000000, 1622592000002, [(1622592000000, 1622592000000), (1622592000001, 1622592000002)]),
+        ],
+    )
+    def test_split_time_range(self, mocker, set_env, export_windows, start_time, end_time, expected_windows):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir="output_dir",
+            bucket_prefix="prefix",
+            export_windows=export_windows,
+        )
+
+        windows = cw_logs_exporter._split_time_range(
+            datetime.datetime.fromtimestamp(start_time / 1000, tz=datetime.timezone.utc),
+            datetime.datetime.fromtimestamp(end_time / 1000, tz=datetime.timezone.utc),
+        )
+        assert_that(
+            [(datetime_to_epoch(window_start), datetime_to_epoch(window_end)) for window_start, window_end in windows]
+        ).is_equal_to(expected_windows)
+
+    def test_execute_with_export_windows(self, mocker, set_env, tmpdir):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        mocker.patch("pcluster.models.common.time.sleep")
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir=str(tmpdir),
+            bucket_prefix="prefix",
+            export_windows=3,
+        )
+        # Only one export task can be active at a time
+        create_export_task_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.create_export_task",
+            side_effect=[
+                "task0",
+                AWSClientError("create_export_task", "Resource limit exceeded.", "LimitExceededException"),
+                "task1",
+                "task2",
+            ],
+        )
+        mocker.patch("pcluster.aws.logs.LogsClient.get_export_task_status", return_value="COMPLETED")
+
+        def _download_s3_objects(task_id, destdir):
+            os.makedirs(os.path.join(destdir, "node"))
+            with open(os.path.join(destdir, "node", "stream"), "w", encoding="utf-8") as stream_file:
+                stream_file.write(f"{task_id}\n")
+
+        mocker.patch(
+            "pcluster.models.common.CloudWatchLogsExporter._download_s3_objects_with_prefix",
+            side_effect=_download_s3_objects,
+        )
+        delete_objects_mock = mocker.patch("pcluster.aws.s3_resource.S3Resource.delete_objects")
+
+        start_time = datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 2, 3, tzinfo=datetime.timezone.utc)
+        cw_logs_exporter.execute(start_time=start_time, end_time=end_time)
+
+        assert_that(create_export_task_mock.call_count).is_equal_to(4)
+        last_window_kwargs = create_export_task_mock.call_args_list[-1].kwargs
+        assert_that(datetime_to_epoch(last_window_kwargs["start_time"])).is_equal_to(
+            datetime_to_epoch(datetime.datetime(2021, 6, 2, 2, tzinfo=datetime.timezone.utc))
+        )
+        assert_that(last_window_kwargs["end_time"]).is_equal_to(end_time)
+        # Windows are appended to the log streams in chronological order
+        with open(os.path.join(tmpdir, "cloudwatch-logs", "node", "stream"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to("task0\ntask1\ntask2\n")
+        assert_that(os.listdir(tmpdir)).is_equal_to(["cloudwatch-logs"])
+        assert_that([call.kwargs["prefix"] for call in delete_objects_mock.call_args_list]).is_equal_to(
+            ["prefix/task0", "prefix/task1", "prefix/task2"]
+        )
+
+    @pytest.mark.parametrize(
+        "task_statuses, download_error, expected_error",
+        [
+            ({"task0": "FAILED"}, None, "CloudWatch logs export task task0 failed with status: FAILED"),
+            ({"task0": "COMPLETED"}, OSError("No space left on device"), "Unable to download archive logs from S3"),
+        ],
+    )
+    def test_execute_with_export_windows_failure(
+        self, mocker, set_env, tmpdir, task_statuses, download_error, expected_error
+    ):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        mocker.patch("pcluster.models.common.time.sleep")
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir=str(tmpdir),
+            bucket_prefix="prefix",
+            export_windows=3,
+        )
+        mocker.patch("pcluster.aws.logs.LogsClient.create_export_task", side_effect=["task0", "task1", "task2"])
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_export_task_status",
+            side_effect=lambda task_id: task_statuses.get(task_id, "RUNNING"),
+        )
+        mocker.patch(
+            "pcluster.models.common.CloudWatchLogsExporter._download_s3_objects_with_prefix",
+            side_effect=download_error,
+        )
+        calls = []
+
+        def _cancel_export_task(task_id):
+            calls.append(("cancel", task_id))
+            if task_id == "task2":
+                # Errors are ignored, e.g. when the task completes in the meantime
+                raise AWSClientError("cancel_export_task", "The export task is not in the expected state.")
+
+        mocker.patch("pcluster.aws.logs.LogsClient.cancel_export_task", side_effect=_cancel_export_task)
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.delete_objects",
+            side_effect=lambda bucket_name, prefix: calls.append(("delete", prefix)),
+        )
+
+        start_time = datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 2, 3, tzinfo=datetime.timezone.utc)
+        with pytest.raises(LogsExporterError, match=expected_error):
+            cw_logs_exporter.execute(start_time=start_time, end_time=end_time)
+
+        # The export tasks still running are cancelled before cleaning up the bucket
+        assert_that(calls).is_equal_to(
+            [
+                ("cancel", "task1"),
+                ("cancel", "task2"),
+                ("delete", "prefix/task0"),
+                ("delete", "prefix/task1"),
+                ("delete", "prefix/task2"),
+            ]
+        )
+
+    def test_invalid_export_windows(self, mocker, set_env):
+        mock_aws_api(mocker)
+        with pytest.raises(LogsExporterError, match="The number of export windows must be greater than 0"):
+            CloudWatchLogsExporter(
+                resource_id="clustername",
+                log_group_name="groupname",
+                bucket="bucket_name",
+                output_dir="output_dir",
+                export_windows=0,
+            )
+
+    @pytest.mark.parametrize(
+        "params, log_group, exported_hours, expected_result",
+        [
+            ({"use_log_events_api": True}, {"storedBytes": 10 * 1024**3}, None, True),
+            ({"use_log_events_api": False}, {"storedBytes": 0}, None, False),
+            ({"keep_s3_objects": True}, {"storedBytes": 0}, None, False),
+            ({"export_windows": 2}, {"storedBytes": 0}, None, False),
+            ({}, {"storedBytes": 1024}, None, True),
+            ({}, {"storedBytes": 1024**3}, None, False),
+            ({}, AWSClientError("describe_log_groups", "Log Group groupname not found"), None, False),
+            # The estimated size depends on the exported time range, with respect to the age of the log group
+            ({}, {"storedBytes": 1024**3}, 1, True),
+            ({}, {"storedBytes": 1024**3}, 24 * 500, False),
+        ],
+    )
+    def test_should_use_log_events_api(self, mocker, set_env, params, log_group, exported_hours, expected_result):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir="output_dir",
+            bucket_prefix="prefix",
+            **params,
+        )
+
+        start_time = end_time = None
+        if exported_hours:
+            # The log group has been created 1000 days ago
+            end_time = datetime.datetime.now(tz=datetime.timezone.utc)
+            start_time = end_time - datetime.timedelta(hours=exported_hours)
+            log_group["creationTime"] = datetime_to_epoch(end_time - datetime.timedelta(days=1000))
+        mocker.patch("pcluster.aws.logs.LogsClient.describe_log_group", side_effect=[log_group])
+
+        assert_that(cw_logs_exporter._should_use_log_events_api(start_time, end_time)).is_equal_to(expected_result)
+
+    def test_execute_with_log_events_api(self, mocker, set_env, tmpdir):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-east-2")
+        sleep_mock = mocker.patch("pcluster.models.common.time.sleep")
+        cw_logs_exporter = CloudWatchLogsExporter(
+            resource_id="clustername",
+            log_group_name="groupname",
+            bucket="bucket_name",
+            output_dir=str(tmpdir),
+            bucket_prefix="prefix",
+            use_log_events_api=True,
+        )
+        start_time = datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 3, tzinfo=datetime.timezone.utc)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            side_effect=[
+                {
+                    "logStreams": [
+                        {"logStreamName": "node1.stream", "firstEventTimestamp": 1622592000000},
+                        {"logStreamName": "node2.stream", "firstEventTimestamp": 1622592000000},
+                    ],
+                    "nextToken": "page2",
+                },
+                {
+                    "logStreams": [
+                        {"logStreamName": "node3.stream", "firstEventTimestamp": 1622592000000},
+                        # Streams created after the end of the time range are not retrieved
+                        {"logStreamName": "node4.stream", "firstEventTimestamp": 1622764800000},
+                    ],
+                },
+            ],
+        )
+        responses = {
+            ("node1.stream", None): [
+                LimitExceededError("get_log_events", "Rate exceeded", "ThrottlingException"),
+                {
+                    "events": [{"timestamp": 1622592000001, "message": "first"}],
+                    "nextForwardToken": "f/1",
+                },
+            ],
+            ("node1.stream", "f/1"): [
+                {"events": [{"timestamp": 1622592061234, "message": "second"}], "nextForwardToken": "f/2"}
+            ],
+            ("node1.stream", "f/2"): [{"events": [], "nextForwardToken": "f/2"}],
+            ("node2.stream", None): [{"events": [], "nextForwardToken": "f/1"}],
+            ("node2.stream", "f/1"): [{"events": [], "nextForwardToken": "f/1"}],
+            ("node3.stream", None): [
+                {"events": [{"timestamp": 1622678399999, "message": "last"}], "nextForwardToken": "f/1"}
+            ],
+            ("node3.stream", "f/1"): [{"events": [], "nextForwardToken": "f/1"}],
+        }
+
+        def _get_log_events(log_group_name, log_stream_name, **kwargs):
+            assert_that(kwargs).contains_entry(
+                {"start_time": 1622592000000}, {"end_time": 1622678400001}, {"start_from_head": True}
+            )
+            response = responses[(log_stream_name, kwargs["next_token"])].pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        get_log_events_mock = mocker.patch("pcluster.aws.logs.LogsClient.get_log_events", side_effect=_get_log_events)
+        create_export_task_mock = mocker.patch("pcluster.aws.logs.LogsClient.create_export_task")
+        delete_objects_mock = mocker.patch("pcluster.aws.s3_resource.S3Resource.delete_objects")
+
+        cw_logs_exporter.execute(start_time=start_time, end_time=end_time)
+
+        log_streams_dir = os.path.join(tmpdir, "cloudwatch-logs")
+        with open(os.path.join(log_streams_dir, "node1.stream"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to(
+                "2021-06-02T00:00:00.001Z first\n2021-06-02T00:01:01.234Z second\n"
+            )
+        with open(os.path.join(log_streams_dir, "node3.stream"), encoding="utf-8") as stream_file:
+            assert_that(stream_file.read()).is_equal_to("2021-06-02T23:59:59.999Z last\n")
+        # Files are not created for log streams without events in the time range
+        assert_that(sorted(os.listdir(log_streams_dir))).is_equal_to(["node1.stream", "node3.stream"])
+        assert_that(get_log_events_mock.call_count).is_equal_to(8)
+        sleep_mock.assert_called_once_with(0.5)
+        create_export_task_mock.assert_not_called()
+        delete_objects_mock.assert_not_called()
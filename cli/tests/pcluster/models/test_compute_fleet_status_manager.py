@@ -4,12 +4,14 @@ import os
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.models.compute_fleet_status_manager import (
     ComputeFleetStatus,
     ComputeFleetStatusManager,
     JsonComputeFleetStatusManager,
     PlainTextComputeFleetStatusManager,
 )
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
 
 class TestComputeFleetStatusManager:
@@ -195,3 +197,51 @@ class TestComputeFleetStatusManager:
     def test_get_manager(self, version, scheduler, expected_compute_fleet_status_manager_instance):
         compute_fleet_status_manager = ComputeFleetStatusManager.get_manager("cluster-name", version, scheduler)
         assert_that(compute_fleet_status_manager).is_instance_of(expected_compute_fleet_status_manager_instance)
+
+    @pytest.mark.parametrize("batch_request_fails", [False, True])
+    def test_get_statuses(self, mocker, batch_request_fails):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.compute_fleet_status_manager.BATCH_GET_ITEM_MAX_KEYS", 2)
+        managers = [
+            JsonComputeFleetStatusManager("cluster1"),
+            PlainTextComputeFleetStatusManager("cluster2"),
+            JsonComputeFleetStatusManager("cluster3"),
+        ]
+        items = {
+            "parallelcluster-cluster1": {"Id": "COMPUTE_FLEET", "Data": {"status": "RUNNING"}},
+            "parallelcluster-cluster2": {"Id": "COMPUTE_FLEET", "Status": "STOPPED"},
+            "parallelcluster-cluster3": {"Id": "COMPUTE_FLEET", "Data": {"status": "STOPPING"}},
+        }
+        batch_get_item_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.batch_get_item",
+            side_effect=(
+                AWSClientError("batch_get_item", "error")
+                if batch_request_fails
+                else lambda keys_by_table: {
+                    table: items[table] for table in keys_by_table if table != "parallelcluster-cluster3"
+                }
+            ),
+        )
+        get_item_mock = mocker.patch(
+            "pcluster.aws.dynamo.DynamoResource.get_item",
+            side_effect=lambda table_name, key: {"Item": items[table_name]},
+        )
+
+        statuses = ComputeFleetStatusManager.get_statuses(managers)
+
+        assert_that(statuses).is_equal_to(
+            [ComputeFleetStatus.RUNNING, ComputeFleetStatus.STOPPED, ComputeFleetStatus.STOPPING]
+        )
+        batch_get_item_mock.assert_has_calls(
+            [
+                mocker.call(
+                    {
+                        "parallelcluster-cluster1": {"Id": "COMPUTE_FLEET"},
+                        "parallelcluster-cluster2": {"Id": "COMPUTE_FLEET"},
+                    }
+                ),
+                mocker.call({"parallelcluster-cluster3": {"Id": "COMPUTE_FLEET"}}),
+            ]
+        )
+        # Statuses not returned by the batch requests are retrieved one by one
+        assert_that(get_item_mock.call_count).is_equal_to(3 if batch_request_fails else 1)
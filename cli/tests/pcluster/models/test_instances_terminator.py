@@ -0,0 +1,144 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSClientError, LimitExceededError
+from pcluster.models.instances_terminator import InstancesTerminator, TokenBucket
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+
+@pytest.fixture()
+def clock(mocker):
+    """Mock the clock used by the token bucket, making sleep calls advance the time."""
+    now = [1000.0]
+    mocker.patch("pcluster.models.instances_terminator.time.monotonic", side_effect=lambda: now[0])
+    sleep_mock = mocker.patch(
+        "pcluster.models.instances_terminator.time.sleep",
+        side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds),
+    )
+    return sleep_mock
+
+
+@pytest.fixture()
+def fast_terminator(mocker):
+    """Return a terminator whose requests are not delayed by rate limits or backoff."""
+    mocker.patch("pcluster.models.instances_terminator.THROTTLING_BACKOFF_BASE_SEC", 0.001)
+
+    def _fast_terminator(**kwargs):
+        return InstancesTerminator(rate_limiter=kwargs.pop("rate_limiter", TokenBucket(1000, 1000)), **kwargs)
+
+    return _fast_terminator
+
+
+def test_token_bucket(clock):
+    token_bucket = TokenBucket(rate=2, capacity=2)
+
+    # The requests within the capacity are not delayed, the following ones are delayed according to the rate
+    for _ in range(4):
+        token_bucket.acquire()
+    assert_that(sum(call.args[0] for call in clock.call_args_list)).is_close_to(1.0, 0.001)
+
+    token_bucket.on_throttled()
+    assert_that(token_bucket.rate).is_equal_to(1)
+    token_bucket.on_throttled()
+    token_bucket.on_throttled()
+    token_bucket.on_throttled()
+    assert_that(token_bucket.rate).is_equal_to(0.2)
+
+    for _ in range(20):
+        token_bucket.on_success()
+    assert_that(token_bucket.rate).is_equal_to(2)
+
+
+def test_terminate(mocker, fast_terminator):
+    mock_aws_api(mocker)
+    lock = threading.Lock()
+    attempts = {}
+
+    def _terminate_instances(instance_ids):
+        with lock:
+            attempts[instance_ids[0]] = attempts.get(instance_ids[0], 0) + 1
+            attempt = attempts[instance_ids[0]]
+        if instance_ids[0] == "i-100" and attempt < 3:
+            raise LimitExceededError("terminate_instances", "Request limit exceeded.", "RequestLimitExceeded")
+        if instance_ids[0] == "i-200":
+            raise AWSClientError("terminate_instances", "Unauthorized.", "UnauthorizedOperation")
+
+    terminate_instances_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances
+    )
+    get_instance_states_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.get_instance_states",
+        side_effect=lambda instance_ids: {
+            instance_id: "running" if instance_id == "i-42" else "shutting-down" for instance_id in instance_ids
+        },
+    )
+    instance_ids = (f"i-{index}" for index in range(250))
+
+    report = fast_terminator(max_workers=2).terminate(instance_ids)
+
+    # Throttled batches are retried, other errors are reported
+    assert_that(attempts).is_equal_to({"i-0": 1, "i-100": 3, "i-200": 1})
+    assert_that(terminate_instances_mock.call_count).is_equal_to(5)
+    assert_that(sorted(report.terminated, key=lambda instance_id: int(instance_id[2:]))).is_equal_to(
+        [f"i-{index}" for index in range(200)]
+    )
+    assert_that(report.failed).is_equal_to({f"i-{index}": "Unauthorized." for index in range(200, 250)})
+    # Terminated instances are checked to be shutting down
+    assert_that(get_instance_states_mock.call_count).is_equal_to(2)
+    assert_that(report.not_terminating).is_equal_to(["i-42"])
+
+
+def test_terminate_throttled_until_max_attempts(mocker, fast_terminator):
+    mock_aws_api(mocker)
+    mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.terminate_instances",
+        side_effect=LimitExceededError("terminate_instances", "Request limit exceeded.", "RequestLimitExceeded"),
+    )
+    get_instance_states_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.get_instance_states")
+    token_bucket = TokenBucket(rate=1000, capacity=1000)
+
+    report = fast_terminator(rate_limiter=token_bucket, max_attempts=3).terminate(["i-1", "i-2"])
+
+    assert_that(report.terminated).is_empty()
+    assert_that(report.failed).is_equal_to({"i-1": "Request limit exceeded.", "i-2": "Request limit exceeded."})
+    # The rate of the requests has been reduced after every throttled request
+    assert_that(token_bucket.rate).is_equal_to(125)
+    get_instance_states_mock.assert_not_called()
+
+
+def test_terminate_consumes_instance_ids_lazily(mocker, fast_terminator):
+    mock_aws_api(mocker)
+    lock = threading.Lock()
+    consumed = []
+    consumed_at_request = []
+
+    def _terminate_instances(instance_ids):
+        with lock:
+            consumed_at_request.append(len(consumed))
+
+    mocker.patch("pcluster.aws.ec2.Ec2Client.terminate_instances", side_effect=_terminate_instances)
+    mocker.patch("pcluster.aws.ec2.Ec2Client.get_instance_states", return_value={})
+
+    def _instance_ids():
+        for index in range(1000):
+            consumed.append(index)
+            yield f"i-{index}"
+
+    report = fast_terminator(batch_size=10, max_workers=2).terminate(_instance_ids())
+
+    assert_that(report.terminated).is_length(1000)
+    # Only the batches that are being sent or wait for a worker are read in advance
+    for request_index, consumed_instances in enumerate(consumed_at_request):
+        assert_that(consumed_instances).is_less_than_or_equal_to((request_index + 2 * 2 + 1) * 10)
@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import os
 import textwrap
 
@@ -15,6 +16,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
+from pcluster.models import s3_bucket
 from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType, format_content
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket
@@ -285,19 +287,106 @@ def test_format_content(content, s3_file_format, expected_output):
         )
     ],
 )
-def test_upload_file(mocker, content, file_name, file_type, s3_file_format, expected_object_key, expected_object_body):
+@pytest.mark.parametrize(
+    "new_artifact_directory, uploaded_object_exists, uploaded_object_updated, expected_upload",
+    [(False, False, False, True), (False, True, False, True), (False, True, True, False), (True, False, False, True)],
+)
+def test_upload_file(
+    mocker,
+    content,
+    file_name,
+    file_type,
+    s3_file_format,
+    expected_object_key,
+    expected_object_body,
+    new_artifact_directory,
+    uploaded_object_exists,
+    uploaded_object_updated,
+    expected_upload,
+):
     mock_aws_api(mocker)
     mock_bucket(mocker)
 
     bucket_name = "test-bucket"
     artifact_directory = "pcluster_artifact_directory"
     bucket = dummy_cluster_bucket(bucket_name=bucket_name, artifact_directory=artifact_directory)
-    s3_put_object_patch = mocker.patch("pcluster.aws.s3.S3Client.put_object")
+    bucket.is_new_artifact_directory = new_artifact_directory
+    expected_hash = hashlib.sha256(expected_object_body.encode("utf-8")).hexdigest()
+    head_object_patch = mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object",
+        return_value={
+            "VersionId": "version",
+            "Metadata": {"content-sha256": expected_hash if uploaded_object_updated else "outdated"},
+        },
+        side_effect=(
+            None
+            if uploaded_object_exists
+            else AWSClientError(function_name="head_object", message="Not Found", error_code="404")
+        ),
+    )
+    s3_put_object_patch = mocker.patch("pcluster.aws.s3.S3Client.put_object", return_value={"VersionId": "new"})
+
+    result = bucket.upload_file(content, file_name, file_type, s3_file_format)
+
+    if new_artifact_directory:
+        # Objects of a new artifact directory are uploaded without looking them up
+        head_object_patch.assert_not_called()
+    else:
+        head_object_patch.assert_called_once_with(
+            bucket_name=bucket_name, object_name=f"{artifact_directory}/{expected_object_key}"
+        )
+    if expected_upload:
+        assert_that(result).is_equal_to({"VersionId": "new"})
+        s3_put_object_patch.assert_called_once_with(
+            bucket_name=bucket_name,
+            body=expected_object_body,
+            key=f"{artifact_directory}/{expected_object_key}",
+            metadata={"content-sha256": expected_hash},
+        )
+    else:
+        # The object with the same content is not uploaded again
+        assert_that(result).is_equal_to({"VersionId": "version"})
+        s3_put_object_patch.assert_not_called()
 
-    bucket.upload_file(content, file_name, file_type, s3_file_format)
 
-    s3_put_object_patch.assert_called_once_with(
-        bucket_name=bucket_name,
-        body=expected_object_body,
-        key=f"{artifact_directory}/{expected_object_key}",
+def test_upload_resources(mocker, tmp_path, set_env):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    set_env("PCLUSTER_PERSISTENT_CACHE_FILE", str(tmp_path / "cache.db"))
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    resource_dir = tmp_path / "resources"
+    (resource_dir / "custom_resources_code").mkdir(parents=True)
+    (resource_dir / "custom_resources_code" / "handler.py").write_text("handler")
+    (resource_dir / "script.sh").write_text("script")
+    uploaded_objects = {}
+
+    def _head_object(bucket_name, object_name):
+        if object_name not in uploaded_objects:
+            raise AWSClientError(function_name="head_object", message="Not Found", error_code="404")
+        return {"Metadata": uploaded_objects[object_name]}
+
+    def _upload(bucket_name, key, metadata, **kwargs):
+        uploaded_objects[key] = metadata
+
+    mocker.patch("pcluster.aws.s3.S3Client.head_object", side_effect=_head_object)
+    upload_fileobj_patch = mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj", side_effect=_upload)
+    upload_file_patch = mocker.patch("pcluster.aws.s3.S3Client.upload_file", side_effect=_upload)
+    zip_dir_spy = mocker.spy(s3_bucket, "zip_dir")
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="artifacts")
+
+    for _ in range(2):
+        bucket.upload_resources(resource_dir=str(resource_dir), custom_artifacts_name="artifacts.zip")
+
+    # Unchanged resources are uploaded and zipped only once
+    assert_that(sorted(uploaded_objects)).is_equal_to(
+        ["artifacts/custom_resources/artifacts.zip", "artifacts/custom_resources/script.sh"]
     )
+    assert_that(upload_fileobj_patch.call_count).is_equal_to(1)
+    assert_that(upload_file_patch.call_count).is_equal_to(1)
+    assert_that(zip_dir_spy.call_count).is_equal_to(1)
+
+    # Changed resources are zipped and uploaded again
+    (resource_dir / "custom_resources_code" / "handler.py").write_text("new handler")
+    bucket.upload_resources(resource_dir=str(resource_dir), custom_artifacts_name="artifacts.zip")
+    assert_that(upload_fileobj_patch.call_count).is_equal_to(2)
+    assert_that(upload_file_patch.call_count).is_equal_to(1)
@@ -0,0 +1,145 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.models.stack_waiter import StackEventsCursor, StackWaiter
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+
+STACK_ID = "arn:aws:cloudformation:us-east-1:123456789012:stack/cluster/1"
+NESTED_STACK_ID = "arn:aws:cloudformation:us-east-1:123456789012:stack/cluster-QueuesStack-ABC/2"
+START_TIME = datetime(2023, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeStack:
+    """Simulate the events of a stack, returned from the newest to the oldest in pages of two events."""
+
+    def __init__(self):
+        self.events = {STACK_ID: [], NESTED_STACK_ID: []}
+        self.requests = []
+
+    def add_event(self, stack_id, logical_id, status, resource_type="AWS::EC2::Instance", physical_id=None):
+        stack_events = self.events[stack_id]
+        event = {
+            "EventId": f"{logical_id}-{status}-{len(stack_events)}",
+            "StackId": stack_id,
+            "StackName": stack_id.split("/")[1],
+            "LogicalResourceId": logical_id,
+            "PhysicalResourceId": physical_id,
+            "ResourceType": resource_type,
+            "ResourceStatus": status,
+            "Timestamp": START_TIME + timedelta(seconds=sum(len(events) for events in self.events.values())),
+        }
+        stack_events.insert(0, event)
+        return event
+
+    def get_stack_events(self, stack_name, next_token=None):
+        self.requests.append((stack_name, next_token))
+        start = int(next_token or 0)
+        end = start + 2
+        response = {"StackEvents": self.events[stack_name][start:end]}
+        if end < len(self.events[stack_name]):
+            response["NextToken"] = str(end)
+        return response
+
+
+@pytest.fixture()
+def fake_stack(mocker):
+    mock_aws_api(mocker)
+    stack = FakeStack()
+    mocker.patch("pcluster.aws.cfn.CfnClient.get_stack_events", side_effect=stack.get_stack_events)
+    return stack
+
+
+def test_stack_events_cursor(fake_stack):
+    fake_stack.add_event(STACK_ID, "cluster", "CREATE_COMPLETE", "AWS::CloudFormation::Stack", STACK_ID)
+    fake_stack.add_event(STACK_ID, "Resource", "UPDATE_IN_PROGRESS")
+    fake_stack.add_event(STACK_ID, "cluster", "UPDATE_COMPLETE", "AWS::CloudFormation::Stack", STACK_ID)
+    in_progress_event = fake_stack.add_event(
+        STACK_ID, "cluster", "UPDATE_IN_PROGRESS", "AWS::CloudFormation::Stack", STACK_ID
+    )
+    cursor = StackEventsCursor(STACK_ID)
+    cursor.skip_completed_operations()
+
+    # The events of the completed operations are skipped, the ones of the operation in progress are returned
+    assert_that(cursor.fetch()).is_equal_to([in_progress_event])
+    new_events = [fake_stack.add_event(STACK_ID, f"Resource{index}", "UPDATE_IN_PROGRESS") for index in range(3)]
+    fake_stack.requests.clear()
+    # Only the events occurred after the last retrieved one are returned, from the oldest to the newest
+    assert_that(cursor.fetch()).is_equal_to(new_events)
+    # The pages older than the last retrieved event are not requested
+    assert_that(fake_stack.requests).is_equal_to([(STACK_ID, None), (STACK_ID, "2")])
+    assert_that(cursor.fetch()).is_empty()
+
+
+def test_stack_waiter(mocker, fake_stack):
+    sleep_mock = mocker.patch("pcluster.models.stack_waiter.time.sleep")
+    fake_stack.add_event(STACK_ID, "cluster", "CREATE_COMPLETE", "AWS::CloudFormation::Stack", STACK_ID)
+
+    def _stack_changes():
+        """Change the stack between the polls, yielding the status of the stack."""
+        fake_stack.add_event(STACK_ID, "cluster", "UPDATE_IN_PROGRESS", "AWS::CloudFormation::Stack", STACK_ID)
+        fake_stack.add_event(STACK_ID, "QueuesStack", "UPDATE_IN_PROGRESS", "AWS::CloudFormation::Stack")
+        yield {"StackId": STACK_ID, "StackStatus": "UPDATE_IN_PROGRESS"}
+        fake_stack.add_event(
+            STACK_ID, "QueuesStack", "UPDATE_IN_PROGRESS", "AWS::CloudFormation::Stack", NESTED_STACK_ID
+        )
+        fake_stack.add_event(NESTED_STACK_ID, "LaunchTemplate", "UPDATE_IN_PROGRESS")
+        yield {"StackId": STACK_ID, "StackStatus": "UPDATE_IN_PROGRESS"}
+        fake_stack.add_event(NESTED_STACK_ID, "LaunchTemplate", "UPDATE_COMPLETE")
+        yield {"StackId": STACK_ID, "StackStatus": "UPDATE_IN_PROGRESS"}
+        yield {"StackId": STACK_ID, "StackStatus": "UPDATE_IN_PROGRESS"}
+        fake_stack.add_event(STACK_ID, "QueuesStack", "UPDATE_COMPLETE", "AWS::CloudFormation::Stack", NESTED_STACK_ID)
+        fake_stack.add_event(STACK_ID, "cluster", "UPDATE_COMPLETE", "AWS::CloudFormation::Stack", STACK_ID)
+        yield {"StackId": STACK_ID, "StackStatus": "UPDATE_COMPLETE"}
+
+    describe_stack_mock = mocker.patch("pcluster.aws.cfn.CfnClient.describe_stack", side_effect=_stack_changes())
+    events = []
+
+    status = StackWaiter("cluster", on_event=events.append).wait(timeout=600)
+
+    assert_that(status).is_equal_to("UPDATE_COMPLETE")
+    # The stack is described by id once its id is known, to be able to follow deleted stacks
+    assert_that([call.args[0] for call in describe_stack_mock.call_args_list]).is_equal_to(["cluster"] + [STACK_ID] * 4)
+    # The events of the stack and of the nested stack are streamed, except the ones of the previous operations
+    assert_that(
+        [(event["StackName"], event["LogicalResourceId"], event["ResourceStatus"]) for event in events]
+    ).is_equal_to(
+        [
+            ("cluster", "cluster", "UPDATE_IN_PROGRESS"),
+            ("cluster", "QueuesStack", "UPDATE_IN_PROGRESS"),
+            ("cluster", "QueuesStack", "UPDATE_IN_PROGRESS"),
+            ("cluster-QueuesStack-ABC", "LaunchTemplate", "UPDATE_IN_PROGRESS"),
+            ("cluster-QueuesStack-ABC", "LaunchTemplate", "UPDATE_COMPLETE"),
+            ("cluster", "QueuesStack", "UPDATE_COMPLETE"),
+            ("cluster", "cluster", "UPDATE_COMPLETE"),
+        ]
+    )
+    # The polling interval grows when there are no new events and is reset when new events are returned
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([2, 2, 2, 3])
+
+
+def test_stack_waiter_timeout(mocker, fake_stack):
+    now = [0]
+    mocker.patch("pcluster.models.stack_waiter.time.monotonic", side_effect=lambda: now[0])
+    sleep_mock = mocker.patch(
+        "pcluster.models.stack_waiter.time.sleep", side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds)
+    )
+    mocker.patch(
+        "pcluster.aws.cfn.CfnClient.describe_stack",
+        return_value={"StackId": STACK_ID, "StackStatus": "CREATE_IN_PROGRESS"},
+    )
+
+    with pytest.raises(TimeoutError, match="Timeout expired while waiting for stack cluster"):
+        StackWaiter("cluster").wait(timeout=30)
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to([3, 4.5, 6.75, 10.125, 5.625])
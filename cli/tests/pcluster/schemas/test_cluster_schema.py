@@ -13,6 +13,7 @@ import json
 from io import BytesIO
 from urllib.error import HTTPError
 
+import boto3
 import pytest
 import yaml
 from assertpy import assert_that
@@ -1142,7 +1143,7 @@ def test_scheduler_plugin_settings_schema(
                 "pcluster.schemas.cluster_schema.urlopen", side_effect=https_error
             ).return_value.__enter__.return_value = file_mock
     if yaml_load_error:
-        mocker.patch("pcluster.utils.yaml.safe_load", side_effect=yaml_load_error)
+        mocker.patch("pcluster.utils.yaml.load", side_effect=yaml_load_error)
     if scheduler_definition:
         scheduler_plugin_settings_schema["SchedulerDefinition"] = scheduler_definition
     if grant_sudo_privileges:
@@ -1435,3 +1436,64 @@ def test_queue_tag_schema(mocker, config_dict, failure_message):
     else:
         conf = QueueTagSchema().load(config_dict)
         QueueTagSchema().dump(conf)
+
+
+def _build_cluster_config_dict(num_queues, num_compute_resources, num_instance_types):
+    compute_resources = []
+    for cr_index in range(num_compute_resources):
+        compute_resource = {"Name": f"compute-resource-{cr_index}", "MaxCount": 10}
+        if num_instance_types > 1:
+            compute_resource["Instances"] = [
+                {"InstanceType": f"c5.{index}xlarge"} for index in range(num_instance_types)
+            ]
+        else:
+            compute_resource["InstanceType"] = "c5.xlarge"
+        compute_resources.append(compute_resource)
+    return {
+        "Image": {"Os": "alinux2"},
+        "HeadNode": {
+            "InstanceType": "t2.micro",
+            "Networking": {"SubnetId": "subnet-12345678"},
+            "Ssh": {"KeyName": "ec2-key-name"},
+        },
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue-{queue_index}",
+                    "Networking": {"SubnetIds": ["subnet-12345678"]},
+                    "ComputeResources": compute_resources,
+                }
+                for queue_index in range(num_queues)
+            ],
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    "num_queues, num_compute_resources, num_instance_types",
+    [
+        (1, 1, 1),
+        (10, 5, 1),
+        (50, 1, 1),
+        (1, 50, 1),
+        (5, 10, 20),
+        # Beyond the limits enforced by the validators, to cover the cost of loading the largest inputs
+        (50, 50, 1),
+    ],
+)
+def test_cluster_schema_load_size(mocker, set_env, num_queues, num_compute_resources, num_instance_types):
+    mock_aws_api(mocker)
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    session_spy = mocker.spy(boto3.session, "Session")
+    config_dict = _build_cluster_config_dict(num_queues, num_compute_resources, num_instance_types)
+
+    cluster_config = ClusterSchema(cluster_name="clustername").load(config_dict)
+
+    queues = cluster_config.scheduling.queues
+    assert_that(queues).is_length(num_queues)
+    for queue in queues:
+        assert_that(queue.compute_resources).is_length(num_compute_resources)
+        assert_that(queue.compute_resources[0].instance_types).is_length(num_instance_types)
+    # The region is resolved from the environment, without creating a boto3 session for every resource
+    assert_that(session_spy.call_count).is_equal_to(0)
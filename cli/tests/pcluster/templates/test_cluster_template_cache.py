@@ -0,0 +1,84 @@
+# Copyright 2023 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from assertpy import assert_that
+from freezegun import freeze_time
+
+from pcluster.templates.cdk_builder import CDKTemplateBuilder
+from tests.pcluster.aws.dummy_aws_api import mock_aws_api
+from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_object_utils
+from tests.pcluster.utils import load_cluster_model_from_yaml
+
+
+@pytest.fixture()
+def build_template(mocker):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    upload_asset_mock = mock_bucket_object_utils(mocker).get("upload_cfn_asset")
+    _, cluster_config = load_cluster_model_from_yaml("slurm.required.yaml")
+
+    def _build_template(config_version, log_group_name=None):
+        upload_asset_mock.reset_mock()
+        cluster_config.config_version = f"{config_version}-config"
+        cluster_config.original_config_version = f"{config_version}-original-config"
+        template, assets_metadata = CDKTemplateBuilder().build_cluster_template(
+            cluster_config=cluster_config,
+            bucket=dummy_cluster_bucket(),
+            stack_name="clustername",
+            log_group_name=log_group_name,
+        )
+        uploaded_assets = [call.kwargs["asset_file_content"] for call in upload_asset_mock.call_args_list]
+        return template, assets_metadata, uploaded_assets
+
+    return _build_template
+
+
+@freeze_time("2021-01-01T01:01:01")
+def test_build_cluster_template_with_cache(mocker, tmp_path, set_env, build_template):
+    expected_results = {version: build_template(version) for version in ["v1", "v2"]}
+
+    set_env("PCLUSTER_PERSISTENT_CACHE_FILE", str(tmp_path / "cache.db"))
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    synthesize_spy = mocker.spy(CDKTemplateBuilder, "_synthesize_cluster_template")
+    for version in ["v1", "v2"]:
+        template, assets_metadata, uploaded_assets = build_template(version)
+        # The cached template is rendered with the values of the current invocation
+        assert_that(template).is_equal_to(expected_results[version][0])
+        assert_that(assets_metadata).is_equal_to(expected_results[version][1])
+        assert_that(uploaded_assets).is_equal_to(expected_results[version][2]).is_not_empty()
+    # The template is synthesized only once for the same configuration
+    assert_that(synthesize_spy.call_count).is_equal_to(1)
+
+
+@pytest.mark.parametrize("log_group_name", [None, "/aws/parallelcluster/clustername-202101010101"])
+def test_build_cluster_template_with_cache_across_invocations(
+    mocker, tmp_path, set_env, build_template, log_group_name
+):
+    """Verify that creations and updates run at different times reuse the template of the same configuration."""
+    invocation_times = ["2021-01-01T01:01:01", "2021-01-01T02:02:02"]
+    expected_results = {}
+    for invocation_time in invocation_times:
+        with freeze_time(invocation_time):
+            expected_results[invocation_time] = build_template("v1", log_group_name)
+    if not log_group_name:
+        # The name of the log group of a new cluster contains its creation time, also in the nested templates
+        assert_that(expected_results[invocation_times[0]][1]).is_not_equal_to(expected_results[invocation_times[1]][1])
+
+    set_env("PCLUSTER_PERSISTENT_CACHE_FILE", str(tmp_path / "cache.db"))
+    set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+    synthesize_spy = mocker.spy(CDKTemplateBuilder, "_synthesize_cluster_template")
+    for invocation_time in invocation_times:
+        with freeze_time(invocation_time):
+            template, assets_metadata, uploaded_assets = build_template("v1", log_group_name)
+        assert_that(template).is_equal_to(expected_results[invocation_time][0])
+        assert_that(assets_metadata).is_equal_to(expected_results[invocation_time][1])
+        assert_that(uploaded_assets).is_equal_to(expected_results[invocation_time][2])
+    assert_that(synthesize_spy.call_count).is_equal_to(1)
@@ -13,7 +13,9 @@ import asyncio
 import os
 import time
 import unittest
+import zipfile
 from collections import namedtuple
+from io import BytesIO
 
 import pytest
 from assertpy import assert_that
@@ -399,11 +401,43 @@ def test_yaml_load(yaml_string, expected_yaml_dict, expected_error):
         assert_that(yaml_dict).is_equal_to(expected_yaml_dict)
 
 
+def test_yaml_load_cache(mocker, tmp_path):
+    yaml_load_spy = mocker.spy(pcluster.utils.yaml, "load")
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("PropA:\n  PropB: [ValueB1, ValueB2]\n", encoding="utf-8")
+
+    first_dict = yaml_load(yaml_file.read_text(encoding="utf-8"))
+    first_dict["PropA"]["PropB"].append("ValueB3")
+    with open(yaml_file, encoding="utf-8") as yaml_stream:
+        second_dict = yaml_load(yaml_stream)
+
+    # Identical documents are parsed only once, and every call returns an independent copy
+    assert_that(second_dict).is_equal_to({"PropA": {"PropB": ["ValueB1", "ValueB2"]}})
+    assert_that(yaml_load_spy.call_count).is_equal_to(1)
+    assert_that(yaml_load("PropA: ValueA")).is_equal_to({"PropA": "ValueA"})
+    assert_that(yaml_load_spy.call_count).is_equal_to(2)
+
+
 @pytest.mark.parametrize("imds_support, http_tokens", [("v1.0", "optional"), ("v2.0", "required")])
 def test_get_http_token_settings(imds_support, http_tokens):
     assert_that(utils.get_http_tokens_setting(imds_support)).is_equal_to(http_tokens)
 
 
+def test_zip_dir_is_deterministic(tmp_path):
+    for file_path, content in [("b/file2", "content2"), ("a/file1", "content1"), ("file0", "content0")]:
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text(content)
+    first_archive = utils.zip_dir(str(tmp_path)).getvalue()
+
+    # The archive does not depend on the modification time of the files
+    os.utime(tmp_path / "a" / "file1", (0, 0))
+    second_archive = utils.zip_dir(str(tmp_path)).getvalue()
+
+    assert_that(second_archive).is_equal_to(first_archive)
+    with zipfile.ZipFile(BytesIO(second_archive)) as archive:
+        assert_that(archive.namelist()).is_equal_to(["file0", "a/file1", "b/file2"])
+
+
 @pytest.mark.parametrize(
     "original, response",
     [({"test1": None, "test2": 2}, {"test2": 2}), ({"test1": 1, "test2": 2}, {"test1": 1, "test2": 2})],
@@ -428,6 +462,32 @@ def test_split_resource_prefix(resource_prefix, expected_output):
     assert_that(iam_role_prefix).is_equal_to(expected_output[1])
 
 
+@pytest.mark.parametrize(
+    "results, timeout, expected_sleeps, expected_result",
+    [
+        (["RUNNING"], 60, [], "RUNNING"),
+        (["STARTING"] * 6 + ["RUNNING"], 60, [1, 2, 4, 8, 15, 15], "RUNNING"),
+        (["STARTING"] * 10, 20, [1, 2, 4, 8, 5], TimeoutError),
+    ],
+)
+def test_poll_with_backoff(mocker, results, timeout, expected_sleeps, expected_result):
+    now = [0]
+    mocker.patch("pcluster.utils.time.monotonic", side_effect=lambda: now[0])
+    sleep_mock = mocker.patch(
+        "pcluster.utils.time.sleep", side_effect=lambda seconds: now.__setitem__(0, now[0] + seconds)
+    )
+    func = mocker.MagicMock(side_effect=results)
+
+    if expected_result is TimeoutError:
+        with pytest.raises(TimeoutError, match=f"Timeout expired after {timeout} seconds"):
+            utils.poll_with_backoff(func, until=lambda status: status == "RUNNING", timeout=timeout)
+    else:
+        result = utils.poll_with_backoff(func, until=lambda status: status == "RUNNING", timeout=timeout)
+        assert_that(result).is_equal_to(expected_result)
+    # The interval between the polls grows exponentially up to the maximum interval, without exceeding the timeout
+    assert_that([call.args[0] for call in sleep_mock.call_args_list]).is_equal_to(expected_sleeps)
+
+
 Item = namedtuple("Item", "property")
 
 
@@ -67,6 +67,7 @@ from pcluster.validators.cluster_validators import (
     RootVolumeSizeValidator,
     SchedulableMemoryValidator,
     SchedulerOsValidator,
+    SecurityGroupsReachability,
     SharedStorageMountDirValidator,
     SharedStorageNameValidator,
     UnmanagedFsxMultiAzValidator,
@@ -1158,7 +1159,7 @@ def test_fsx_network_validator(
         # Testing for FSx File Cache
         actual_failures = ExistingFsxNetworkingValidator().execute(
             subnet_ids=["subnet-12345678"],
-            security_groups_by_nodes=nodes_security_groups,
+            security_groups_reachability=SecurityGroupsReachability(nodes_security_groups),
             file_storage_ids=["fs-0ff8da96d57f3b4e3", "fc-0ff8da96d57f3b4e3"],
         )
     else:
@@ -1166,7 +1167,7 @@ def test_fsx_network_validator(
         actual_failures = ExistingFsxNetworkingValidator().execute(
             file_storage_ids=["fs-0ff8da96d57f3b4e3"],
             subnet_ids=["subnet-12345678"],
-            security_groups_by_nodes=nodes_security_groups,
+            security_groups_reachability=SecurityGroupsReachability(nodes_security_groups),
         )
 
     assert_failure_messages(actual_failures, expected_message)
@@ -1996,7 +1997,9 @@ def test_efs_id_validator(
     mocker.patch("pcluster.aws.ec2.Ec2Client.get_subnet_cidr", return_value=cluster_subnet_cidr)
     mocker.patch("pcluster.aws.ec2.Ec2Client.describe_security_groups", return_value=security_groups)
 
-    actual_failures = EfsIdValidator().execute(efs_id, avail_zones_mapping, nodes_security_groups)
+    actual_failures = EfsIdValidator().execute(
+        efs_id, avail_zones_mapping, SecurityGroupsReachability(nodes_security_groups)
+    )
     assert_failure_messages(actual_failures, expected_message)
     assert_failure_level(actual_failures, failure_level)
 
@@ -2706,6 +2709,12 @@ def test_multi_az_root_volume_validator(
         (["10.1.0.0/16", "192.1.2.0/24"], ["10.1.0.0/16", "192.1.2.0/24"], True),  # Exact coverage
         (["10.1.0.0/17", "10.1.128.0/17"], ["10.1.0.0/16"], True),  # Combination coverage
         (["10.1.0.0/17"], ["10.1.0.0/16"], False),  # Uncovered
+        (["10.1.0.0/18", "10.1.64.0/18", "10.1.128.0/17"], ["10.1.0.0/16"], True),  # Adjacent ranges coverage
+        (["10.1.0.0/17", "10.1.0.0/18", "10.1.128.0/18"], ["10.1.0.0/16"], False),  # Overlapping ranges, uncovered
+        (["10.1.64.0/18", "10.1.128.0/17"], ["10.1.0.0/16"], False),  # Uncovered beginning
+        (["10.0.0.0/8"], ["10.1.0.0/16", "192.1.2.0/24"], False),  # One subnet uncovered
+        (["10.1.0.0/16"], ["2600:1f18::/64"], False),  # IPv6 subnet not covered by IPv4 ranges
+        ([], ["10.1.0.0/16"], False),  # No ranges
     ],
 )
 def test_are_subnets_covered_by_cidrs(mocker, ip_ranges, subnet_cidrs, covered):
@@ -3117,3 +3126,30 @@ def test_multi_network_interfaces_instances_validator(
         assert_failure_level(actual_failures, FailureLevel.ERROR)
     else:
         assert_that(actual_failures).is_empty()
+
+
+def test_security_groups_reachability(mocker):
+    mock_aws_api(mocker)
+    security_group = {
+        "GroupId": "sg-12345678",
+        "IpPermissions": [
+            {"FromPort": 2049, "ToPort": 2049, "IpProtocol": "tcp", "IpRanges": [{"CidrIp": "10.0.0.0/17"}]},
+            {"FromPort": 2049, "ToPort": 2049, "IpProtocol": "tcp", "IpRanges": [{"CidrIp": "10.0.128.0/17"}]},
+            {"FromPort": 988, "ToPort": 988, "IpProtocol": "tcp", "UserIdGroupPairs": [{"GroupId": "sg-node"}]},
+        ],
+        "IpPermissionsEgress": [{"IpProtocol": "-1", "IpRanges": [{"CidrIp": "0.0.0.0/0"}]}],
+    }
+    describe_security_groups_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.describe_security_groups", return_value=[security_group]
+    )
+    reachability = SecurityGroupsReachability({frozenset({"sg-node"}), frozenset({"sg-node", "sg-other"})})
+
+    for _ in range(2):
+        # The union of the ip ranges covers the subnet
+        assert_that(reachability.is_access_allowed(["sg-12345678"], ["10.0.0.0/16"], port=2049)).is_true()
+        assert_that(reachability.is_access_allowed(["sg-12345678"], ["10.1.0.0/16"], port=2049)).is_false()
+        # All the nodes have a security group allowed by the rule
+        assert_that(reachability.is_access_allowed(["sg-12345678"], ["10.1.0.0/16"], port=988)).is_true()
+        assert_that(reachability.is_access_allowed(["sg-12345678"], ["10.0.0.0/16"], port=22)).is_false()
+    # Every combination is evaluated only once
+    assert_that(describe_security_groups_mock.call_count).is_equal_to(4)